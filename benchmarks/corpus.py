@@ -0,0 +1,98 @@
+"""Synthetic corpus generator for hunspellcheck benchmarks."""
+
+import random
+import string
+
+from hunspellcheck.hunspell.dictionaries import find_dictionary_filepath
+
+
+def read_dictionary_words(language, limit=50000):
+    """Read the bare words of a hunspell dictionary, without their flags.
+
+    Args:
+        language (str): Dictionary language or filepath.
+        limit (int): Maximum number of words read.
+
+    Returns:
+        list: Words that only contain letters.
+    """
+    dictionary_filepath = find_dictionary_filepath(language)
+    if dictionary_filepath is None:
+        raise ValueError(f"Dictionary '{language}' not found")
+
+    words = []
+    with open(f"{dictionary_filepath}.dic", errors="ignore") as f:
+        next(f, None)  # approximate number of words
+        for line in f:
+            word = line.split("/", 1)[0].strip()
+            if word.isalpha() and word.islower():
+                words.append(word)
+                if len(words) >= limit:
+                    break
+    return words
+
+
+def misspell(word, rng):
+    """Introduce a typo in a word.
+
+    Args:
+        word (str): Word to misspell.
+        rng (random.Random): Random numbers generator.
+
+    Returns:
+        str: Misspelled word.
+    """
+    index = rng.randrange(len(word))
+    operation = rng.choice(("insert", "replace", "swap"))
+    if operation == "swap" and len(word) > 1:
+        index = min(index, len(word) - 2)
+        return f"{word[:index]}{word[index + 1]}{word[index]}{word[index + 2:]}"
+    letter = rng.choice(string.ascii_lowercase)
+    if operation == "replace":
+        return f"{word[:index]}{letter}{word[index + 1:]}"
+    return f"{word[:index]}{letter}{word[index:]}"
+
+
+def generate_corpus(
+    language="en_US",
+    n_files=10,
+    file_size=10000,
+    error_rate=0.02,
+    words_per_line=12,
+    seed=0,
+):
+    """Generate files made of words taken from a dictionary, some of them
+    misspelled.
+
+    The corpus only depends on the arguments and the dictionary, so the same
+    corpus can be generated to compare different revisions.
+
+    Args:
+        language (str): Dictionary language from which words are taken.
+        n_files (int): Number of files generated.
+        file_size (int): Approximate size of each file in characters.
+        error_rate (float): Fraction of misspelled words.
+        words_per_line (int): Number of words of each line.
+        seed (int): Seed of the random numbers generator.
+
+    Returns:
+        dict: Mapping of filenames to their contents.
+    """
+    rng = random.Random(seed)
+    words = read_dictionary_words(language)
+
+    filenames_contents = {}
+    for file_index in range(n_files):
+        lines, size = [], 0
+        while size < file_size:
+            line_words = []
+            for _ in range(words_per_line):
+                word = rng.choice(words)
+                if rng.random() < error_rate:
+                    word = misspell(word, rng)
+                line_words.append(word)
+            line = " ".join(line_words)
+            lines.append(line)
+            size += len(line) + 1
+        filenames_contents[f"file{file_index}.txt"] = "\n".join(lines)
+    return filenames_contents
@@ -0,0 +1,309 @@
+"""Benchmarks of the hunspellcheck check pipeline.
+
+Usage::
+
+    python -m benchmarks.run --language en_US --output results.json
+    python -m benchmarks.run --language en_US --compare results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import generate_corpus
+from hunspellcheck.hunspell.emulator import write_hunspell_emulator_executable
+from hunspellcheck.hunspell.spellcheck import hunspell_spellcheck
+from hunspellcheck.hunspell.version import get_hunspell_version
+from hunspellcheck.spellchecker import (
+    DEFAULT_LOOKS_LIKE_A_WORD,
+    HunspellChecker,
+    parse_hunspell_output,
+    quote_for_hunspell,
+)
+
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+
+def peak_rss():
+    """Get the peak resident set size of this process and its children.
+
+    Returns:
+        dict: Peak RSS in KiB of the process (``self``) and of the biggest
+        finished child process (``children``), like hunspell. ``None`` if it
+        can't be measured in this platform.
+    """
+    if resource is None:  # pragma: no cover
+        return None
+    # ru_maxrss is measured in bytes in macOS and in KiB in other systems
+    divisor = 1024 if sys.platform == "darwin" else 1
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // divisor,
+        "children": (resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // divisor),
+    }
+
+
+def timeit(function, repeat):
+    """Execute a function multiple times measuring its duration.
+
+    Args:
+        function (types.FunctionType): Function called without arguments.
+        repeat (int): Number of executions.
+
+    Returns:
+        dict: Minimum, median and maximum durations in seconds.
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return {
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "max": max(durations),
+    }
+
+
+def time_to_first_error(filenames_contents, language, repeat, **kwargs):
+    """Measure how long the spellchecker takes to yield its first error.
+
+    Args:
+        filenames_contents (dict): Files to check.
+        language (str): Dictionary language.
+        repeat (int): Number of executions.
+        **kwargs: Optional arguments of the spellchecker.
+
+    Returns:
+        dict: Minimum, median and maximum durations in seconds.
+    """
+
+    def first_error():
+        errors = HunspellChecker(filenames_contents, language, **kwargs).check()
+        next(errors, None)
+        errors.close()
+
+    return timeit(first_error, repeat)
+
+
+def import_time(repeat):
+    """Measure the time taken by ``import hunspellcheck`` in a new interpreter,
+    discounting the interpreter startup.
+
+    Args:
+        repeat (int): Number of executions.
+
+    Returns:
+        dict: Minimum, median and maximum durations in seconds.
+    """
+
+    def run(code):
+        return lambda: subprocess.run([sys.executable, "-c", code], check=True)
+
+    startup = timeit(run("pass"), repeat)
+    with_import = timeit(run("import hunspellcheck"), repeat)
+    return {key: max(with_import[key] - startup[key], 0) for key in startup}
+
+
+def run_benchmarks(
+    language="en_US",
+    n_files=10,
+    file_size=10000,
+    error_rate=0.02,
+    repeat=5,
+    seed=0,
+):
+    """Run all the benchmarks.
+
+    Args:
+        language (str): Dictionary language.
+        n_files (int): Number of files of the corpus.
+        file_size (int): Approximate size of each file in characters.
+        error_rate (float): Fraction of misspelled words in the corpus.
+        repeat (int): Number of executions of each benchmark.
+        seed (int): Seed used to generate the corpus.
+
+    Returns:
+        dict: Results, serializable as JSON.
+    """
+    filenames_contents = generate_corpus(
+        language=language,
+        n_files=n_files,
+        file_size=file_size,
+        error_rate=error_rate,
+        seed=seed,
+    )
+    words = [
+        word for content in filenames_contents.values() for word in content.split()
+    ]
+    content = "\n".join(filenames_contents.values())
+    quoted_content = quote_for_hunspell(content)
+    hunspell_output = hunspell_spellcheck(quoted_content, language)
+
+    benchmarks = {
+        "import": import_time(repeat),
+        "quote_for_hunspell": timeit(lambda: quote_for_hunspell(content), repeat),
+        "hunspell_spellcheck": timeit(
+            lambda: hunspell_spellcheck(quoted_content, language),
+            repeat,
+        ),
+        "parse_hunspell_output": timeit(
+            lambda: list(parse_hunspell_output(filenames_contents, hunspell_output)),
+            repeat,
+        ),
+        "looks_like_a_word": timeit(
+            lambda: [DEFAULT_LOOKS_LIKE_A_WORD(word) for word in words],
+            repeat,
+        ),
+        "check": timeit(
+            lambda: list(
+                HunspellChecker(
+                    filenames_contents,
+                    language,
+                    backend="subprocess",
+                ).check()
+            ),
+            repeat,
+        ),
+        "check_deduplicate": timeit(
+            lambda: list(
+                HunspellChecker(
+                    filenames_contents,
+                    language,
+                    backend="subprocess",
+                    deduplicate=True,
+                ).check()
+            ),
+            repeat,
+        ),
+        "time_to_first_error": time_to_first_error(
+            filenames_contents,
+            language,
+            repeat,
+            backend="subprocess",
+        ),
+    }
+    for name, result in benchmarks.items():
+        if name not in ("import", "time_to_first_error"):
+            result["words_per_second"] = len(words) / result["median"]
+
+    return {
+        "parameters": {
+            "language": language,
+            "n_files": n_files,
+            "file_size": file_size,
+            "error_rate": error_rate,
+            "repeat": repeat,
+            "seed": seed,
+            "words": len(words),
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "hunspell": get_hunspell_version()["hunspell"],
+        },
+        "benchmarks": benchmarks,
+        "peak_rss_kib": peak_rss(),
+    }
+
+
+def render_results(results, baseline=None):
+    """Render the results of the benchmarks as a table.
+
+    Args:
+        results (dict): Results returned by :py:func:`run_benchmarks`.
+        baseline (dict): Results of other revision to compare with.
+
+    Returns:
+        str: Table with the median duration of each benchmark and, if a
+        baseline is passed, the ratio between both durations.
+    """
+    lines = []
+    for name, result in results["benchmarks"].items():
+        line = f"{name:<24}{result['median'] * 1000:>12.3f} ms"
+        if "words_per_second" in result:
+            line += f"{result['words_per_second']:>16.0f} words/s"
+        else:
+            line += " " * 24
+        if baseline is not None and name in baseline["benchmarks"]:
+            baseline_median = baseline["benchmarks"][name]["median"]
+            if baseline_median:
+                line += f"{result['median'] / baseline_median:>10.2f}x"
+        lines.append(line)
+    if results["peak_rss_kib"] is not None:
+        lines.append(
+            f"{'peak RSS':<24}{results['peak_rss_kib']['self']:>12} KiB"
+            f" (hunspell {results['peak_rss_kib']['children']} KiB)"
+        )
+    return "\n".join(lines)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-l", "--language", default="en_US")
+    parser.add_argument("--files", type=int, default=10, dest="n_files")
+    parser.add_argument("--file-size", type=int, default=10000)
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="Save the results in a JSON file.")
+    parser.add_argument(
+        "--compare",
+        help="JSON file with the results of other revision to compare with.",
+    )
+    parser.add_argument(
+        "--emulator",
+        action="store_true",
+        help=(
+            "Call the hunspell emulator instead of hunspell, measuring the"
+            " Python side of the pipeline without the noise of hunspell."
+        ),
+    )
+    opts = parser.parse_args(args)
+
+    original_path = os.environ.get("PATH")
+    with tempfile.TemporaryDirectory() as bin_directory:
+        if opts.emulator:
+            write_hunspell_emulator_executable(bin_directory)
+            os.environ["PATH"] = os.pathsep.join(
+                [bin_directory, original_path or os.defpath]
+            )
+        try:
+            results = run_benchmarks(
+                language=opts.language,
+                n_files=opts.n_files,
+                file_size=opts.file_size,
+                error_rate=opts.error_rate,
+                repeat=opts.repeat,
+                seed=opts.seed,
+            )
+        finally:
+            if original_path is None:
+                os.environ.pop("PATH", None)
+            else:
+                os.environ["PATH"] = original_path
+    results["parameters"]["emulator"] = opts.emulator
+
+    baseline = None
+    if opts.compare:
+        with open(opts.compare) as f:
+            baseline = json.load(f)
+    sys.stdout.write(f"{render_results(results, baseline=baseline)}\n")
+
+    if opts.output:
+        with open(opts.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
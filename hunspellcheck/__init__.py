@@ -1,30 +1,27 @@
-"""Hunspellcheck package."""
-
-from hunspellcheck.cli import hunspellchecker_argument_parser
-from hunspellcheck.exceptions import InvalidLanguageDictionaryError
-from hunspellcheck.hunspell.dictionaries import (
-    assert_is_valid_dictionary_language_or_filename,
-    gen_available_dictionaries,
-    gen_available_dictionaries_with_langcodes,
-    is_valid_dictionary_language,
-    is_valid_dictionary_language_or_filename,
-    list_available_dictionaries,
-    print_available_dictionaries,
-)
-from hunspellcheck.hunspell.version import get_hunspell_version
-from hunspellcheck.spellchecker import HunspellChecker, render_hunspell_word_error
-from hunspellcheck.word import looks_like_a_word_creator
+"""Hunspellcheck package.
+
+The public objects are imported lazily when they are accessed for the first
+time, so importing the package doesn't load the command line utilities or
+their dependencies unless they are used.
+"""
+
+import importlib
 
 
 __version__ = "0.1.0"
 __title__ = "hunspellcheck"
 __all__ = (
+    "AsyncHunspellChecker",
+    "HunspellBackend",
     "HunspellChecker",
+    "HunspellErrorColumns",
+    "HunspellWordError",
     "InvalidLanguageDictionaryError",
     "hunspellchecker_argument_parser",
     "gen_available_dictionaries",
     "gen_available_dictionaries_with_langcodes",
     "get_hunspell_version",
+    "invalidate_dictionaries_cache",
     "is_valid_dictionary_language",
     "is_valid_dictionary_language_or_filename",
     "assert_is_valid_dictionary_language_or_filename",
@@ -32,4 +29,47 @@ __all__ = (
     "looks_like_a_word_creator",
     "print_available_dictionaries",
     "render_hunspell_word_error",
+    "ResultsCache",
+    "WordsCache",
 )
+
+_LAZY_ATTRIBUTES_MODULES = {
+    "AsyncHunspellChecker": "hunspellcheck.aio",
+    "HunspellBackend": "hunspellcheck.backends",
+    "HunspellChecker": "hunspellcheck.spellchecker",
+    "HunspellErrorColumns": "hunspellcheck.error",
+    "HunspellWordError": "hunspellcheck.error",
+    "InvalidLanguageDictionaryError": "hunspellcheck.exceptions",
+    "hunspellchecker_argument_parser": "hunspellcheck.cli",
+    "gen_available_dictionaries": "hunspellcheck.hunspell.dictionaries",
+    "gen_available_dictionaries_with_langcodes": (
+        "hunspellcheck.hunspell.dictionaries"
+    ),
+    "get_hunspell_version": "hunspellcheck.hunspell.version",
+    "invalidate_dictionaries_cache": "hunspellcheck.hunspell.dictionaries",
+    "is_valid_dictionary_language": "hunspellcheck.hunspell.dictionaries",
+    "is_valid_dictionary_language_or_filename": ("hunspellcheck.hunspell.dictionaries"),
+    "assert_is_valid_dictionary_language_or_filename": (
+        "hunspellcheck.hunspell.dictionaries"
+    ),
+    "list_available_dictionaries": "hunspellcheck.hunspell.dictionaries",
+    "looks_like_a_word_creator": "hunspellcheck.word",
+    "print_available_dictionaries": "hunspellcheck.hunspell.dictionaries",
+    "render_hunspell_word_error": "hunspellcheck.spellchecker",
+    "ResultsCache": "hunspellcheck.cache",
+    "WordsCache": "hunspellcheck.cache",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRIBUTES_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
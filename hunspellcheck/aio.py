@@ -0,0 +1,262 @@
+"""Asynchronous spellchecking interface of hunspellcheck.
+
+Hunspell is driven through :py:mod:`asyncio` pipes, so checking contents
+never blocks the event loop.
+"""
+
+import asyncio
+import collections
+import functools
+import locale
+import subprocess
+
+from hunspellcheck.error import HunspellFileContent, included_error_record_class
+from hunspellcheck.hunspell.spellcheck import build_hunspell_command
+from hunspellcheck.spellchecker import (
+    DEFAULT_LOOKS_LIKE_A_WORD,
+    parse_hunspell_mispelling,
+)
+
+
+# maximum length of the lines read from hunspell
+HUNSPELL_OUTPUT_LINE_LIMIT = 2**20
+
+
+class AsyncHunspellChecker:
+    """Asynchronous counterpart of :py:class:`hunspellcheck.HunspellChecker`.
+
+    Args:
+        filenames_contents (dict): Dictionary mapping filenames to content of
+            those files.
+        languages (list, str): Languages against will be checked the contents.
+        personal_dicts (str, list): Globs of files which would be dictionaries
+            with custom words to ignore from being triggered as positives.
+        looks_like_a_word (types.FunctionType): Function to filter the positive
+            words from being considered positives.
+        encoding (str): Input encoding. If not defined, it will be autodetected
+            by hunspell.
+        semaphore (asyncio.Semaphore): Semaphore acquired while each check
+            is running. Sharing the same semaphore between multiple
+            spellcheckers limits the number of hunspell processes that run
+            at the same time.
+
+    Examples:
+
+        >>> semaphore = asyncio.Semaphore(4)
+        >>>
+        >>> async def check(filenames_contents):
+        ...     spellchecker = AsyncHunspellChecker(
+        ...         filenames_contents,
+        ...         "en_US",
+        ...         semaphore=semaphore,
+        ...     )
+        ...     return [error async for error in spellchecker.check()]
+    """
+
+    def __init__(
+        self,
+        filenames_contents,
+        languages,
+        personal_dicts=None,
+        looks_like_a_word=DEFAULT_LOOKS_LIKE_A_WORD,
+        encoding=None,
+        semaphore=None,
+    ):
+        self.filenames_contents = filenames_contents
+        self.languages = languages
+        self.personal_dicts = personal_dicts
+        self.looks_like_a_word = looks_like_a_word
+        self.errors = None
+        self.encoding = encoding
+        self.semaphore = semaphore
+
+    async def check(
+        self,
+        include_filename=True,
+        include_line_number=True,
+        include_word=True,
+        include_word_line_index=True,
+        include_line=False,
+        include_text=False,
+        include_error_number=False,
+        include_near_misses=False,
+        as_dicts=False,
+    ):
+        """Asynchronous spellchecking function.
+
+        Accepts the same arguments and yields the same errors as
+        :py:meth:`hunspellcheck.HunspellChecker.check`, but from an
+        asynchronous generator.
+
+        Yields:
+            :py:class:`hunspellcheck.HunspellWordError`: Record with all the
+            included data for each mispelled word, which can be used as a
+            read-only dictionary. A :py:class:`dict` if ``as_dicts`` is
+            ``True``.
+        """
+        parse_kwargs = {
+            "looks_like_a_word": self.looks_like_a_word,
+            "include_filename": include_filename,
+            "include_line_number": include_line_number,
+            "include_word": include_word,
+            "include_word_line_index": include_word_line_index,
+            "include_line": include_line,
+            "include_text": include_text,
+            "include_error_number": include_error_number,
+            "include_near_misses": include_near_misses,
+        }
+
+        self.errors = 0
+        if self.semaphore is None:
+            async for error in self._check(parse_kwargs):
+                self.errors += 1
+                yield error.as_dict() if as_dicts else error
+        else:
+            async with self.semaphore:
+                async for error in self._check(parse_kwargs):
+                    self.errors += 1
+                    yield error.as_dict() if as_dicts else error
+
+    async def _check(self, parse_kwargs):
+        # building the command can read and write the personal dictionaries
+        command = await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                build_hunspell_command,
+                self.languages,
+                personal_dicts=self.personal_dicts,
+                encoding=self.encoding,
+            ),
+        )
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            limit=HUNSPELL_OUTPUT_LINE_LIMIT,
+        )
+
+        checked_lines = collections.deque()
+        writer = asyncio.ensure_future(
+            write_hunspell_input(
+                process.stdin,
+                gen_checked_lines(self.filenames_contents, checked_lines),
+            )
+        )
+
+        completed = False
+        try:
+            async for error in parse_hunspell_async_stream(
+                checked_lines,
+                process.stdout,
+                **parse_kwargs,
+            ):
+                yield error
+            completed = True
+        finally:
+            if not completed and process.returncode is None:
+                process.kill()
+            returncode = await process.wait()
+            if not writer.done():
+                writer.cancel()
+            try:
+                await writer
+            except asyncio.CancelledError:
+                pass
+
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, command)
+
+
+def gen_checked_lines(filenames_contents, checked_lines):
+    """Generates the lines of multiple contents quoted for hunspell.
+
+    Args:
+        filenames_contents (dict): Dictionary mapping filenames to content of
+            those files.
+        checked_lines (collections.deque): Queue to which the filename, line
+            number, line and content of the file of each line are appended
+            before it is yielded. The content is a
+            :py:class:`hunspellcheck.error.HunspellFileContent` shared by all
+            the lines of the same file.
+
+    Yields:
+        str: Lines quoted as Hunspell recommends.
+    """
+    for filename, text in filenames_contents.items():
+        content = HunspellFileContent(text)
+        for line_number, line in enumerate(text.split("\n"), start=1):
+            checked_lines.append((filename, line_number, line, content))
+            yield f"^{line}" if line else ""
+
+
+async def write_hunspell_input(stdin, lines):
+    """Write lines to the standard input of hunspell, waiting for the pipe to
+    be drained when it is full.
+
+    Args:
+        stdin (asyncio.StreamWriter): Standard input of hunspell.
+        lines (iterable): Lines to write.
+    """
+    encoding = locale.getpreferredencoding(False)
+    try:
+        for line in lines:
+            stdin.write(f"{line}\n".encode(encoding))
+            await stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):  # pragma: no cover
+        # hunspell has been stopped
+        pass
+    finally:
+        stdin.close()
+
+
+async def parse_hunspell_async_stream(
+    checked_lines,
+    hunspell_stdout,
+    looks_like_a_word=DEFAULT_LOOKS_LIKE_A_WORD,
+    include_filename=True,
+    include_line_number=True,
+    include_word=True,
+    include_word_line_index=True,
+    include_line=False,
+    include_text=False,
+    include_error_number=False,
+    include_near_misses=False,
+):
+    """Parse `hunspell -a` output while hunspell is writing it, reading it
+    from an asynchronous stream.
+
+    Works like :py:func:`hunspellcheck.spellchecker.parse_hunspell_stream`,
+    but ``checked_lines`` also contains the content of the file in which each
+    line resides.
+    """
+    error_class = included_error_record_class(locals())
+
+    encoding = locale.getpreferredencoding(False)
+    error_number = 0
+    checked_line = None
+
+    await hunspell_stdout.readline()  # version banner
+    async for hunspell_line in hunspell_stdout:
+        if checked_line is None:
+            checked_line = checked_lines.popleft()
+        if hunspell_line == b"\n":
+            checked_line = None
+            continue
+
+        if hunspell_line[:1] in (b"&", b"#"):
+            filename, line_number, line, content = checked_line
+            word, word_line_index, near_misses = parse_hunspell_mispelling(
+                hunspell_line.decode(encoding)
+            )
+            if looks_like_a_word(word):
+                error_number += 1
+                yield error_class(
+                    filename,
+                    line_number,
+                    word,
+                    word_line_index,
+                    line,
+                    content,
+                    error_number,
+                    near_misses,
+                )
@@ -0,0 +1,332 @@
+"""Spellchecking backends of hunspellcheck.
+
+A backend is the engine that :py:class:`hunspellcheck.HunspellChecker` uses
+to find the mispellings of the words found in the contents. Backends take
+batches of word candidates and return the mispellings found inside them, with
+their offsets and near misses, so the spellchecker can map them back to their
+occurrences in the contents.
+"""
+
+from hunspellcheck.exceptions import HunspellLibraryNotFoundError
+from hunspellcheck.hunspell.personal import load_personal_dictionary
+from hunspellcheck.hunspell.spellcheck import HunspellPipe, hunspell_spellcheck
+from hunspellcheck.hunspell.version import get_hunspell_version
+from hunspellcheck.hunspell.worker import (
+    acquire_hunspell_worker,
+    hunspell_worker_key,
+    release_hunspell_worker,
+)
+
+
+class HunspellBackend:
+    """Base class of the spellchecking backends.
+
+    Subclasses must implement
+    :py:meth:`hunspellcheck.backends.HunspellBackend.spellcheck_words` and
+    can override :py:meth:`hunspellcheck.backends.HunspellBackend.open` and
+    :py:meth:`hunspellcheck.backends.HunspellBackend.close` to keep resources
+    alive between checks. Instances of any subclass can be passed as the
+    ``backend`` argument of :py:class:`hunspellcheck.HunspellChecker`.
+
+    Args:
+        languages (list, str): Language or languages dictionaries (could be
+            defined as files) used to check the words.
+        personal_dicts (str, list): Globs of personal dictionaries used to
+            exclude valid words from being notified as errors.
+        encoding (str): Input encoding. If not defined, it will be autodetected
+            by hunspell.
+    """
+
+    name = None
+
+    def __init__(self, languages, personal_dicts=None, encoding=None):
+        self.languages = languages
+        self.personal_dicts = personal_dicts
+        self.encoding = encoding
+
+    def open(self):
+        """Acquire the resources kept alive between checks, if any."""
+
+    def close(self):
+        """Release the resources acquired by
+        :py:meth:`hunspellcheck.backends.HunspellBackend.open`.
+        """
+
+    def fingerprint(self):
+        """Identify the engine used by the backend and its version, so the
+        results checked with different engines are not mixed by
+        :py:class:`hunspellcheck.ResultsCache`.
+
+        Returns:
+            list: Values serializable as JSON.
+        """
+        return [self.name or f"{type(self).__module__}.{type(self).__qualname__}"]
+
+    def spellcheck_words(self, words):
+        """Check a batch of word candidates, splitting them in the words that
+        hunspell would find inside them.
+
+        Args:
+            words (list): Distinct word candidates to check.
+
+        Returns:
+            dict: Mapping of the candidates in which mispellings have been
+            found to a list of tuples with the mispelled word, its index inside
+            the candidate and its near misses. Correct candidates are not
+            included.
+        """
+        raise NotImplementedError
+
+
+class SubprocessBackend(HunspellBackend):
+    """Backend which calls the ``hunspell`` program.
+
+    Each check spawns a new hunspell process, unless the backend has been
+    opened, in which case a persistent process shared by all the backends
+    that use the same dictionaries is used.
+    """
+
+    name = "subprocess"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.worker = None
+
+    def open(self):
+        if self.worker is None:
+            self.worker = acquire_hunspell_worker(
+                self.languages,
+                personal_dicts=self.personal_dicts,
+                encoding=self.encoding,
+            )
+
+    def close(self):
+        if self.worker is not None:
+            release_hunspell_worker(self.worker)
+            self.worker = None
+
+    def _refresh_worker(self):
+        # the worker is replaced if the personal dictionaries have been edited
+        if self.worker is not None and self.worker.key != hunspell_worker_key(
+            self.languages,
+            personal_dicts=self.personal_dicts,
+            encoding=self.encoding,
+        ):
+            self.close()
+            self.open()
+
+    def fingerprint(self):
+        return [self.name, get_hunspell_version()]
+
+    def spellcheck(self, content):
+        """Check a text quoted for hunspell.
+
+        Args:
+            content (str): Text quoted as
+                :py:func:`hunspellcheck.spellchecker.quote_for_hunspell`
+                returns it.
+
+        Returns:
+            object: Output of `hunspell -a` in its ``stdout`` attribute.
+        """
+        self._refresh_worker()
+        if self.worker is not None:
+            return self.worker.spellcheck(content)
+        return hunspell_spellcheck(
+            content,
+            self.languages,
+            personal_dicts=self.personal_dicts,
+            encoding=self.encoding,
+        )
+
+    def spellcheck_words(self, words):
+        # imported here because the spellchecker imports this module
+        from hunspellcheck.spellchecker import parse_hunspell_words_output
+
+        quoted_words = [f"^{word}" for word in words]
+        self._refresh_worker()
+        if self.worker is not None:
+            return parse_hunspell_words_output(
+                words,
+                self.worker.spellcheck("\n".join(quoted_words)),
+            )
+
+        hunspell_pipe = HunspellPipe(
+            quoted_words,
+            self.languages,
+            personal_dicts=self.personal_dicts,
+            encoding=self.encoding,
+        )
+        try:
+            return parse_hunspell_words_output(words, hunspell_pipe)
+        finally:
+            hunspell_pipe.close()
+
+
+class LibraryBackend(HunspellBackend):
+    """Backend which calls the Hunspell shared library through ctypes.
+
+    No processes are spawned and no output needs to be parsed. The Hunspell
+    instances are cached by
+    :py:func:`hunspellcheck.hunspell.library.acquire_hunspell_library`.
+
+    Raises:
+        HunspellLibraryNotFoundError: If the library is not installed.
+    """
+
+    name = "library"
+
+    def __init__(self, *args, **kwargs):
+        # imported here because ctypes is only needed by this backend
+        from hunspellcheck.hunspell.library import hunspell_library_available
+
+        if not hunspell_library_available():
+            raise HunspellLibraryNotFoundError(
+                "The Hunspell shared library can't be found"
+            )
+        super().__init__(*args, **kwargs)
+
+    def fingerprint(self):
+        from hunspellcheck.hunspell.library import load_hunspell_library
+
+        # the name of the library includes its version
+        return [self.name, load_hunspell_library()._name]
+
+    def spellcheck_words(self, words):
+        from hunspellcheck.hunspell.library import acquire_hunspell_library
+
+        while True:
+            hunspell = acquire_hunspell_library(
+                self.languages,
+                personal_dicts=self.personal_dicts,
+            )
+            with hunspell.lock:
+                # destroyed by another thread after being acquired
+                if hunspell.handle is not None:
+                    return hunspell.spellcheck_words(words)
+
+
+class PythonBackend(HunspellBackend):
+    """Backend which looks up the words in an index of the forms accepted by
+    the first language dictionary.
+
+    The index is built parsing the ``.aff`` and ``.dic`` files of the
+    dictionary and stored in the user cache directory. Only the words that
+    the index can't decide are checked by a fallback subprocess backend.
+    """
+
+    name = "python"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fallback = create_backend(None, *args, **kwargs)
+        self._dictionary_index = None
+
+    def fingerprint(self):
+        # imported here because the index is only needed by this backend
+        from hunspellcheck.hunspell.index import DICTIONARY_INDEX_VERSION
+
+        return [self.name, DICTIONARY_INDEX_VERSION, *self.fallback.fingerprint()]
+
+    def open(self):
+        self.fallback.open()
+
+    def close(self):
+        self.fallback.close()
+
+    def _gen_undecided_words(self, words):
+        if self._dictionary_index is None:
+            from hunspellcheck.hunspell.index import load_dictionary_index
+
+            languages = self.languages
+            if isinstance(languages, str):
+                languages = languages.split(",")
+            self._dictionary_index = load_dictionary_index(languages[0])
+        forbidden_words = load_personal_dictionary(self.personal_dicts).forbidden_words
+        for word in words:
+            if not self._dictionary_index or not all(
+                self._dictionary_index.knows(subword) and subword not in forbidden_words
+                for subword in self._dictionary_index.gen_words(word)
+            ):
+                yield word
+
+    def spellcheck_words(self, words):
+        words = list(self._gen_undecided_words(words))
+        if not words:
+            return {}
+        return self.fallback.spellcheck_words(words)
+
+
+class EmulatorBackend(HunspellBackend):
+    """Backend which checks the words in-process with
+    :py:class:`hunspellcheck.hunspell.emulator.HunspellEmulator`.
+
+    Its results don't depend on the installed hunspell, so it is intended
+    for deterministic tests and benchmarks, not for real spellchecking.
+
+    Args:
+        emulator (:py:class:`hunspellcheck.hunspell.emulator.HunspellEmulator`):
+            Emulator used to check the words. If not defined, it is built the
+            first time that words are checked from the languages and personal
+            dictionaries of the backend.
+    """
+
+    name = "emulator"
+
+    def __init__(self, *args, emulator=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.emulator = emulator
+
+    def spellcheck_words(self, words):
+        if self.emulator is None:
+            # imported here because the emulator is only a testing tool
+            from hunspellcheck.hunspell.emulator import HunspellEmulator
+
+            self.emulator = HunspellEmulator.from_dictionaries(
+                self.languages,
+                personal_dicts=self.personal_dicts,
+            )
+        return self.emulator.spellcheck_words(words)
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (SubprocessBackend, LibraryBackend, PythonBackend, EmulatorBackend)
+}
+
+
+def create_backend(backend, languages, personal_dicts=None, encoding=None):
+    """Build the backend used by a spellchecker.
+
+    Args:
+        backend (str, :py:class:`hunspellcheck.backends.HunspellBackend`):
+            Name of the backend (``"subprocess"``, ``"library"``,
+            ``"python"`` or ``"emulator"``) or a backend instance, which is
+            returned as is. If ``None``, the subprocess backend is used.
+        languages (list, str): Language or languages dictionaries.
+        personal_dicts (str, list): Personal dictionaries.
+        encoding (str): Input encoding.
+
+    Raises:
+        ValueError: If the backend name is not valid.
+        HunspellLibraryNotFoundError: If the library backend is required but
+            the library is not installed.
+
+    Returns:
+        :py:class:`hunspellcheck.backends.HunspellBackend`: Backend instance.
+    """
+    if isinstance(backend, HunspellBackend):
+        return backend
+    if backend is None:
+        backend = "subprocess"
+    elif backend not in BACKENDS:
+        raise ValueError(
+            f"Invalid backend '{backend}'. Must be one of"
+            f" {', '.join(repr(name) for name in BACKENDS)} or an instance of"
+            " a HunspellBackend subclass"
+        )
+    return BACKENDS[backend](
+        languages,
+        personal_dicts=personal_dicts,
+        encoding=encoding,
+    )
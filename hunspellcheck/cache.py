@@ -0,0 +1,386 @@
+"""Caches used to avoid checking the same content multiple times."""
+
+import collections
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from hunspellcheck.hunspell.dictionaries import find_dictionary_filepath
+from hunspellcheck.hunspell.version import get_hunspell_version
+
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo",
+    ["hits", "misses", "maxsize", "currsize"],
+)
+
+
+class WordsCache:
+    """Bounded LRU cache of the mispellings found by hunspell inside words.
+
+    The words are stored along with a key that identifies the dictionaries
+    used to check them, so the same cache can be shared by spellcheckers that
+    use different languages or personal dictionaries.
+
+    Args:
+        maxsize (int): Maximum number of words stored. When the cache is full,
+            the least recently used words are discarded.
+    """
+
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._words = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key, words):
+        """Get the cached mispellings of some words.
+
+        Args:
+            key (tuple): Key of the dictionaries used to check the words.
+            words (iterable): Words to search in the cache.
+
+        Returns:
+            tuple: Dictionary mapping cached words with mispellings to them and
+            list with the words not found in the cache.
+        """
+        mispellings, missing_words = {}, []
+        with self._lock:
+            for word in words:
+                try:
+                    word_mispellings = self._words[(key, word)]
+                except KeyError:
+                    self.misses += 1
+                    missing_words.append(word)
+                else:
+                    self.hits += 1
+                    self._words.move_to_end((key, word))
+                    if word_mispellings:
+                        mispellings[word] = word_mispellings
+        return (mispellings, missing_words)
+
+    def store(self, key, words, mispellings):
+        """Store the result of checking some words.
+
+        Args:
+            key (tuple): Key of the dictionaries used to check the words.
+            words (iterable): Words checked.
+            mispellings (dict): Mapping of the words in which mispellings have
+                been found to them. The rest of the words are considered
+                correct.
+        """
+        with self._lock:
+            for word in words:
+                self._words[(key, word)] = tuple(mispellings.get(word, ()))
+                self._words.move_to_end((key, word))
+            while len(self._words) > self.maxsize:
+                self._words.popitem(last=False)
+
+    def invalidate(self, key=None):
+        """Discard cached words.
+
+        Must be called when the content of the dictionaries used to check the
+        words changes without changing their key.
+
+        Args:
+            key (tuple): Only discard the words checked with the dictionaries
+                identified by this key. If not defined, all the words are
+                discarded.
+        """
+        with self._lock:
+            if key is None:
+                self._words.clear()
+            else:
+                for cache_key in [k for k in self._words if k[0] == key]:
+                    del self._words[cache_key]
+
+    def cache_info(self):
+        """Report cache statistics.
+
+        Returns:
+            :py:class:`hunspellcheck.cache.CacheInfo`: Named tuple with the
+            fields ``hits``, ``misses``, ``maxsize`` and ``currsize``.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._words))
+
+
+def get_cache_directory(*subdirectories):
+    """Get the directory in which hunspellcheck stores its caches.
+
+    By default, it is the directory ``hunspellcheck`` inside the user cache
+    directory defined by the ``XDG_CACHE_HOME`` environment variable or
+    ``~/.cache``. It can be overwritten defining the environment variable
+    ``HUNSPELLCHECK_CACHE_DIR``.
+
+    Args:
+        *subdirectories (str): Subdirectories to join to the cache directory.
+
+    Returns:
+        str: Path to the cache directory.
+    """
+    cache_directory = os.environ.get("HUNSPELLCHECK_CACHE_DIR")
+    if not cache_directory:
+        cache_directory = os.path.join(
+            os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "hunspellcheck",
+        )
+    return os.path.join(cache_directory, *subdirectories)
+
+
+def dictionaries_fingerprint(language_dicts):
+    """Identify the state of the files of some language dictionaries.
+
+    Args:
+        language_dicts (list, str): Language or languages dictionaries (could
+            be defined as files).
+
+    Returns:
+        list: For each dictionary, its name and the path, size and
+        modification time of its ``.aff`` and ``.dic`` files.
+    """
+    if isinstance(language_dicts, str):
+        language_dicts = language_dicts.split(",")
+
+    fingerprint = []
+    for language_dict in language_dicts:
+        files = []
+        dictionary_filepath = find_dictionary_filepath(language_dict)
+        if dictionary_filepath is not None:
+            for extension in (".aff", ".dic"):
+                filepath = f"{dictionary_filepath}{extension}"
+                try:
+                    stat = os.stat(filepath)
+                except OSError:
+                    continue
+                files.append([filepath, stat.st_size, stat.st_mtime_ns])
+        fingerprint.append([language_dict, files])
+    return fingerprint
+
+
+def personal_dicts_fingerprint(personal_dicts):
+    """Hash the content of personal dictionaries.
+
+    Args:
+        personal_dicts (list, str): Globs of personal dictionaries.
+
+    Returns:
+        str: Hexadecimal digest of the content of the dictionaries.
+    """
+    if not personal_dicts:
+        personal_dicts = []
+    elif isinstance(personal_dicts, str):
+        personal_dicts = [personal_dicts]
+
+    hasher = hashlib.sha256()
+    for personal_dict_glob in personal_dicts:
+        for personal_dict in sorted(glob.glob(personal_dict_glob)):
+            hasher.update(personal_dict.encode("utf-8", "surrogateescape"))
+            with open(personal_dict, "rb") as f:
+                hasher.update(hashlib.sha256(f.read()).digest())
+    return hasher.hexdigest()
+
+
+def spellcheck_fingerprint(
+    language_dicts,
+    personal_dicts=None,
+    encoding=None,
+    backend=None,
+):
+    """Identify all the configuration that affects the errors found checking
+    a content, including the backend used and its version.
+
+    Args:
+        language_dicts (list, str): Language or languages dictionaries (could
+            be defined as files).
+        personal_dicts (list, str): Globs of personal dictionaries.
+        encoding (str): Input encoding passed to Hunspell.
+        backend (:py:class:`hunspellcheck.backends.HunspellBackend`): Backend
+            used to check the contents. If not defined, the installed
+            version of the hunspell program is used to identify it.
+
+    Returns:
+        str: Hexadecimal digest identifying the configuration.
+    """
+    fingerprint = [
+        ["subprocess", get_hunspell_version()]
+        if backend is None
+        else backend.fingerprint(),
+        dictionaries_fingerprint(language_dicts),
+        personal_dicts_fingerprint(personal_dicts),
+        encoding,
+    ]
+    return hashlib.sha256(json.dumps(fingerprint).encode()).hexdigest()
+
+
+class ResultsCache:
+    """Cache on disk of the errors found checking files.
+
+    Each file is stored in its own JSON file, named after a hash of the
+    content checked and the configuration of the spellchecker, so changing
+    the file, the dictionaries or the hunspell version invalidates it. The
+    errors are stored before filtering them with the ``looks_like_a_word``
+    function of the spellchecker, so it can be changed without invalidating
+    them.
+
+    Args:
+        directory (str): Directory in which the results are stored. By
+            default, the directory ``results`` inside the directory returned
+            by :py:func:`hunspellcheck.cache.get_cache_directory`.
+        max_size (int): Maximum size in bytes of all the results stored. When
+            exceeded, the least recently used results are removed.
+        max_age (int): Maximum time in seconds that a result is kept without
+            being used.
+    """
+
+    def __init__(self, directory=None, max_size=64 * 1024 * 1024, max_age=2592000):
+        self.directory = (
+            directory if directory is not None else get_cache_directory("results")
+        )
+        self.max_size = max_size
+        self.max_age = max_age
+
+    def key(self, fingerprint, content):
+        """Build the key of a content checked with a configuration.
+
+        Args:
+            fingerprint (str): Configuration fingerprint, as returned by
+                :py:func:`hunspellcheck.cache.spellcheck_fingerprint`.
+            content (str): Content checked.
+
+        Returns:
+            str: Hexadecimal digest identifying the result.
+        """
+        hasher = hashlib.sha256(fingerprint.encode())
+        hasher.update(content.encode("utf-8", "surrogatepass"))
+        return hasher.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        """Get the errors stored for a key.
+
+        Corrupted results are removed and treated as not stored.
+
+        Args:
+            key (str): Key of the result.
+
+        Returns:
+            list: Errors stored as lists of line number, word, index of the
+            word in its line and near misses. ``None`` if not stored.
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                errors = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            _remove_file(path)
+            return None
+
+        if not _valid_results(errors):
+            _remove_file(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:  # pragma: no cover
+            pass
+        return errors
+
+    def set(self, key, errors):
+        """Store the errors found checking a content.
+
+        Args:
+            key (str): Key of the result.
+            errors (list): Errors as lists of line number, word, index of the
+                word in its line and near misses.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        f = tempfile.NamedTemporaryFile(
+            "w",
+            dir=self.directory,
+            suffix=".tmp",
+            delete=False,
+            encoding="utf-8",
+        )
+        try:
+            with f:
+                json.dump(errors, f)
+            os.replace(f.name, self._path(key))
+        except BaseException:
+            _remove_file(f.name)
+            raise
+
+    def evict(self):
+        """Remove the results not used in ``max_age`` seconds and then the
+        least recently used ones until their total size is not greater than
+        ``max_size``.
+        """
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return
+
+        now, results, total_size = time.time(), [], 0
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:  # pragma: no cover
+                continue
+            if now - stat.st_mtime > self.max_age:
+                _remove_file(entry.path)
+            else:
+                results.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+        results.sort()
+        for _, size, path in results:
+            if total_size <= self.max_size:
+                break
+            _remove_file(path)
+            total_size -= size
+
+    def clear(self):
+        """Remove all the results stored."""
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            if entry.name.endswith(".json"):
+                _remove_file(entry.path)
+
+
+def _valid_results(errors):
+    if not isinstance(errors, list):
+        return False
+    for error in errors:
+        if not (
+            isinstance(error, list)
+            and len(error) == 4
+            and isinstance(error[0], int)
+            and isinstance(error[1], str)
+            and isinstance(error[2], int)
+            and isinstance(error[3], list)
+        ):
+            return False
+    return True
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -1,11 +1,16 @@
 """CLI utilities writing spell checkers."""
 
+import functools
 import warnings
 
 from hunspellcheck.cli.files import FilesOrGlobsAction
 from hunspellcheck.cli.languages import create_hunspell_valid_dictionary_action
 from hunspellcheck.cli.personal_dicts import PersonalDictionaryAction
-from hunspellcheck.cli.version import DEFAULT_VERSION_TEMPLATE, render_version_template
+from hunspellcheck.cli.version import (
+    DEFAULT_VERSION_TEMPLATE,
+    LazyVersionAction,
+    render_version_template,
+)
 
 
 def hunspellchecker_argument_parser(
@@ -115,7 +120,9 @@ def hunspellchecker_argument_parser(
             The data for template rendering by default is compound by the next
             fields: ``version_prog``, ``version_number``, ``hunspell_version``
             and ``ispell_version``. If you want to pass other fields, include
-            them in the argument ``version_template_context``.
+            them in the argument ``version_template_context``. The template
+            is rendered, and hunspell executed to get its version, only when
+            the option is passed.
         version_template_context (dict): Additional data to use in the version
             string rendering.
         version_name_or_flags (list, str): Flag name defined constructing the
@@ -321,7 +328,8 @@ def hunspellchecker_argument_parser(
 
     """
     if version:
-        version_string = render_version_template(
+        render_version = functools.partial(
+            render_version_template,
             version_template,
             version_template_context,
             version_prog=version_prog if version_prog is not None else parser.prog,
@@ -329,10 +337,28 @@ def hunspellchecker_argument_parser(
             hunspell_version=hunspell_version,
             ispell_version=ispell_version,
         )
+        if version_template == DEFAULT_VERSION_TEMPLATE:
+            # the default template is only empty without any version, so it
+            # doesn't need to be rendered to know it
+            version_string_is_empty = not any(
+                (version_number, hunspell_version, ispell_version)
+            )
+        else:
+            version_string_is_empty = False
 
-        if version_string:
-            _version_kwargs = {"action": "version", "version": version_string}
+        if not version_string_is_empty:
+            _version_kwargs = {
+                "action": LazyVersionAction,
+                "render_version": render_version,
+            }
             _version_kwargs.update(version_kwargs)
+            if _version_kwargs["action"] is not LazyVersionAction:
+                del _version_kwargs["render_version"]
+                if (
+                    _version_kwargs["action"] == "version"
+                    and "version" not in _version_kwargs
+                ):
+                    _version_kwargs["version"] = render_version()
 
             if isinstance(version_name_or_flags, str):  # pragma: no cover
                 version_name_or_flags = [version_name_or_flags]
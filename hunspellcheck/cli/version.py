@@ -1,6 +1,6 @@
 """Version CLI option utilities for hunspellcheck."""
 
-from jinja2 import Template
+import argparse
 
 from hunspellcheck.hunspell.version import get_hunspell_version
 
@@ -37,4 +37,27 @@ def render_version_template(
         _version_template_context["version_number"] = version_number
     _version_template_context.update(version_template_context)
 
+    # jinja2 is slow to import and only needed rendering the version
+    from jinja2 import Template
+
     return Template(version_template).render(**_version_template_context)
+
+
+class LazyVersionAction(argparse._VersionAction):
+    """Version action which renders the version string only when the option
+    is passed, so building the parser doesn't need to execute hunspell.
+
+    Args:
+        render_version (types.FunctionType): Function called without
+            arguments to render the version string, if ``version`` is not
+            defined.
+    """
+
+    def __init__(self, *args, render_version=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.render_version = render_version
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        if self.version is None and self.render_version is not None:
+            self.version = self.render_version()
+        super().__call__(parser, namespace, values, option_string=option_string)
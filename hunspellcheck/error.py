@@ -0,0 +1,411 @@
+"""Records of the mispelled words found by the spellchecker."""
+
+import array
+import bisect
+import collections.abc
+import functools
+
+
+ERROR_FIELDS = [
+    "filename",
+    "line_number",
+    "word",
+    "word_line_index",
+    "line",
+    "text",
+    "error_number",
+    "near_misses",
+]
+
+
+class HunspellFileContent:
+    """Content of a checked file shared by all the errors found in it.
+
+    Errors that include the text of their file or the line in which they
+    reside reference the same instance instead of storing them, and resolve
+    them when they are accessed.
+
+    The offsets in which the lines of the content start are indexed the first
+    time that they are needed, in one pass over the content, so lines are
+    extracted and absolute offsets are converted to line numbers and columns
+    with a binary search, without splitting the content in lines.
+
+    Args:
+        text (str): Content of the file.
+    """
+
+    __slots__ = ("text", "_line_offsets")
+
+    def __init__(self, text):
+        self.text = text
+        self._line_offsets = None
+
+    @property
+    def line_offsets(self):
+        """:py:class:`array.array`: Offsets in which each line starts."""
+        if self._line_offsets is None:
+            line_offsets = array.array("q", [0])
+            find, offset = self.text.find, self.text.find("\n")
+            while offset != -1:
+                line_offsets.append(offset + 1)
+                offset = find("\n", offset + 1)
+            self._line_offsets = line_offsets
+        return self._line_offsets
+
+    def line(self, line_number):
+        """Get a line of the content.
+
+        Args:
+            line_number (int): Number of the line, starting at 1.
+
+        Returns:
+            str: Line, without its trailing newline.
+        """
+        line_offsets = self.line_offsets
+        start = line_offsets[line_number - 1]
+        if line_number < len(line_offsets):
+            return self.text[start : line_offsets[line_number] - 1]
+        return self.text[start:]
+
+    def locate(self, offset, start_line_number=1):
+        """Get the line and the column of a character of the content.
+
+        Used to locate the words found searching the whole content, which
+        hunspell only reports relative to the lines.
+
+        Args:
+            offset (int): Index of the character inside the content.
+            start_line_number (int): Line from which the search starts, which
+                must not be after the line of the character. Passing the line
+                of the previous character located shortens the search when
+                they are located in order.
+
+        Returns:
+            tuple: Number of the line, starting at 1, and index of the
+            character inside the line, starting at 0.
+        """
+        line_offsets = self.line_offsets
+        line_number = bisect.bisect_right(line_offsets, offset, start_line_number - 1)
+        return (line_number, offset - line_offsets[line_number - 1])
+
+
+class HunspellMappedFileContent(HunspellFileContent):
+    """Content of a file checked by its path, read only when it is needed.
+
+    Args:
+        path (str): Path to the file.
+        encoding (str): Encoding of the file.
+    """
+
+    __slots__ = ("path", "encoding", "_text")
+
+    def __init__(self, path, encoding):
+        self.path = path
+        self.encoding = encoding
+        self._text = None
+        self._line_offsets = None
+
+    @property
+    def text(self):
+        """str: Content of the file, read and decoded the first time that it
+        is accessed.
+        """
+        if self._text is None:
+            with open(self.path, encoding=self.encoding) as f:
+                self._text = f.read()
+        return self._text
+
+
+def _error_line(error):
+    if error._line is not None:
+        return error._line
+    return error._content.line(error._line_number)
+
+
+def _error_text(error):
+    if error._content is None:
+        return None
+    return error._content.text
+
+
+class HunspellWordError(collections.abc.Mapping):
+    """Data of a mispelled word.
+
+    The fields included in the errors yielded by a check are chosen once,
+    creating a subclass whose instances only store them in slots, so they are
+    cheap to build and their fields are accessed as attributes (for example,
+    ``error.word``).
+
+    The line and the text of the errors are resolved when they are accessed
+    from a :py:class:`hunspellcheck.error.HunspellFileContent` shared by all
+    the errors found in the same file, so they are not stored by each error.
+
+    Errors also behave as read-only mappings of the names of their fields to
+    their values, so they can be read as the dictionaries yielded by previous
+    versions. Like them, the mapping doesn't include the fields whose value
+    is an empty string or an empty list, although they can still be accessed
+    as attributes. Unlike them, errors can't be modified nor serialized with
+    :py:func:`json.dumps` directly: convert them with
+    :py:meth:`hunspellcheck.HunspellWordError.as_dict` or pass
+    ``as_dicts=True`` to :py:meth:`hunspellcheck.HunspellChecker.check`.
+
+    Attributes:
+        fields (tuple): Names of the fields included in the error.
+    """
+
+    __slots__ = ()
+    fields = ()
+
+    def __getitem__(self, key):
+        if key in self.fields:
+            value = getattr(self, key)
+            if value or not isinstance(value, (str, list)):
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        for field in self.fields:
+            value = getattr(self, field)
+            if value or not isinstance(value, (str, list)):
+                yield field
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+    def __reduce__(self):
+        return (
+            _rebuild_hunspell_word_error,
+            (self.fields, tuple(getattr(self, field) for field in self.fields)),
+        )
+
+    def as_dict(self):
+        """Convert the error to a dictionary.
+
+        Returns:
+            dict: Fields of the error mapped to their values.
+        """
+        return dict(self.items())
+
+
+@functools.lru_cache(maxsize=None)
+def error_record_class(fields):
+    """Build the class of the errors that include some fields.
+
+    The class is created only once for each combination of fields. Its
+    constructor accepts the values of all the fields in
+    :py:data:`hunspellcheck.error.ERROR_FIELDS`, in the same order, but only
+    stores the values of the included fields. The ``text`` must be passed as
+    a :py:class:`hunspellcheck.error.HunspellFileContent` and the ``line`` can
+    be ``None``, in which case it is taken from the content when accessed.
+
+    Args:
+        fields (tuple): Names of the fields included in the errors.
+
+    Returns:
+        type: Subclass of :py:class:`hunspellcheck.error.HunspellWordError`.
+    """
+    fields = tuple(field for field in ERROR_FIELDS if field in fields)
+
+    slots, assignments, properties = [], [], {}
+    for field in fields:
+        if field == "line":
+            slots.extend(["_line", "_line_number"])
+            assignments.extend(["_line = line", "_line_number = line_number"])
+            properties["line"] = property(_error_line)
+        elif field == "text":
+            properties["text"] = property(_error_text)
+        else:
+            slots.append(field)
+            assignments.append(f"{field} = {field}")
+    if "line" in fields or "text" in fields:
+        slots.append("_content")
+        assignments.append("_content = text")
+
+    body = "".join(f"\n    self.{assignment}" for assignment in assignments)
+    init_definition = f"""def __init__(self, {", ".join(ERROR_FIELDS)}):
+    pass{body}"""
+
+    namespace = {}
+    exec(compile(init_definition, "hunspellcheck.error", "exec"), {}, namespace)
+    return type(
+        HunspellWordError.__name__,
+        (HunspellWordError,),
+        {
+            "__slots__": tuple(slots),
+            "__init__": namespace["__init__"],
+            "__module__": __name__,
+            "fields": fields,
+            **properties,
+        },
+    )
+
+
+def included_error_record_class(include_kwargs):
+    """Build the class of the errors that include the fields enabled by the
+    ``include_<field>`` arguments of a check.
+
+    Args:
+        include_kwargs (dict): Arguments of the check, mapping
+            ``include_<field>`` names to booleans. Other keys are ignored.
+
+    Returns:
+        type: Subclass of :py:class:`hunspellcheck.error.HunspellWordError`.
+    """
+    return error_record_class(
+        tuple(field for field in ERROR_FIELDS if include_kwargs.get(f"include_{field}"))
+    )
+
+
+def _rebuild_hunspell_word_error(fields, values):
+    values = dict(zip(fields, values))
+    if values.get("text") is not None:
+        values["text"] = HunspellFileContent(values["text"])
+    return error_record_class(fields)(*(values.get(field) for field in ERROR_FIELDS))
+
+
+class HunspellErrorColumns:
+    """Mispelled words found by the spellchecker stored by columns.
+
+    Integer fields are stored in :py:class:`array.array` columns and string
+    fields as categorical columns, integer codes that index lists of their
+    distinct values, so each error takes a few bytes of memory.
+
+    Args:
+        include_near_misses (bool): Store the near misses of the words.
+
+    Attributes:
+        filenames (list): Distinct filenames, in order of first appearance.
+        filename_codes (array.array): Index of the filename of each error
+            inside ``filenames``.
+        line_numbers (array.array): Line number of each error.
+        words (list): Distinct mispelled words, in order of first appearance.
+        word_codes (array.array): Index of the word of each error inside
+            ``words``.
+        word_line_indexes (array.array): Index of the character in which each
+            word starts in its line.
+        near_misses (list): Tuples with the near misses of each error, if
+            included, ``None`` otherwise.
+    """
+
+    def __init__(self, include_near_misses=False):
+        self.filenames = []
+        self.filename_codes = array.array("q")
+        self.line_numbers = array.array("q")
+        self.words = []
+        self.word_codes = array.array("q")
+        self.word_line_indexes = array.array("q")
+        self.near_misses = [] if include_near_misses else None
+
+        self._filenames_codes = {}
+        self._words_codes = {}
+
+    def __len__(self):
+        return len(self.line_numbers)
+
+    def __iter__(self):
+        return self.gen_errors()
+
+    def append(self, filename, line_number, word, word_line_index, near_misses=None):
+        """Add an error to the columns.
+
+        Args:
+            filename (str): Filename in which the error has been found.
+            line_number (int): Line number of the error.
+            word (str): Mispelled word.
+            word_line_index (int): Index of the character in which the word
+                starts in its line.
+            near_misses (list): Near misses of the word, stored only if the
+                columns include them.
+        """
+        filename_code = self._filenames_codes.get(filename)
+        if filename_code is None:
+            filename_code = self._filenames_codes[filename] = len(self.filenames)
+            self.filenames.append(filename)
+        word_code = self._words_codes.get(word)
+        if word_code is None:
+            word_code = self._words_codes[word] = len(self.words)
+            self.words.append(word)
+
+        self.filename_codes.append(filename_code)
+        self.line_numbers.append(line_number)
+        self.word_codes.append(word_code)
+        self.word_line_indexes.append(word_line_index)
+        if self.near_misses is not None:
+            self.near_misses.append(tuple(near_misses or ()))
+
+    def gen_errors(self):
+        """Generate the errors stored as records.
+
+        Yields:
+            :py:class:`hunspellcheck.error.HunspellWordError`: Record of each
+            error, including its number.
+        """
+        fields = [
+            "filename",
+            "line_number",
+            "word",
+            "word_line_index",
+            "error_number",
+        ]
+        if self.near_misses is not None:
+            fields.append("near_misses")
+        error_class = error_record_class(tuple(fields))
+
+        for i, (filename_code, line_number, word_code, word_line_index) in enumerate(
+            zip(
+                self.filename_codes,
+                self.line_numbers,
+                self.word_codes,
+                self.word_line_indexes,
+            )
+        ):
+            yield error_class(
+                self.filenames[filename_code],
+                line_number,
+                self.words[word_code],
+                word_line_index,
+                None,
+                None,
+                i + 1,
+                None if self.near_misses is None else list(self.near_misses[i]),
+            )
+
+    def to_numpy(self):
+        """Convert the columns to NumPy arrays.
+
+        Integer columns are converted without copying their data. String
+        columns are converted to arrays of codes and arrays of their distinct
+        values, so they can be filtered as categorical data.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        Returns:
+            dict: Columns names mapped to NumPy arrays.
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "NumPy is required to convert the errors columns to arrays"
+            )
+
+        columns = {
+            "filenames": numpy.array(self.filenames, dtype=object),
+            "filename_codes": numpy.frombuffer(self.filename_codes, dtype=numpy.int64),
+            "line_numbers": numpy.frombuffer(self.line_numbers, dtype=numpy.int64),
+            "words": numpy.array(self.words, dtype=object),
+            "word_codes": numpy.frombuffer(self.word_codes, dtype=numpy.int64),
+            "word_line_indexes": numpy.frombuffer(
+                self.word_line_indexes,
+                dtype=numpy.int64,
+            ),
+        }
+        if self.near_misses is not None:
+            near_misses = numpy.empty(len(self.near_misses), dtype=object)
+            near_misses[:] = self.near_misses
+            columns["near_misses"] = near_misses
+        return columns
@@ -11,3 +11,7 @@ class Unreachable(HunspellCheckError):
 
 class InvalidLanguageDictionaryError(HunspellCheckError, ValueError):
     """Invalid language dictionary name."""
+
+
+class HunspellLibraryNotFoundError(HunspellCheckError, OSError):
+    """The Hunspell shared library is not installed."""
@@ -1 +1,16 @@
 """Utilities relative to hunspell itself."""
+
+import os
+
+
+def c_locale_environment():
+    """Build the environment used to execute hunspell when its messages are
+    parsed, so they are not localized.
+
+    A new mapping is returned instead of modifying :py:data:`os.environ`, so
+    hunspell can be executed concurrently from multiple threads.
+
+    Returns:
+        dict: Copy of the current environment using the C locale.
+    """
+    return {**os.environ, "LANG": "C", "LC_ALL": "C"}
@@ -1,48 +1,259 @@
 """Utilities about Hunspell dictionaries."""
 
+import collections
+import json
 import os
 import subprocess
 import sys
-
-from babel import Locale
+import tempfile
+import threading
 
 from hunspellcheck.exceptions import InvalidLanguageDictionaryError
+from hunspellcheck.hunspell import c_locale_environment
+
+
+DictionariesSnapshot = collections.namedtuple(
+    "DictionariesSnapshot",
+    ["key", "search_paths", "dictionaries"],
+)
+
+# directories in which hunspell searches dictionaries, after the current
+# directory and the paths defined by the environment variable DICPATH
+HUNSPELL_LIBDIRS = [
+    "/usr/share/hunspell",
+    "/usr/share/myspell",
+    "/usr/share/myspell/dicts",
+    "/Library/Spelling",
+]
+HUNSPELL_USER_OOODIRS = [
+    ".openoffice.org/3/user/wordbook",
+    ".openoffice.org2/user/wordbook",
+    ".openoffice.org2.0/user/wordbook",
+    "Library/Spelling",
+]
+HUNSPELL_OOODIRS = [
+    "/opt/openoffice.org/basis3.0/share/dict/ooo",
+    "/usr/lib/openoffice.org/basis3.0/share/dict/ooo",
+    "/opt/openoffice.org2.4/share/dict/ooo",
+    "/usr/lib/openoffice.org2.4/share/dict/ooo",
+    "/opt/openoffice.org2.3/share/dict/ooo",
+    "/usr/lib/openoffice.org2.3/share/dict/ooo",
+    "/opt/openoffice.org2.2/share/dict/ooo",
+    "/usr/lib/openoffice.org2.2/share/dict/ooo",
+    "/opt/openoffice.org2.1/share/dict/ooo",
+    "/usr/lib/openoffice.org2.1/share/dict/ooo",
+    "/opt/openoffice.org2.0/share/dict/ooo",
+    "/usr/lib/openoffice.org2.0/share/dict/ooo",
+]
+
+_DICTIONARIES_SNAPSHOT = None
+_DICTIONARIES_SNAPSHOT_LOCK = threading.Lock()
+
+
+def get_dictionaries_search_paths():
+    """Build the list of directories in which hunspell searches dictionaries,
+    in the same order that hunspell does.
 
+    Returns:
+        list: Dictionaries search paths.
+    """
+    search_paths = ["."]
+    dicpath = os.environ.get("DICPATH")
+    if dicpath:
+        search_paths.extend(path for path in dicpath.split(os.pathsep) if path)
+    search_paths.extend(HUNSPELL_LIBDIRS)
+    home = os.environ.get("HOME")
+    if home:
+        search_paths.extend(
+            f"{home}/{user_ooodir}" for user_ooodir in HUNSPELL_USER_OOODIRS
+        )
+    search_paths.extend(HUNSPELL_OOODIRS)
+    return search_paths
+
+
+def discover_dictionaries():
+    """Scan the hunspell dictionaries search paths for the dictionaries
+    available inside them, pairing their ``.aff`` and ``.dic`` files.
+
+    The dictionaries found are the same that ``hunspell -D`` reports, but
+    without spawning hunspell.
 
-def gen_available_dictionaries(full_paths=False):
-    """Generates the available dictionaries contained inside the search paths
-    configured by hunspell.
+    Returns:
+        tuple: List of search paths and list of complete paths to dictionaries.
+    """
+    search_paths = get_dictionaries_search_paths()
+    dictionaries = []
+    for search_path in search_paths:
+        try:
+            entries = list(os.scandir(search_path))
+        except OSError:
+            continue
+        filenames = {entry.name for entry in entries}
+        for entry in entries:
+            if (
+                len(entry.name) > 4
+                and entry.name.endswith(".dic")
+                and f"{entry.name[:-4]}.aff" in filenames
+            ):
+                dictionaries.append(f"{search_path}/{entry.name[:-4]}")
+    return (search_paths, dictionaries)
 
-    These dictionaries can be used without specify the full path to their
-    location in the system calling hunspell, only their name is needed.
 
-    Args:
-        full_paths (bool): Yield complete paths to dictionaries (``True``) or
-            their names only (``False``).
+def discover_dictionaries_calling_hunspell():
+    """Ask hunspell for its dictionaries search paths and the dictionaries
+    available inside them.
 
-    Yields:
-        str: Dictionary names (locale with territory).
+    Returns:
+        tuple: List of search paths and list of complete paths to dictionaries.
     """
-    previous_env_lang = os.environ.get("LANG", None)
-    os.environ["LANG"] = "C"
-
     output = subprocess.run(
         ["hunspell", "-D"],
         stderr=subprocess.PIPE,
         text=True,
+        env=c_locale_environment(),
     )
 
-    if previous_env_lang is None:
-        del os.environ["LANG"]
-    else:
-        os.environ["LANG"] = previous_env_lang
-
-    _inside_available_dictionaries = False
+    search_paths, dictionaries = [], []
+    _inside_search_path, _inside_available_dictionaries = False, False
     for line in output.stderr.splitlines():
         if _inside_available_dictionaries:
-            yield line if full_paths else os.path.basename(line)
+            dictionaries.append(line)
         elif line.startswith("AVAILABLE DICTIONARIES"):
             _inside_available_dictionaries = True
+        elif _inside_search_path:
+            search_paths = [path for path in line.split(os.pathsep) if path]
+            _inside_search_path = False
+        elif line.startswith("SEARCH PATH"):
+            _inside_search_path = True
+    return (search_paths, dictionaries)
+
+
+def dictionaries_snapshot_key(search_paths):
+    """Build the key that identifies the state of the dictionaries search
+    paths.
+
+    The key includes the modification times of the search paths, which
+    change when dictionaries are added or removed, and the environment that
+    defines the search paths.
+
+    Args:
+        search_paths (list): Dictionaries search paths.
+
+    Returns:
+        list: JSON serializable key.
+    """
+    key = [os.getcwd(), os.environ.get("DICPATH"), os.environ.get("HOME")]
+    for path in search_paths:
+        try:
+            key.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            key.append([path, None])
+    return key
+
+
+def get_dictionaries_snapshot():
+    """Get the dictionaries available for hunspell.
+
+    The result of the discovery is cached in memory and reused while the
+    dictionaries search paths are not modified. If the environment variable
+    ``HUNSPELLCHECK_PERSISTENT_DICTIONARIES_CACHE`` is defined, it is also
+    stored in the user cache directory to be reused by other processes.
+
+    Returns:
+        :py:class:`hunspellcheck.hunspell.dictionaries.DictionariesSnapshot`:
+        Named tuple with the fields ``key``, ``search_paths`` and
+        ``dictionaries``, being the last one a list with the complete paths to
+        the available dictionaries.
+    """
+    global _DICTIONARIES_SNAPSHOT
+
+    with _DICTIONARIES_SNAPSHOT_LOCK:
+        snapshot = _DICTIONARIES_SNAPSHOT
+        if snapshot is not None and snapshot.key == dictionaries_snapshot_key(
+            snapshot.search_paths
+        ):
+            return snapshot
+
+        persistent = bool(os.environ.get("HUNSPELLCHECK_PERSISTENT_DICTIONARIES_CACHE"))
+        if persistent:
+            snapshot = _load_dictionaries_snapshot()
+            if snapshot is not None and snapshot.key == dictionaries_snapshot_key(
+                snapshot.search_paths
+            ):
+                _DICTIONARIES_SNAPSHOT = snapshot
+                return snapshot
+
+        search_paths, dictionaries = discover_dictionaries()
+        snapshot = DictionariesSnapshot(
+            dictionaries_snapshot_key(search_paths),
+            search_paths,
+            dictionaries,
+        )
+        _DICTIONARIES_SNAPSHOT = snapshot
+        if persistent:
+            _dump_dictionaries_snapshot(snapshot)
+        return snapshot
+
+
+def invalidate_dictionaries_cache():
+    """Discard the cached dictionaries discovery, so the next query discovers
+    the dictionaries again.
+    """
+    global _DICTIONARIES_SNAPSHOT
+
+    with _DICTIONARIES_SNAPSHOT_LOCK:
+        _DICTIONARIES_SNAPSHOT = None
+
+
+def _dictionaries_snapshot_filepath():
+    # imported here because the cache module depends on this one
+    from hunspellcheck.cache import get_cache_directory
+
+    return get_cache_directory("dictionaries.json")
+
+
+def _load_dictionaries_snapshot():
+    try:
+        with open(_dictionaries_snapshot_filepath(), encoding="utf-8") as f:
+            return DictionariesSnapshot(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _dump_dictionaries_snapshot(snapshot):
+    filepath = _dictionaries_snapshot_filepath()
+    try:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        f = tempfile.NamedTemporaryFile(
+            "w",
+            dir=os.path.dirname(filepath),
+            suffix=".tmp",
+            delete=False,
+            encoding="utf-8",
+        )
+        with f:
+            json.dump(snapshot._asdict(), f)
+        os.replace(f.name, filepath)
+    except OSError:  # pragma: no cover
+        pass
+
+
+def gen_available_dictionaries(full_paths=False):
+    """Generates the available dictionaries contained inside the search paths
+    configured by hunspell.
+
+    These dictionaries can be used without specify the full path to their
+    location in the system calling hunspell, only their name is needed.
+
+    Args:
+        full_paths (bool): Yield complete paths to dictionaries (``True``) or
+            their names only (``False``).
+
+    Yields:
+        str: Dictionary names (locale with territory).
+    """
+    for dictionary in get_dictionaries_snapshot().dictionaries:
+        yield dictionary if full_paths else os.path.basename(dictionary)
 
 
 def list_available_dictionaries(full_paths=False):
@@ -108,6 +319,29 @@ def gen_available_dictionaries_with_langcodes(sort=True, full_paths=False):
         yield dictname
 
 
+def find_dictionary_filepath(value):
+    """Find the path of a dictionary in the same way that hunspell would do
+    loading it with the ``-d`` option.
+
+    Args:
+        value (str): Dictionary language or filepath, with or without the
+            ``.dic``/``.aff`` extension.
+
+    Returns:
+        str: Path to the dictionary without extension or ``None`` if it is
+        not found.
+    """
+    for extension in (".dic", ".aff"):
+        if value.endswith(extension) and os.path.isfile(value):
+            return value[: -len(extension)]
+    if os.path.isfile(f"{value}.dic"):
+        return value
+    for dictionary_path in gen_available_dictionaries(full_paths=True):
+        if os.path.basename(dictionary_path) == value:
+            return dictionary_path
+    return None
+
+
 def is_valid_dictionary_language(dictionary_name, negotiate_languages=False):
     """Check if a dictionary name is a valid dictionary installed
     for your Hunspell version.
@@ -128,6 +362,9 @@ def is_valid_dictionary_language(dictionary_name, negotiate_languages=False):
     available_dictionaries = list_available_dictionaries()
     if dictionary_name not in available_dictionaries:
         if negotiate_languages:
+            # babel is slow to import and only needed negotiating languages
+            from babel import Locale
+
             dictionary_name = str(
                 Locale.negotiate([dictionary_name], available_dictionaries)
             )
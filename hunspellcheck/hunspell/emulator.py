@@ -0,0 +1,450 @@
+"""Emulator of the ``hunspell -a`` pipe protocol.
+
+The emulator checks words against a word list instead of loading real
+dictionaries, so its results are deterministic and don't depend on the
+installed hunspell version. It can be used in-process, writing the same
+output that hunspell would write, or as a fake ``hunspell`` program created
+by :py:func:`write_hunspell_emulator_executable`, which is useful to test
+and profile the parsing and scheduling layers of hunspellcheck in isolation.
+
+Affix rules are expanded when the words are read from dictionaries, but
+suggestions are only the known words at one edit of distance, so the near
+misses reported differ from the ones of hunspell.
+"""
+
+import os
+import re
+import stat
+import subprocess
+import sys
+
+from hunspellcheck.hunspell.dictionaries import (
+    discover_dictionaries,
+    find_dictionary_filepath,
+)
+from hunspellcheck.hunspell.index import expand_dictionary
+from hunspellcheck.hunspell.personal import load_personal_dictionary
+
+
+HUNSPELL_EMULATOR_VERSION_LINE = (
+    "@(#) International Ispell Version 3.2.06 (but really Hunspell 1.7.0)"
+)
+
+# first characters of the input lines interpreted as commands
+HUNSPELL_COMMANDS_CHARACTERS = "*&@#~+-!%`"
+
+
+class HunspellEmulator:
+    """Stand-in for hunspell that speaks the ``hunspell -a`` protocol
+    checking words against a word list.
+
+    Args:
+        words (iterable): Correct words. Capitalized and uppercased versions
+            of them are correct too.
+        roots (dict): Correct words mapped to the root from which they are
+            derived, reported with ``+ ROOT`` lines.
+        compounds (bool): Accept words composed by two known words of at least
+            three characters, reported with ``-`` lines.
+        forbidden_words (iterable): Words always reported as mispelled.
+        keepcase_words (iterable): Words only correct with their exact case.
+        wordchars (str): Characters, besides letters and numbers, that are
+            part of words when they are surrounded by them.
+        max_near_misses (int): Maximum number of near misses suggested for
+            each mispelled word.
+    """
+
+    def __init__(
+        self,
+        words,
+        roots=None,
+        compounds=False,
+        forbidden_words=None,
+        keepcase_words=None,
+        wordchars="",
+        max_near_misses=15,
+    ):
+        self.words = set(words)
+        self.roots = roots or {}
+        self.words.update(self.roots)
+        self.compounds = compounds
+        self.forbidden_words = set(forbidden_words or ())
+        self.keepcase_words = set(keepcase_words or ())
+        self.max_near_misses = max_near_misses
+        self.word_regex = re.compile(
+            r"[^\W_]+(?:[%s]+[^\W_]+)*" % re.escape(wordchars)
+            if wordchars
+            else r"[^\W_]+"
+        )
+        self.terse = False
+
+        self._alphabet = None
+        self._results = {}
+
+    @classmethod
+    def from_dictionaries(cls, language_dicts, personal_dicts=None, **kwargs):
+        """Build an emulator that knows the words of hunspell dictionaries.
+
+        The words accepted by the dictionaries are expanded applying their
+        affix rules. The ``WORDCHARS`` of the first dictionary are used to
+        split the words.
+
+        Args:
+            language_dicts (list, str): Language or languages dictionaries
+                (could be defined as files).
+            personal_dicts (str, list): Globs of personal dictionaries. Their
+                words are added to the known ones, except the words prefixed
+                by ``*``, which are forbidden. They are parsed by
+                :py:class:`hunspellcheck.hunspell.personal.PersonalDictionary`,
+                like the rest of backends do.
+            **kwargs: Other optional arguments accepted by
+                :py:class:`hunspellcheck.hunspell.emulator.HunspellEmulator`.
+
+        Raises:
+            FileNotFoundError: If a dictionary can't be found.
+
+        Returns:
+            :py:class:`hunspellcheck.hunspell.emulator.HunspellEmulator`:
+            Emulator instance.
+        """
+        if isinstance(language_dicts, str):
+            language_dicts = language_dicts.split(",")
+
+        words, forbidden_words, keepcase_words, wordchars = set(), set(), set(), None
+        for language_dict in language_dicts:
+            dictionary_filepath = find_dictionary_filepath(language_dict)
+            if dictionary_filepath is None:
+                raise FileNotFoundError(
+                    f"Can't find the hunspell dictionary '{language_dict}'"
+                )
+            (
+                dictionary_words,
+                dictionary_keepcase_words,
+                dictionary_forbidden_words,
+                dictionary_wordchars,
+            ) = expand_dictionary(dictionary_filepath)
+            words.update(dictionary_words)
+            keepcase_words.update(dictionary_keepcase_words)
+            forbidden_words.update(dictionary_forbidden_words)
+            if wordchars is None:
+                wordchars = dictionary_wordchars
+
+        personal_dictionary = load_personal_dictionary(personal_dicts)
+        words.update(personal_dictionary.words)
+        words.difference_update(personal_dictionary.forbidden_words)
+        forbidden_words.update(personal_dictionary.forbidden_words)
+
+        kwargs.setdefault("wordchars", wordchars or "")
+        return cls(
+            words,
+            forbidden_words=forbidden_words,
+            keepcase_words=keepcase_words,
+            **kwargs,
+        )
+
+    def knows(self, word):
+        """Check if a word is correct.
+
+        Args:
+            word (str): Word to check.
+
+        Returns:
+            bool: ``True`` if the word is correct, ``False`` otherwise.
+        """
+        return self._result(word)[0] in "*+-"
+
+    def _is_known(self, word):
+        if word in self.forbidden_words:
+            return False
+        if word in self.words:
+            return True
+        if word.istitle() or word.isupper():
+            for variant in (word.lower(), word.capitalize()):
+                if (
+                    variant in self.words
+                    and variant not in self.keepcase_words
+                    and variant not in self.forbidden_words
+                ):
+                    return True
+        return False
+
+    def _is_compound(self, word):
+        for i in range(3, len(word) - 2):
+            if self._is_known(word[:i]) and self._is_known(word[i:]):
+                return True
+        return False
+
+    def suggest(self, word):
+        """Get the near misses of a word, the known words at one edit of
+        distance from it.
+
+        Args:
+            word (str): Mispelled word.
+
+        Returns:
+            list: Suggested words.
+        """
+        if self._alphabet is None:
+            self._alphabet = sorted({character for w in self.words for character in w})
+
+        near_misses = []
+        for candidate in self._gen_edits(word):
+            if (
+                candidate not in near_misses
+                and candidate != word
+                and self._is_known(candidate)
+            ):
+                near_misses.append(candidate)
+                if len(near_misses) == self.max_near_misses:
+                    break
+        return near_misses
+
+    def _gen_edits(self, word):
+        for i in range(len(word) - 1):
+            yield f"{word[:i]}{word[i + 1]}{word[i]}{word[i + 2:]}"
+        for i in range(len(word)):
+            yield f"{word[:i]}{word[i + 1:]}"
+        for i in range(len(word)):
+            for character in self._alphabet:
+                yield f"{word[:i]}{character}{word[i + 1:]}"
+        for i in range(len(word) + 1):
+            for character in self._alphabet:
+                yield f"{word[:i]}{character}{word[i:]}"
+
+    def _result(self, word):
+        # results are cached by word, the offset is formatted for each line
+        try:
+            return self._results[word]
+        except KeyError:
+            pass
+
+        if word in self.roots and word not in self.forbidden_words:
+            result = ("+", self.roots[word])
+        elif self._is_known(word):
+            result = ("*", None)
+        elif self.compounds and self._is_compound(word):
+            result = ("-", None)
+        else:
+            near_misses = self.suggest(word)
+            result = ("&", near_misses) if near_misses else ("#", None)
+        self._results[word] = result
+        return result
+
+    def gen_words_results(self, line, offset=0):
+        """Check the words of a line.
+
+        Args:
+            line (str): Line to check, without the ``^`` prefix.
+            offset (int): Number added to the index of each word in the
+                reported offsets.
+
+        Yields:
+            tuple: Word, its index inside the line and the result kind
+            (``*``, ``+``, ``-``, ``&`` or ``#``) followed by the root or the
+            near misses of the word.
+        """
+        for match in self.word_regex.finditer(line):
+            word = match.group(0)
+            if word.isdigit():
+                continue
+            kind, data = self._result(word)
+            yield word, match.start() + offset, kind, data
+
+    def process_line(self, line):
+        """Process an input line as ``hunspell -a`` would.
+
+        Args:
+            line (str): Input line, without its trailing newline.
+
+        Returns:
+            list: Output lines, without newlines. Data lines are answered with
+            a line for each word followed by an empty line. Commands are not
+            answered.
+        """
+        if line and line[0] in HUNSPELL_COMMANDS_CHARACTERS:
+            self._process_command(line)
+            return []
+
+        offset = 0
+        if line and line[0] == "^":
+            line, offset = line[1:], 1
+
+        output_lines = []
+        for word, word_offset, kind, data in self.gen_words_results(line, offset):
+            if kind == "&":
+                output_lines.append(
+                    f"& {word} {len(data)} {word_offset}: {', '.join(data)}"
+                )
+            elif kind == "#":
+                output_lines.append(f"# {word} {word_offset}")
+            elif not self.terse:
+                output_lines.append(f"+ {data}" if kind == "+" else kind)
+        output_lines.append("")
+        return output_lines
+
+    def _process_command(self, line):
+        command, argument = line[0], line[1:].strip()
+        if command == "!":
+            self.terse = True
+        elif command == "%":
+            self.terse = False
+        elif command in "*@" and argument:
+            # add the word to the personal dictionary or accept it only for
+            # this session, which are the same in the emulator
+            self.words.add(argument)
+            self.forbidden_words.discard(argument)
+            self._alphabet, self._results = None, {}
+        elif command == "&" and argument:
+            self.words.add(argument.lower())
+            self._alphabet, self._results = None, {}
+
+    def gen_output_lines(self, lines):
+        """Generate the output that ``hunspell -a`` writes for some input.
+
+        Args:
+            lines (iterable): Input lines. A trailing newline is ignored.
+
+        Yields:
+            str: Output lines, ending with a newline, starting with the
+            version banner.
+        """
+        yield f"{HUNSPELL_EMULATOR_VERSION_LINE}\n"
+        for line in lines:
+            for output_line in self.process_line(line.rstrip("\n")):
+                yield f"{output_line}\n"
+
+    def spellcheck(self, content):
+        """Check a text as
+        :py:func:`hunspellcheck.hunspell.spellcheck.hunspell_spellcheck` does,
+        but in-process.
+
+        Args:
+            content (str): Text quoted for hunspell.
+
+        Returns:
+            :py:class:`subprocess.CompletedProcess`: Process whose standard
+            output is the one that ``hunspell -a`` would write.
+        """
+        lines = content.split("\n")
+        if lines[-1] == "":
+            # hunspell doesn't read the empty line after the trailing newline
+            lines.pop()
+        return subprocess.CompletedProcess(
+            ["hunspell", "-a"],
+            0,
+            stdout="".join(self.gen_output_lines(lines)),
+        )
+
+    def spellcheck_words(self, words):
+        """Check word candidates, splitting them in the words that hunspell
+        would find inside them.
+
+        Args:
+            words (iterable): Word candidates to check.
+
+        Returns:
+            dict: Mapping of the candidates in which mispellings have been
+            found to a list of tuples with the mispelled word, its index inside
+            the candidate and its near misses.
+        """
+        mispellings = {}
+        for candidate in words:
+            candidate_mispellings = [
+                (word, index, data or [])
+                for word, index, kind, data in self.gen_words_results(candidate)
+                if kind in "&#"
+            ]
+            if candidate_mispellings:
+                mispellings[candidate] = candidate_mispellings
+        return mispellings
+
+
+def write_hunspell_emulator_executable(directory):
+    """Write a ``hunspell`` program that runs the emulator.
+
+    Prepending the directory to the ``PATH`` environment variable makes
+    hunspellcheck call the emulator instead of hunspell.
+
+    Args:
+        directory (str): Directory in which the program is written.
+
+    Returns:
+        str: Path to the program.
+    """
+    package_parent_directory = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    filepath = os.path.join(directory, "hunspell")
+    with open(filepath, "w") as f:
+        f.write(
+            f"#!{sys.executable}\n"
+            "import sys\n"
+            f"sys.path.insert(0, {package_parent_directory!r})\n"
+            "from hunspellcheck.hunspell.emulator import main\n"
+            "sys.exit(main())\n"
+        )
+    os.chmod(filepath, os.stat(filepath).st_mode | stat.S_IXUSR | stat.S_IXGRP)
+    return filepath
+
+
+def main(args=None):
+    """Command line interface of the emulator, which accepts the options of
+    hunspell used by hunspellcheck.
+
+    Args:
+        args (list): Command line arguments.
+
+    Returns:
+        int: Exit code.
+    """
+    # imported here, as the command line interface is rarely used
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="hunspell", add_help=False)
+    parser.add_argument("-a", action="store_true", dest="pipe")
+    parser.add_argument("-d", dest="language_dicts")
+    parser.add_argument("-p", dest="personal_dict")
+    parser.add_argument("-i", dest="encoding")
+    parser.add_argument("-D", action="store_true", dest="list_dictionaries")
+    parser.add_argument("-v", "--version", action="store_true")
+    opts, _ = parser.parse_known_args(args)
+
+    if opts.version:
+        sys.stdout.write(f"{HUNSPELL_EMULATOR_VERSION_LINE}\n")
+        return 0
+
+    if opts.list_dictionaries:
+        search_paths, dictionaries = discover_dictionaries()
+        sys.stderr.write(
+            "SEARCH PATH:\n"
+            f"{os.pathsep.join(search_paths)}\n"
+            "AVAILABLE DICTIONARIES (path is not mandatory for -d option):\n"
+        )
+        for dictionary in dictionaries:
+            sys.stderr.write(f"{dictionary}\n")
+        if not opts.pipe:
+            return 0
+
+    if opts.encoding:
+        sys.stdin.reconfigure(encoding=opts.encoding)
+        sys.stdout.reconfigure(encoding=opts.encoding)
+
+    try:
+        emulator = HunspellEmulator.from_dictionaries(
+            opts.language_dicts or os.environ.get("DICTIONARY", "en_US"),
+            personal_dicts=opts.personal_dict,
+        )
+    except FileNotFoundError as error:
+        sys.stderr.write(f"{error}\n")
+        return 1
+
+    for i, output_line in enumerate(emulator.gen_output_lines(sys.stdin)):
+        sys.stdout.write(output_line)
+        if i == 0 or output_line == "\n":
+            # hunspell flushes its output after the banner and each line checked
+            sys.stdout.flush()
+    sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
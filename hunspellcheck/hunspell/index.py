@@ -0,0 +1,566 @@
+"""Lookup indexes of the words accepted by Hunspell dictionaries.
+
+The ``.aff`` and ``.dic`` files of a dictionary are parsed and the common
+prefix and suffix rules are expanded into the sorted list of the word forms
+that the dictionary certainly accepts. The list is serialized once per
+dictionary state and loaded in a few milliseconds afterwards, so most of the
+correct words can be checked without leaving Python.
+
+The expansion is conservative: the forms that depend on compounding,
+continuation classes, circumfixes or other complex features are not
+indexed, so words not found in an index must still be checked by hunspell.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+from hunspellcheck.cache import dictionaries_fingerprint, get_cache_directory
+from hunspellcheck.hunspell.dictionaries import find_dictionary_filepath
+from hunspellcheck.hunspell.personal import gen_case_variants
+
+
+DICTIONARY_INDEX_VERSION = 1
+
+# languages with casing rules that Python doesn't follow
+SPECIAL_CASING_LANGUAGES = ("az", "crh", "tr")
+
+
+class AffixRule:
+    """Prefix or suffix rule of an affix file.
+
+    Args:
+        strip (str): Characters removed from the root word.
+        add (str): Characters added to the root word.
+        condition (str): Hunspell condition that the root word must satisfy.
+        suffix (bool): If ``True`` the rule is applied to the end of the words,
+            otherwise to their start.
+        cross_product (bool): Indicates if the rule can be combined with rules
+            of the opposite type.
+        continuation_flags (set): Flags of the affixed forms.
+    """
+
+    def __init__(
+        self,
+        strip,
+        add,
+        condition,
+        suffix,
+        cross_product,
+        continuation_flags,
+    ):
+        self.strip = strip
+        self.add = add
+        self.suffix = suffix
+        self.cross_product = cross_product
+        self.continuation_flags = continuation_flags
+
+        if condition == ".":
+            self.condition_regex = None
+        else:
+            pattern = _condition_to_regex(condition)
+            self.condition_regex = re.compile(
+                f"(?:{pattern})$" if suffix else f"^(?:{pattern})"
+            )
+
+    def apply(self, word):
+        """Apply the rule to a word.
+
+        Args:
+            word (str): Root word.
+
+        Returns:
+            str: Affixed word or ``None`` if the rule is not applicable.
+        """
+        if self.condition_regex is not None and not self.condition_regex.search(word):
+            return None
+        if self.suffix:
+            if not word.endswith(self.strip) or len(self.strip) >= len(word):
+                return None
+            return f"{word[: len(word) - len(self.strip)]}{self.add}"
+        if not word.startswith(self.strip) or len(self.strip) >= len(word):
+            return None
+        return f"{self.add}{word[len(self.strip):]}"
+
+
+class AffixFile:
+    """Data of a Hunspell ``.aff`` file needed to expand dictionary words.
+
+    Args:
+        filepath (str): Path to the ``.aff`` file.
+
+    Attributes:
+        encoding (str): Encoding of the ``.aff`` and ``.dic`` files.
+        flag_type (str): Format of the flags, ``"char"``, ``"long"``,
+            ``"num"`` or ``"UTF-8"``.
+        special_flags (dict): Flags defined by options like ``NEEDAFFIX``
+            or ``FORBIDDENWORD``, mapped to their option name.
+        rules (dict): Affix rules grouped by their flag.
+        special_casing (bool): Indicates if the language has casing rules
+            that are not supported by the index.
+        wordchars (str): Characters other than letters and digits that can
+            be part of words.
+    """
+
+    def __init__(self, filepath):
+        self.encoding = "ISO8859-1"
+        self.flag_type = "char"
+        self.wordchars = ""
+        self.special_flags = {}
+        self.rules = {}
+        self.special_casing = False
+
+        self._flag_aliases = []
+        self._lines = list(self._read_lines(filepath))
+        self._parse()
+
+    def _read_lines(self, filepath):
+        with open(filepath, "rb") as f:
+            content = f.read()
+        for line in content.splitlines():
+            if line.startswith(b"SET "):
+                self.encoding = line.split()[1].decode("ascii")
+                break
+        for line in content.decode(_python_encoding(self.encoding), "replace").split(
+            "\n"
+        ):
+            parts = line.split()
+            if parts and not parts[0].startswith("#"):
+                yield parts
+
+    def _parse(self):
+        lines = iter(self._lines)
+        for parts in lines:
+            option = parts[0]
+            if option == "FLAG" and len(parts) > 1:
+                self.flag_type = parts[1]
+            elif option == "LANG" and len(parts) > 1:
+                language = parts[1].split("_")[0].lower()
+                self.special_casing = language in SPECIAL_CASING_LANGUAGES
+            elif option == "WORDCHARS" and len(parts) > 1:
+                self.wordchars = parts[1]
+            elif option == "CHECKSHARPS":
+                self.special_casing = True
+            elif option == "AF" and len(parts) > 1 and parts[1].isdigit():
+                for _ in range(int(parts[1])):
+                    alias_parts = next(lines, ["AF"])
+                    self._flag_aliases.append(
+                        alias_parts[1] if len(alias_parts) > 1 else ""
+                    )
+            elif (
+                option
+                in (
+                    "NEEDAFFIX",
+                    "PSEUDOROOT",
+                    "ONLYINCOMPOUND",
+                    "FORBIDDENWORD",
+                    "CIRCUMFIX",
+                    "KEEPCASE",
+                )
+                and len(parts) > 1
+            ):
+                if option == "PSEUDOROOT":
+                    option = "NEEDAFFIX"
+                self.special_flags[parts[1]] = option
+            elif option in ("PFX", "SFX") and len(parts) == 4:
+                flag, cross_product, count = parts[1], parts[2] == "Y", parts[3]
+                rules = self.rules.setdefault(flag, [])
+                for _ in range(int(count) if count.isdigit() else 0):
+                    rule_parts = next(lines, [])
+                    if len(rule_parts) < 4 or rule_parts[0] != option:
+                        continue
+                    add, _, continuation_flags = rule_parts[3].partition("/")
+                    rules.append(
+                        AffixRule(
+                            "" if rule_parts[2] == "0" else rule_parts[2],
+                            "" if add == "0" else add,
+                            rule_parts[4] if len(rule_parts) > 4 else ".",
+                            option == "SFX",
+                            cross_product,
+                            self.parse_flags(continuation_flags),
+                        )
+                    )
+
+    def parse_flags(self, flags):
+        """Parse the flags of a word or of the continuation of an affix.
+
+        Args:
+            flags (str): Flags as written in the files.
+
+        Returns:
+            set: Flags.
+        """
+        if not flags:
+            return set()
+        if self._flag_aliases and flags.isdigit():
+            index = int(flags) - 1
+            if 0 <= index < len(self._flag_aliases):
+                flags = self._flag_aliases[index]
+            else:
+                return set()
+        if self.flag_type == "long":
+            return {flags[i : i + 2] for i in range(0, len(flags), 2)}
+        if self.flag_type == "num":
+            return {flag.strip() for flag in flags.split(",") if flag.strip()}
+        return set(flags)
+
+    def flags_with_option(self, flags, *options):
+        """Check if a set of flags includes a flag with some special meaning.
+
+        Args:
+            flags (set): Flags.
+            *options (str): Names of the options that define the special flags.
+
+        Returns:
+            bool: ``True`` if any of the flags is defined by the options.
+        """
+        return any(self.special_flags.get(flag) in options for flag in flags)
+
+
+def gen_dictionary_words(dic_filepath, encoding):
+    """Generates the words and flags defined in a ``.dic`` file.
+
+    Args:
+        dic_filepath (str): Path to the ``.dic`` file.
+        encoding (str): Encoding of the file, as defined in its ``.aff`` file.
+
+    Yields:
+        tuple: Word and its flags, as written in the file.
+    """
+    with open(dic_filepath, encoding=_python_encoding(encoding), errors="replace") as f:
+        next(f, None)  # approximate number of words
+        for line in f:
+            if not line.strip() or line[0] == "\t":
+                continue
+            entry = line.split()[0]
+            slash_index = 0
+            while True:
+                slash_index = entry.find("/", slash_index)
+                if slash_index <= 0 or entry[slash_index - 1] != "\\":
+                    break
+                slash_index += 1
+            if slash_index > 0:
+                word, flags = entry[:slash_index], entry[slash_index + 1 :]
+            else:
+                word, flags = entry, ""
+            yield (word.replace("\\/", "/"), flags)
+
+
+def expand_dictionary(dictionary_filepath):
+    """Expand the words of a dictionary with their affixed forms.
+
+    Args:
+        dictionary_filepath (str): Path to the dictionary without extension.
+
+    Returns:
+        tuple: Sets of the forms accepted by the dictionary, of the forms
+        which must keep their case and of the forbidden forms, and the
+        characters other than letters and digits that can be part of words.
+    """
+    aff = AffixFile(f"{dictionary_filepath}.aff")
+    words, keepcase_words, forbidden_words = set(), set(), set()
+
+    for word, word_flags in gen_dictionary_words(
+        f"{dictionary_filepath}.dic",
+        aff.encoding,
+    ):
+        flags = aff.parse_flags(word_flags)
+        forms = []
+        if not aff.flags_with_option(flags, "NEEDAFFIX", "ONLYINCOMPOUND"):
+            forms.append(word)
+
+        suffixed_forms = []
+        for flag in flags:
+            for rule in aff.rules.get(flag, ()):
+                if aff.flags_with_option(
+                    rule.continuation_flags,
+                    "NEEDAFFIX",
+                    "ONLYINCOMPOUND",
+                    "CIRCUMFIX",
+                ):
+                    continue
+                form = rule.apply(word)
+                if form is None:
+                    continue
+                forms.append(form)
+                if rule.suffix and rule.cross_product:
+                    suffixed_forms.append(form)
+
+        for flag in flags:
+            for rule in aff.rules.get(flag, ()):
+                if rule.suffix or not rule.cross_product:
+                    continue
+                if aff.flags_with_option(
+                    rule.continuation_flags,
+                    "NEEDAFFIX",
+                    "ONLYINCOMPOUND",
+                    "CIRCUMFIX",
+                ):
+                    continue
+                if rule.apply(word) is None:
+                    continue
+                for suffixed_form in suffixed_forms:
+                    form = rule.apply(suffixed_form)
+                    if form is not None:
+                        forms.append(form)
+
+        if aff.flags_with_option(flags, "FORBIDDENWORD"):
+            forbidden_words.update(forms)
+            forbidden_words.add(word)
+        elif aff.flags_with_option(flags, "KEEPCASE"):
+            keepcase_words.update(forms)
+        else:
+            words.update(forms)
+
+    if aff.special_casing:
+        # casing variants are not resolved, so all forms keep their case
+        keepcase_words.update(words)
+        words = set()
+    return (words, keepcase_words, forbidden_words, aff.wordchars)
+
+
+class DictionaryIndex:
+    """Index of the words accepted by a dictionary.
+
+    The words are stored as sorted sequences of UTF-8 encoded lines, searched
+    with a binary search, so loading an index doesn't require to build any
+    Python object for each word.
+
+    Args:
+        words (bytes): Sorted forms whose case can change.
+        keepcase_words (bytes): Sorted forms that must be written exactly.
+        forbidden_words (bytes): Sorted forbidden forms.
+        wordchars (str): Characters other than letters and digits that can
+            be part of words.
+    """
+
+    def __init__(self, words, keepcase_words, forbidden_words, wordchars=""):
+        self.words = words
+        self.keepcase_words = keepcase_words
+        self.forbidden_words = forbidden_words
+        self.wordchars = wordchars
+        self.word_regex = re.compile(
+            r"[^\W_]+(?:[%s]+[^\W_]+)*" % re.escape(wordchars)
+            if wordchars
+            else r"[^\W_]+"
+        )
+
+    @classmethod
+    def from_sets(cls, words, keepcase_words, forbidden_words, wordchars=""):
+        """Build an index from sets of words.
+
+        Args:
+            words (set): Forms whose case can change.
+            keepcase_words (set): Forms that must be written exactly.
+            forbidden_words (set): Forbidden forms.
+            wordchars (str): Characters other than letters and digits that can
+                be part of words.
+
+        Returns:
+            :py:class:`hunspellcheck.hunspell.index.DictionaryIndex`: Index.
+        """
+        return cls(
+            _sorted_lines_blob(words),
+            _sorted_lines_blob(keepcase_words),
+            _sorted_lines_blob(forbidden_words),
+            wordchars=wordchars,
+        )
+
+    @classmethod
+    def load(cls, filepath):
+        """Load an index serialized with
+        :py:meth:`hunspellcheck.hunspell.index.DictionaryIndex.dump`.
+
+        Args:
+            filepath (str): Path to the serialized index.
+
+        Returns:
+            :py:class:`hunspellcheck.hunspell.index.DictionaryIndex`: Index or
+            ``None`` if the file is not a valid index.
+        """
+        with open(filepath, "rb") as f:
+            data = f.read()
+        header, _, data = data.partition(b"\n")
+        signature, _, wordchars = header.partition(b" ")
+        if signature != f"hunspellcheck-index-{DICTIONARY_INDEX_VERSION}".encode():
+            return None
+        blobs = data.split(b"\0")
+        if len(blobs) != 3:
+            return None
+        return cls(*blobs, wordchars=json.loads(wordchars))
+
+    def dump(self, filepath):
+        """Serialize the index in a file.
+
+        The file is written atomically, so concurrent readers never load a
+        partial index.
+
+        Args:
+            filepath (str): Path to the file.
+        """
+        directory = os.path.dirname(filepath)
+        os.makedirs(directory, exist_ok=True)
+        f = tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False)
+        try:
+            with f:
+                f.write(
+                    f"hunspellcheck-index-{DICTIONARY_INDEX_VERSION}"
+                    f" {json.dumps(self.wordchars)}\n".encode()
+                )
+                f.write(
+                    b"\0".join((self.words, self.keepcase_words, self.forbidden_words))
+                )
+            os.replace(f.name, filepath)
+        except BaseException:
+            if os.path.isfile(f.name):
+                os.remove(f.name)
+            raise
+
+    def knows(self, word):
+        """Check if a word is certainly accepted by the dictionary.
+
+        Args:
+            word (str): Word to check.
+
+        Returns:
+            bool: ``True`` if the dictionary accepts the word. ``False`` means
+            that the index can't decide, so the word must be checked by
+            hunspell.
+        """
+        if _sorted_lines_blob_contains(self.forbidden_words, word.encode()):
+            return False
+        for candidate in gen_case_variants(word):
+            if _sorted_lines_blob_contains(self.words, candidate.encode()):
+                return True
+        return _sorted_lines_blob_contains(self.keepcase_words, word.encode())
+
+    def gen_words(self, candidate):
+        """Generates the words that hunspell would check inside a candidate.
+
+        Args:
+            candidate (str): Word candidate, as generated by
+                :py:func:`hunspellcheck.word.gen_word_candidates`.
+
+        Yields:
+            str: Words found inside the candidate.
+        """
+        for match in self.word_regex.finditer(candidate):
+            yield match.group(0)
+
+
+def dictionary_index_filepath(dictionary_filepath, cache_directory=None):
+    """Get the path in which the index of a dictionary is stored.
+
+    The name of the file depends on the state of the dictionary files, so
+    indexes are rebuilt when the dictionaries are updated.
+
+    Args:
+        dictionary_filepath (str): Path to the dictionary without extension.
+        cache_directory (str): Directory in which the indexes are stored. By
+            default, the directory ``indexes`` inside the directory returned
+            by :py:func:`hunspellcheck.cache.get_cache_directory`.
+
+    Returns:
+        str: Path to the index.
+    """
+    if cache_directory is None:
+        cache_directory = get_cache_directory("indexes")
+    fingerprint = hashlib.sha256(
+        json.dumps(
+            [DICTIONARY_INDEX_VERSION, dictionaries_fingerprint([dictionary_filepath])]
+        ).encode()
+    ).hexdigest()
+    return os.path.join(
+        cache_directory,
+        f"{os.path.basename(dictionary_filepath)}-{fingerprint[:32]}.idx",
+    )
+
+
+def load_dictionary_index(language_dict, cache_directory=None):
+    """Load the index of a dictionary, building and serializing it if it
+    doesn't exist yet.
+
+    Args:
+        language_dict (str): Dictionary language or filepath.
+        cache_directory (str): Directory in which the indexes are stored.
+
+    Returns:
+        :py:class:`hunspellcheck.hunspell.index.DictionaryIndex`: Index of the
+        dictionary or ``None`` if the dictionary can't be found.
+    """
+    dictionary_filepath = find_dictionary_filepath(language_dict)
+    if dictionary_filepath is None:
+        return None
+
+    index_filepath = dictionary_index_filepath(
+        dictionary_filepath,
+        cache_directory=cache_directory,
+    )
+    try:
+        index = DictionaryIndex.load(index_filepath)
+    except OSError:
+        index = None
+    if index is None:
+        index = DictionaryIndex.from_sets(*expand_dictionary(dictionary_filepath))
+        try:
+            index.dump(index_filepath)
+        except OSError:  # pragma: no cover
+            pass
+    return index
+
+
+def _python_encoding(encoding):
+    encoding = encoding.strip()
+    if encoding.upper().startswith("MICROSOFT-CP"):
+        return encoding[10:]
+    if encoding.upper() == "ISCII-DEVANAGARI":
+        return "utf-8"
+    return encoding
+
+
+def _condition_to_regex(condition):
+    pattern, i = [], 0
+    while i < len(condition):
+        char = condition[i]
+        if char == "[":
+            end = condition.find("]", i + 1)
+            if end < 0:
+                end = len(condition)
+            content = condition[i + 1 : end]
+            negated = content.startswith("^")
+            if negated:
+                content = content[1:]
+            escaped_content = "".join(re.escape(c) for c in content)
+            pattern.append(f"[{'^' if negated else ''}{escaped_content}]")
+            i = end + 1
+        elif char == ".":
+            pattern.append(".")
+            i += 1
+        else:
+            pattern.append(re.escape(char))
+            i += 1
+    return "".join(pattern)
+
+
+def _sorted_lines_blob(words):
+    return b"\n".join(sorted(word.encode() for word in words if word))
+
+
+def _sorted_lines_blob_contains(blob, word):
+    low, high = 0, len(blob)
+    while low < high:
+        middle = (low + high) // 2
+        start = blob.rfind(b"\n", 0, middle) + 1
+        end = blob.find(b"\n", middle)
+        if end < 0:
+            end = len(blob)
+        line = blob[start:end]
+        if line == word:
+            return True
+        if line < word:
+            low = end + 1
+        else:
+            high = start
+    return False
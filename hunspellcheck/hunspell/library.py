@@ -0,0 +1,348 @@
+"""Spell checking calling the Hunspell shared library through ctypes.
+
+Checking words this way avoids spawning hunspell processes, writing the
+contents to pipes and parsing the text protocol of ``hunspell -a``.
+"""
+
+import ctypes
+import ctypes.util
+import functools
+import re
+import sys
+import threading
+
+from hunspellcheck.hunspell.dictionaries import find_dictionary_filepath
+from hunspellcheck.hunspell.personal import load_personal_dictionary
+from hunspellcheck.hunspell.worker import hunspell_worker_key
+
+
+HUNSPELL_LIBRARY_NAMES = [
+    "hunspell",
+    "hunspell-1.7",
+    "hunspell-1.6",
+    "hunspell-1.5",
+    "hunspell-1.4",
+    "hunspell-1.3",
+]
+
+_HANDLES = {}
+_HANDLES_LOCK = threading.Lock()
+
+
+def _gen_hunspell_library_paths():
+    if sys.platform.startswith("linux"):
+        # the dynamic loader searches the same directories that
+        # ctypes.util.find_library, which spawns ldconfig or gcc to do it
+        for name in HUNSPELL_LIBRARY_NAMES:
+            yield f"lib{name}.so.0"
+            yield f"lib{name}.so"
+        return
+    for name in HUNSPELL_LIBRARY_NAMES:
+        path = ctypes.util.find_library(name)
+        if path is not None:
+            yield path
+
+
+@functools.lru_cache(maxsize=None)
+def load_hunspell_library():
+    """Load the Hunspell shared library, if it is installed.
+
+    Returns:
+        :py:class:`ctypes.CDLL`: Loaded library with the signatures of the
+        functions used declared. ``None`` if the library can't be found.
+    """
+    for path in _gen_hunspell_library_paths():
+        try:
+            library = ctypes.CDLL(path)
+        except OSError:
+            continue
+
+        library.Hunspell_create.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
+        library.Hunspell_create.restype = ctypes.c_void_p
+        library.Hunspell_destroy.argtypes = [ctypes.c_void_p]
+        library.Hunspell_destroy.restype = None
+        library.Hunspell_add_dic.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        library.Hunspell_add_dic.restype = ctypes.c_int
+        library.Hunspell_get_dic_encoding.argtypes = [ctypes.c_void_p]
+        library.Hunspell_get_dic_encoding.restype = ctypes.c_char_p
+        library.Hunspell_spell.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        library.Hunspell_spell.restype = ctypes.c_int
+        library.Hunspell_suggest.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.POINTER(ctypes.c_char_p)),
+            ctypes.c_char_p,
+        ]
+        library.Hunspell_suggest.restype = ctypes.c_int
+        library.Hunspell_free_list.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.POINTER(ctypes.c_char_p)),
+            ctypes.c_int,
+        ]
+        library.Hunspell_free_list.restype = None
+        library.Hunspell_add.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        library.Hunspell_add.restype = ctypes.c_int
+        library.Hunspell_add_with_affix.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_char_p,
+            ctypes.c_char_p,
+        ]
+        library.Hunspell_add_with_affix.restype = ctypes.c_int
+        library.Hunspell_remove.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        library.Hunspell_remove.restype = ctypes.c_int
+        return library
+    return None
+
+
+def hunspell_library_available():
+    """Indicates if the Hunspell shared library can be used.
+
+    Returns:
+        bool: ``True`` if the library has been found, ``False`` otherwise.
+    """
+    return load_hunspell_library() is not None
+
+
+def read_dictionary_wordchars(aff_filepath, encoding):
+    """Read the characters that are part of words defined by the ``WORDCHARS``
+    option of an affix file.
+
+    Args:
+        aff_filepath (str): Path to the ``.aff`` file.
+        encoding (str): Encoding of the file.
+
+    Returns:
+        str: Characters defined by the option, empty if it is not defined.
+    """
+    with open(aff_filepath, encoding=encoding, errors="replace") as f:
+        for line in f:
+            if line.startswith("WORDCHARS"):
+                parts = line.split()
+                return parts[1] if len(parts) > 1 else ""
+    return ""
+
+
+def hunspell_word_regex(wordchars=""):
+    """Build the regular expression that matches the words that hunspell
+    finds inside a text.
+
+    Like the tokenizer of hunspell, words are formed by letters and the
+    characters defined by the ``WORDCHARS`` option of the dictionary, so
+    digits are only part of words if the dictionary defines them as word
+    characters. Other word characters are only accepted between letters.
+
+    Args:
+        wordchars (str): Characters defined by the ``WORDCHARS`` option.
+
+    Returns:
+        :py:class:`re.Pattern`: Compiled regular expression.
+    """
+    digits = "".join(char for char in wordchars if char.isdigit())
+    other_wordchars = "".join(char for char in wordchars if not char.isdigit())
+
+    letter = r"[^\W\d_]"
+    if digits:
+        letter = r"(?:[^\W\d_]|[%s])" % re.escape(digits)
+    if other_wordchars:
+        return re.compile(
+            r"%s+(?:[%s]+%s+)*" % (letter, re.escape(other_wordchars), letter)
+        )
+    return re.compile(f"{letter}+")
+
+
+class HunspellLibrary:
+    """Hunspell instance created by the shared library, loaded with the
+    dictionaries used to check words.
+
+    Instances are not safe to be used by multiple threads at the same time,
+    :py:func:`acquire_hunspell_library` returns them protected by a lock.
+    Once destroyed, their ``handle`` is ``None``.
+
+    Args:
+        language_dicts (list, str): Language or languages dictionaries (could
+            be defined as files) used to check errors.
+        personal_dicts (str, list): Globs of personal dictionaries used to
+            exclude valid words from being notified as errors.
+
+    Raises:
+        FileNotFoundError: If a dictionary can't be found.
+    """
+
+    def __init__(self, language_dicts, personal_dicts=None):
+        if isinstance(language_dicts, str):
+            language_dicts = language_dicts.split(",")
+
+        self.library = load_hunspell_library()
+        self.lock = threading.Lock()
+
+        dictionary_filepaths = []
+        for language_dict in language_dicts:
+            dictionary_filepath = find_dictionary_filepath(language_dict)
+            if dictionary_filepath is None:
+                raise FileNotFoundError(
+                    f"Can't find the hunspell dictionary '{language_dict}'"
+                )
+            dictionary_filepaths.append(dictionary_filepath)
+
+        main_dictionary_filepath = dictionary_filepaths[0]
+        self.handle = self.library.Hunspell_create(
+            f"{main_dictionary_filepath}.aff".encode(),
+            f"{main_dictionary_filepath}.dic".encode(),
+        )
+        self.encoding = self.library.Hunspell_get_dic_encoding(self.handle).decode(
+            "ascii"
+        )
+        for dictionary_filepath in dictionary_filepaths[1:]:
+            self.library.Hunspell_add_dic(
+                self.handle,
+                f"{dictionary_filepath}.dic".encode(),
+            )
+
+        wordchars = read_dictionary_wordchars(
+            f"{main_dictionary_filepath}.aff",
+            self.encoding,
+        )
+        self.word_regex = hunspell_word_regex(wordchars)
+
+        personal_dictionary = load_personal_dictionary(personal_dicts)
+        for word in personal_dictionary.words:
+            model = personal_dictionary.models.get(word)
+            if model is None:
+                self.library.Hunspell_add(self.handle, self._encode(word))
+            else:
+                self.library.Hunspell_add_with_affix(
+                    self.handle,
+                    self._encode(word),
+                    self._encode(model),
+                )
+        for word in personal_dictionary.forbidden_words:
+            self.library.Hunspell_remove(self.handle, self._encode(word))
+
+    def _encode(self, word):
+        return word.encode(self.encoding, errors="replace")
+
+    def destroy(self):
+        """Free the memory used by the Hunspell instance."""
+        if self.handle is not None:
+            self.library.Hunspell_destroy(self.handle)
+            self.handle = None
+
+    def spell(self, word):
+        """Check if a word is correct.
+
+        Words that can't be represented in the encoding of the dictionary
+        are considered correct, as ``hunspell -a`` doesn't report them as
+        mispelled.
+
+        Args:
+            word (str): Word to check.
+
+        Returns:
+            bool: ``True`` if the word is correct, ``False`` otherwise.
+        """
+        try:
+            encoded_word = word.encode(self.encoding)
+        except UnicodeEncodeError:
+            return True
+        return bool(self.library.Hunspell_spell(self.handle, encoded_word))
+
+    def suggest(self, word):
+        """Get the near misses of a word.
+
+        Args:
+            word (str): Mispelled word.
+
+        Returns:
+            list: Suggested words.
+        """
+        suggestions_list = ctypes.POINTER(ctypes.c_char_p)()
+        n_suggestions = self.library.Hunspell_suggest(
+            self.handle,
+            ctypes.byref(suggestions_list),
+            self._encode(word),
+        )
+        try:
+            return [
+                suggestions_list[i].decode(self.encoding, errors="replace")
+                for i in range(n_suggestions)
+            ]
+        finally:
+            self.library.Hunspell_free_list(
+                self.handle,
+                ctypes.byref(suggestions_list),
+                n_suggestions,
+            )
+
+    def spellcheck_words(self, words):
+        """Check word candidates, splitting them in the words that hunspell
+        would find inside them.
+
+        Args:
+            words (iterable): Word candidates to check.
+
+        Returns:
+            dict: Mapping of the candidates in which mispellings have been
+            found to a list of tuples with the mispelled word, its index inside
+            the candidate and its near misses, as returned by
+            :py:func:`hunspellcheck.spellchecker.parse_hunspell_words_output`.
+        """
+        mispellings = {}
+        for candidate in words:
+            candidate_mispellings = []
+            for match in self.word_regex.finditer(candidate):
+                word = match.group(0)
+                if not self.spell(word):
+                    candidate_mispellings.append(
+                        (word, match.start(), self.suggest(word))
+                    )
+            if candidate_mispellings:
+                mispellings[candidate] = candidate_mispellings
+        return mispellings
+
+
+def acquire_hunspell_library(language_dicts, personal_dicts=None):
+    """Get a cached Hunspell instance for some dictionaries, creating it if
+    needed.
+
+    Loading dictionaries is expensive, so instances are kept for the whole
+    life of the process and shared by all the callers that use the same
+    dictionaries. When a personal dictionary is edited, the instance is
+    replaced by a new one. Use :py:func:`clear_hunspell_libraries` to free
+    them.
+
+    Args:
+        language_dicts (list, str): Language or languages dictionaries.
+        personal_dicts (list, str): Personal dictionaries.
+
+    Returns:
+        :py:class:`HunspellLibrary`: Hunspell instance. Its ``lock`` must be
+        held while using it. Another thread can destroy it before the lock is
+        held, when a personal dictionary is edited or the instances are
+        cleared, so its ``handle`` must be checked while holding the lock and
+        the instance acquired again if it is ``None``.
+    """
+    key = hunspell_worker_key(language_dicts, personal_dicts=personal_dicts)
+    with _HANDLES_LOCK:
+        hunspell = _HANDLES.get(key)
+        if hunspell is None:
+            # instances of the same dictionaries with outdated personal ones
+            for stale_key in [k for k in _HANDLES if k[:2] == key[:2]]:
+                stale_hunspell = _HANDLES.pop(stale_key)
+                with stale_hunspell.lock:
+                    stale_hunspell.destroy()
+            hunspell = HunspellLibrary(language_dicts, personal_dicts=personal_dicts)
+            _HANDLES[key] = hunspell
+    return hunspell
+
+
+def clear_hunspell_libraries():
+    """Free all the Hunspell instances cached by
+    :py:func:`acquire_hunspell_library`.
+
+    Must be called after changing the content of the language dictionaries.
+    Changes in personal dictionaries are detected automatically.
+    """
+    with _HANDLES_LOCK:
+        for hunspell in _HANDLES.values():
+            with hunspell.lock:
+                hunspell.destroy()
+        _HANDLES.clear()
@@ -0,0 +1,404 @@
+"""Personal dictionaries passed to hunspell.
+
+Hunspell only accepts one personal dictionary, so when multiple are defined
+their entries are merged in a compound dictionary. Compound dictionaries are
+stored in the user cache directory under a fingerprint of the files merged,
+so they are built once and reused by all the hunspell processes spawned
+until one of the files changes.
+
+Personal dictionaries are also loaded in memory as
+:py:class:`hunspellcheck.hunspell.personal.PersonalDictionary` instances, so
+the words that they accept can be filtered before being sent to hunspell.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from hunspellcheck.cache import get_cache_directory, personal_dicts_fingerprint
+
+
+COMPOUND_PERSONAL_DICT_VERSION = 1
+
+_PERSONAL_DICTIONARIES = {}
+_PERSONAL_DICTIONARIES_LOCK = threading.Lock()
+
+
+def gen_personal_dicts_filepaths(personal_dicts):
+    """Generates the files matched by globs of personal dictionaries.
+
+    Args:
+        personal_dicts (list, str): Globs of personal dictionaries.
+
+    Yields:
+        str: Path to each personal dictionary, only once even if it is matched
+        by multiple globs.
+    """
+    if not personal_dicts:
+        return
+    if isinstance(personal_dicts, str):
+        personal_dicts = [personal_dicts]
+
+    filepaths = set()
+    for personal_dict_glob in personal_dicts:
+        for personal_dict in sorted(glob.glob(personal_dict_glob)):
+            if personal_dict not in filepaths:
+                filepaths.add(personal_dict)
+                yield personal_dict
+
+
+def personal_dicts_stat_fingerprint(personal_dicts):
+    """Identify the state of the files matched by globs of personal
+    dictionaries without reading them.
+
+    Args:
+        personal_dicts (list, str): Globs of personal dictionaries.
+
+    Returns:
+        list: Path, size and modification time of each personal dictionary.
+    """
+    fingerprint = []
+    for filepath in gen_personal_dicts_filepaths(personal_dicts):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            continue
+        fingerprint.append([filepath, stat.st_size, stat.st_mtime_ns])
+    return fingerprint
+
+
+def compound_personal_dict_filepath(personal_dicts, cache_directory=None):
+    """Get the path in which the compound of some personal dictionaries is
+    stored.
+
+    The name of the file depends on the paths and the contents of the files
+    merged, so the compound dictionary is rebuilt when any of them is edited,
+    added or removed, even if its size and modification time are preserved.
+
+    Args:
+        personal_dicts (list, str): Globs of personal dictionaries.
+        cache_directory (str): Directory in which the compound dictionaries
+            are stored. By default, the directory ``personal`` inside the
+            directory returned by
+            :py:func:`hunspellcheck.cache.get_cache_directory`.
+
+    Returns:
+        str: Path to the compound dictionary.
+    """
+    if cache_directory is None:
+        cache_directory = get_cache_directory("personal")
+
+    fingerprint = hashlib.sha256(
+        json.dumps(
+            [
+                COMPOUND_PERSONAL_DICT_VERSION,
+                personal_dicts_fingerprint(personal_dicts),
+            ]
+        ).encode()
+    ).hexdigest()
+    return os.path.join(cache_directory, f"{fingerprint[:32]}.dic")
+
+
+def merge_personal_dicts(personal_dicts):
+    """Merge the entries of personal dictionaries.
+
+    Entries are deduplicated and sorted, placing forbidden words (prefixed by
+    an asterisk) after the rest so they take precedence over the words added
+    by other dictionaries, like hunspell does when they come later. Entries
+    are handled as bytes, so the encoding of the dictionaries is preserved.
+
+    Args:
+        personal_dicts (list, str): Globs of personal dictionaries.
+
+    Returns:
+        bytes: Content of the compound dictionary.
+    """
+    entries = set()
+    for filepath in gen_personal_dicts_filepaths(personal_dicts):
+        with open(filepath, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entries.add(line)
+    if not entries:
+        return b""
+    sorted_entries = sorted(entries, key=lambda entry: (entry[:1] == b"*", entry))
+    return b"\n".join(sorted_entries) + b"\n"
+
+
+def build_compound_personal_dict(
+    personal_dicts,
+    cache_directory=None,
+    max_age=2592000,
+):
+    """Get a compound dictionary with the entries of some personal
+    dictionaries, building it only if it has not been built yet.
+
+    Each time that a new compound dictionary is built, those not used in
+    ``max_age`` seconds are removed, which sweeps the compounds of files that
+    have been changed.
+
+    Args:
+        personal_dicts (list, str): Globs of personal dictionaries.
+        cache_directory (str): Directory in which the compound dictionaries
+            are stored. By default, the directory ``personal`` inside the
+            directory returned by
+            :py:func:`hunspellcheck.cache.get_cache_directory`, falling back
+            to a directory inside the temporary directory of the system if
+            the cache directory can't be written.
+        max_age (int): Maximum time in seconds that a compound dictionary is
+            kept without being used.
+
+    Returns:
+        str: Path to the compound dictionary.
+    """
+    if cache_directory is not None:
+        return _build_compound_personal_dict(personal_dicts, cache_directory, max_age)
+    try:
+        return _build_compound_personal_dict(
+            personal_dicts,
+            get_cache_directory("personal"),
+            max_age,
+        )
+    except OSError:
+        return _build_compound_personal_dict(
+            personal_dicts,
+            os.path.join(tempfile.gettempdir(), "hunspellcheck", "personal"),
+            max_age,
+        )
+
+
+def _build_compound_personal_dict(personal_dicts, cache_directory, max_age):
+    filepath = compound_personal_dict_filepath(
+        personal_dicts,
+        cache_directory=cache_directory,
+    )
+    try:
+        os.utime(filepath)
+    except FileNotFoundError:
+        pass
+    else:
+        return filepath
+
+    os.makedirs(cache_directory, exist_ok=True)
+    f = tempfile.NamedTemporaryFile(dir=cache_directory, suffix=".tmp", delete=False)
+    try:
+        with f:
+            f.write(merge_personal_dicts(personal_dicts))
+        os.replace(f.name, filepath)
+    except BaseException:
+        if os.path.isfile(f.name):
+            os.remove(f.name)
+        raise
+
+    evict_compound_personal_dicts(cache_directory, max_age=max_age)
+    return filepath
+
+
+def evict_compound_personal_dicts(cache_directory=None, max_age=2592000):
+    """Remove the compound dictionaries not used in ``max_age`` seconds.
+
+    Args:
+        cache_directory (str): Directory in which the compound dictionaries
+            are stored.
+        max_age (int): Maximum time in seconds that a compound dictionary is
+            kept without being used.
+    """
+    if cache_directory is None:
+        cache_directory = get_cache_directory("personal")
+    try:
+        entries = list(os.scandir(cache_directory))
+    except FileNotFoundError:
+        return
+
+    now = time.time()
+    for entry in entries:
+        if not entry.name.endswith(".dic"):
+            continue
+        try:
+            if now - entry.stat().st_mtime > max_age:
+                os.remove(entry.path)
+        except OSError:  # pragma: no cover
+            pass
+
+
+def gen_case_variants(word):
+    """Generates the forms in which a word can be found in a dictionary.
+
+    Like hunspell, a word in uppercase can be found in lowercase or
+    capitalized, and a capitalized word can be found in lowercase.
+
+    Args:
+        word (str): Word looked up.
+
+    Yields:
+        str: The word itself followed by its dictionary forms.
+    """
+    yield word
+    if word.isupper():
+        yield word.lower()
+        yield word.capitalize()
+    elif word[:1].isupper() and word[1:] == word[1:].lower():
+        yield word.lower()
+
+
+class PersonalDictionary:
+    """Words accepted and forbidden by personal dictionaries.
+
+    Entries are parsed with the syntax of hunspell personal dictionaries:
+    one word per line, optionally followed by a slash and the model word
+    from which it takes its affixes (``word/model``), or prefixed by an
+    asterisk to forbid it (``*word``). Forbidden words take precedence over
+    accepted ones, no matter the order of the entries. The affixed forms of
+    the words are left to hunspell, so only the words and their models are
+    stored.
+
+    Args:
+        words (iterable): Words accepted.
+        forbidden_words (iterable): Words forbidden.
+        fingerprint (list): State of the files from which the words have been
+            read, as returned by
+            :py:func:`hunspellcheck.hunspell.personal.personal_dicts_stat_fingerprint`.
+        models (dict): Accepted words mapped to the model words from which
+            they take their affixes.
+
+    Attributes:
+        words (frozenset): Words accepted, excluding the forbidden ones.
+        forbidden_words (frozenset): Words forbidden.
+        models (dict): Accepted words mapped to their model words.
+    """
+
+    __slots__ = ("words", "forbidden_words", "fingerprint", "models")
+
+    def __init__(self, words=(), forbidden_words=(), fingerprint=None, models=None):
+        self.forbidden_words = frozenset(forbidden_words)
+        self.words = frozenset(words) - self.forbidden_words
+        self.fingerprint = fingerprint
+        self.models = {
+            word: model for word, model in (models or {}).items() if word in self.words
+        }
+
+    @classmethod
+    def from_files(cls, personal_dicts):
+        """Read personal dictionaries.
+
+        Args:
+            personal_dicts (list, str): Globs of personal dictionaries.
+
+        Returns:
+            :py:class:`hunspellcheck.hunspell.personal.PersonalDictionary`:
+            Words of the dictionaries.
+        """
+        fingerprint = personal_dicts_stat_fingerprint(personal_dicts)
+        words, forbidden_words, models = set(), set(), {}
+        for filepath, _, _ in fingerprint:
+            with open(filepath) as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith("*"):
+                        forbidden_words.add(line[1:].split("/", 1)[0])
+                    elif line:
+                        word, _, model = line.partition("/")
+                        words.add(word)
+                        if model:
+                            models[word] = model
+        words.discard("")
+        forbidden_words.discard("")
+        return cls(words, forbidden_words, fingerprint=fingerprint, models=models)
+
+    def __bool__(self):
+        return bool(self.words or self.forbidden_words)
+
+    def knows(self, word):
+        """Check if a word is accepted by the personal dictionaries.
+
+        Like hunspell, lowercase entries also accept the word capitalized or
+        in uppercase, and capitalized entries accept it in uppercase.
+
+        Args:
+            word (str): Word to check.
+
+        Returns:
+            bool: ``True`` if the word is accepted. ``False`` means that it
+            must be checked by hunspell.
+        """
+        if not self.words:
+            return False
+        variants = tuple(gen_case_variants(word))
+        return not any(variant in self.forbidden_words for variant in variants) and any(
+            variant in self.words for variant in variants
+        )
+
+    def filter_words(self, words):
+        """Discard the words accepted by the personal dictionaries.
+
+        Only alphabetic words are discarded, because hunspell could split the
+        rest in multiple words.
+
+        Args:
+            words (iterable): Word candidates.
+
+        Returns:
+            list: Candidates that must be checked by hunspell.
+        """
+        if not self.words:
+            return list(words)
+        return [word for word in words if not (word.isalpha() and self.knows(word))]
+
+    def filter_mispellings(self, mispellings):
+        """Discard the mispellings of words accepted by the personal
+        dictionaries.
+
+        Args:
+            mispellings (dict): Mapping of candidates to lists of tuples with
+                the mispelled word, its index inside the candidate and its
+                near misses.
+
+        Returns:
+            dict: Mispellings that are not accepted by the personal
+            dictionaries.
+        """
+        if not self.words:
+            return mispellings
+        filtered_mispellings = {}
+        for candidate, candidate_mispellings in mispellings.items():
+            candidate_mispellings = [
+                mispelling
+                for mispelling in candidate_mispellings
+                if not self.knows(mispelling[0])
+            ]
+            if candidate_mispellings:
+                filtered_mispellings[candidate] = candidate_mispellings
+        return filtered_mispellings
+
+
+def load_personal_dictionary(personal_dicts):
+    """Get the words of personal dictionaries, reading them only the first
+    time or when they have changed.
+
+    Args:
+        personal_dicts (list, str): Globs of personal dictionaries.
+
+    Returns:
+        :py:class:`hunspellcheck.hunspell.personal.PersonalDictionary`: Words
+        of the dictionaries, shared by all the callers while the files don't
+        change.
+    """
+    if not personal_dicts:
+        return PersonalDictionary()
+    key = (
+        (personal_dicts,) if isinstance(personal_dicts, str) else tuple(personal_dicts)
+    )
+
+    fingerprint = personal_dicts_stat_fingerprint(personal_dicts)
+    with _PERSONAL_DICTIONARIES_LOCK:
+        personal_dictionary = _PERSONAL_DICTIONARIES.get(key)
+    if personal_dictionary is None or personal_dictionary.fingerprint != fingerprint:
+        personal_dictionary = PersonalDictionary.from_files(personal_dicts)
+        with _PERSONAL_DICTIONARIES_LOCK:
+            _PERSONAL_DICTIONARIES[key] = personal_dictionary
+    return personal_dictionary
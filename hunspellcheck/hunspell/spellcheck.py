@@ -1,21 +1,20 @@
 """Spell checking system calls to Hunspell."""
 
-import glob
-import os
 import subprocess
-import tempfile
+import threading
 
+from hunspellcheck.hunspell.personal import build_compound_personal_dict
 
-def hunspell_spellcheck(
-    content,
-    language_dicts,
-    personal_dicts=None,
-    encoding=None,
-):
-    """Call hunspell for spellchecing.
+
+def build_hunspell_command(language_dicts, personal_dicts=None, encoding=None):
+    """Build the command used to call hunspell in pipe mode.
+
+    If multiple personal dictionaries are passed, their entries are merged in
+    a compound dictionary built by
+    :py:func:`hunspellcheck.hunspell.personal.build_compound_personal_dict`,
+    which is cached and reused by the next commands.
 
     Args:
-        content (str): Content to check for words not included in dictionaries.
         language_dicts (list, str): Language or languages dictionaries (could
             be defined as files) used to check errors.
         personal_dicts (str): Personal dictionary used to exclude valid words
@@ -24,48 +23,54 @@ def hunspell_spellcheck(
             option ``-i`` will be passed to hunspell system call.
 
     Returns:
-        str: Hunspell standard output.
+        list: Command to execute.
     """
     if not isinstance(language_dicts, str):
         language_dicts = ",".join(language_dicts)
 
     command = ["hunspell", "-d", language_dicts, "-a"]
 
-    temporal_personal_dict_filename = None
     if personal_dicts:
         if isinstance(personal_dicts, str):
             command.extend(["-p", personal_dicts])
+        elif len(personal_dicts) == 1:
+            # only one dictionary, no need for composition
+            command.extend(["-p", personal_dicts[0]])
         else:
-            if len(personal_dicts) == 1:
-                # only one dictionary, no need for composition
-                command.extend(["-p", personal_dicts[0]])
-            else:
-                # compound one dictionary with others content
-                hunspellcheck_tempdir = os.path.join(
-                    tempfile.gettempdir(),
-                    "hunspellcheck",
-                )
-                if not os.path.isdir(hunspellcheck_tempdir):
-                    os.mkdir(hunspellcheck_tempdir)
-
-                temporal_personal_dict_filename = tempfile.NamedTemporaryFile(
-                    dir=hunspellcheck_tempdir
-                ).name
-                if os.path.isfile(temporal_personal_dict_filename):  # pragma: no cover
-                    os.remove(temporal_personal_dict_filename)
-                os.mknod(temporal_personal_dict_filename)
-                for personal_dict_glob in personal_dicts:
-                    for personal_dict in glob.glob(personal_dict_glob):
-                        with open(
-                            temporal_personal_dict_filename, "a"
-                        ) as compound_dict_f, open(personal_dict) as partial_dict_f:
-                            compound_dict_f.write(f"{partial_dict_f.read()}\n")
-                command.extend(["-p", temporal_personal_dict_filename])
+            command.extend(["-p", build_compound_personal_dict(personal_dicts)])
 
     if encoding:
-        command.extend(["-i"], encoding)
+        command.extend(["-i", encoding])
+
+    return command
 
-    response = subprocess.run(
+
+def hunspell_spellcheck(
+    content,
+    language_dicts,
+    personal_dicts=None,
+    encoding=None,
+):
+    """Call hunspell for spellchecing.
+
+    Args:
+        content (str): Content to check for words not included in dictionaries.
+        language_dicts (list, str): Language or languages dictionaries (could
+            be defined as files) used to check errors.
+        personal_dicts (str): Personal dictionary used to exclude valid words
+            from being notified as errors.
+        encoding (str): Input encoding passed to Hunspell. If is defined, the
+            option ``-i`` will be passed to hunspell system call.
+
+    Returns:
+        str: Hunspell standard output.
+    """
+    command = build_hunspell_command(
+        language_dicts,
+        personal_dicts=personal_dicts,
+        encoding=encoding,
+    )
+    return subprocess.run(
         command,
         text=True,
         input=content,
@@ -73,7 +78,107 @@ def hunspell_spellcheck(
         check=True,
     )
 
-    if temporal_personal_dict_filename is not None:
-        os.remove(temporal_personal_dict_filename)
 
-    return response
+class _HunspellPipeOutput:
+    """Standard output of a hunspell process which records if it has been
+    read until its end.
+    """
+
+    def __init__(self, stdout):
+        self._stdout = stdout
+        self.eof = False
+
+    def __iter__(self):
+        yield from self._stdout
+        self.eof = True
+
+    def readline(self):
+        line = self._stdout.readline()
+        if not line:
+            self.eof = True
+        return line
+
+    def close(self):
+        self._stdout.close()
+
+
+class HunspellPipe:
+    """``hunspell -a`` process whose standard input is written from a separate
+    thread while the caller reads its standard output, so the content to check
+    never needs to be fully loaded in memory.
+
+    The pipes between both processes limit how far the writer can advance
+    ahead of the reader, so the memory used is bounded no matter how large the
+    content is.
+
+    Args:
+        lines (iterable): Lines to check, quoted for hunspell.
+        language_dicts (list, str): Language or languages dictionaries (could
+            be defined as files) used to check errors.
+        personal_dicts (str): Personal dictionary used to exclude valid words
+            from being notified as errors.
+        encoding (str): Input encoding passed to Hunspell.
+
+    Attributes:
+        stdout (object): Hunspell standard output, which can be iterated by
+            lines or read with ``readline``.
+    """
+
+    def __init__(self, lines, language_dicts, personal_dicts=None, encoding=None):
+        self.command = build_hunspell_command(
+            language_dicts,
+            personal_dicts=personal_dicts,
+            encoding=encoding,
+        )
+        self.process = subprocess.Popen(
+            self.command,
+            text=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self.stdout = _HunspellPipeOutput(self.process.stdout)
+
+        self._exception = None
+        self._writer = threading.Thread(target=self._write, args=(lines,))
+        self._writer.daemon = True
+        self._writer.start()
+
+    def _write(self, lines):
+        try:
+            for line in lines:
+                self.process.stdin.write(f"{line}\n")
+        except BrokenPipeError:  # pragma: no cover
+            # hunspell has been stopped
+            pass
+        except Exception as exc:
+            self._exception = exc
+        finally:
+            try:
+                self.process.stdin.close()
+            except BrokenPipeError:  # pragma: no cover
+                pass
+
+    def close(self):
+        """Wait for the hunspell process and clean its resources.
+
+        If hunspell is still running because its output has not been fully
+        read, it is killed. If its output has been read until the end, the
+        process is waited, so its exit status is checked even if hunspell
+        stopped before writing all the output expected.
+
+        Raises:
+            Exception: Any error raised while iterating the lines to write.
+            subprocess.CalledProcessError: If hunspell exited with an error.
+        """
+        killed = False
+        if not self.stdout.eof and self.process.poll() is None:
+            self.process.kill()
+            killed = True
+        returncode = self.process.wait()
+        self._writer.join()
+        self.stdout.close()
+
+        if self._exception is not None:
+            raise self._exception
+        if returncode and not killed:
+            raise subprocess.CalledProcessError(returncode, self.command)
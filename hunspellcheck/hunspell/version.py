@@ -2,7 +2,47 @@
 
 import os
 import re
+import shutil
 import subprocess
+import threading
+
+from hunspellcheck.hunspell import c_locale_environment
+
+
+_HUNSPELL_VERSION_LINES = {}
+_HUNSPELL_VERSION_LINES_LOCK = threading.Lock()
+
+
+def get_hunspell_version_line():
+    """Get the first line printed by ``hunspell --version``.
+
+    The output is memoized for each hunspell program path and modification
+    time, so hunspell is only executed again if it is replaced or updated.
+
+    Returns:
+        str: Version line.
+    """
+    hunspell_path = shutil.which("hunspell")
+    try:
+        key = (hunspell_path, os.stat(hunspell_path).st_mtime_ns)
+    except (OSError, TypeError):
+        key = None
+
+    with _HUNSPELL_VERSION_LINES_LOCK:
+        if key is not None and key in _HUNSPELL_VERSION_LINES:
+            return _HUNSPELL_VERSION_LINES[key]
+
+        output = subprocess.run(
+            ["hunspell", "--version"],
+            stdout=subprocess.PIPE,
+            text=True,
+            env=c_locale_environment(),
+        )
+
+        version_line = output.stdout.splitlines()[0]
+        if key is not None:
+            _HUNSPELL_VERSION_LINES[key] = version_line
+        return version_line
 
 
 def get_hunspell_version(hunspell=True, ispell=True):
@@ -22,21 +62,7 @@ def get_hunspell_version(hunspell=True, ispell=True):
             "At least one of optional arguments 'hunspell' or 'ispell' must be true."
         )
 
-    previous_env_lang = os.environ.get("LANG", None)
-    os.environ["LANG"] = "C"
-
-    output = subprocess.run(
-        ["hunspell", "--version"],
-        stdout=subprocess.PIPE,
-        text=True,
-    )
-
-    if previous_env_lang is None:
-        del os.environ["LANG"]
-    else:
-        os.environ["LANG"] = previous_env_lang
-
-    version_line = output.stdout.splitlines()[0]
+    version_line = get_hunspell_version_line()
 
     response = {}
 
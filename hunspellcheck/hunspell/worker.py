@@ -0,0 +1,199 @@
+"""Persistent Hunspell processes reused between spellchecks."""
+
+import subprocess
+import threading
+
+from hunspellcheck.hunspell.personal import personal_dicts_stat_fingerprint
+from hunspellcheck.hunspell.spellcheck import build_hunspell_command
+
+
+_WORKERS = {}
+_WORKERS_LOCK = threading.Lock()
+
+
+def hunspell_worker_key(language_dicts, personal_dicts=None, encoding=None):
+    """Build the key which identifies a worker in the workers registry.
+
+    Args:
+        language_dicts (list, str): Language or languages dictionaries.
+        personal_dicts (list, str): Personal dictionaries.
+        encoding (str): Input encoding passed to Hunspell.
+
+    The key includes the state of the files of the personal dictionaries, so
+    a new worker is used when they are edited.
+
+    Returns:
+        tuple: Hashable key for the arguments.
+    """
+    if isinstance(language_dicts, str):
+        language_dicts = [language_dicts]
+    if not personal_dicts:
+        personal_dicts = []
+    elif isinstance(personal_dicts, str):
+        personal_dicts = [personal_dicts]
+    return (
+        tuple(language_dicts),
+        tuple(personal_dicts),
+        encoding,
+        tuple(
+            tuple(personal_dict_state)
+            for personal_dict_state in personal_dicts_stat_fingerprint(personal_dicts)
+        ),
+    )
+
+
+class HunspellWorker:
+    """Long-lived ``hunspell -a`` process which checks content line by line
+    through its standard input and output, so the cost of spawning the process
+    and loading the dictionaries is only paid once.
+
+    Args:
+        language_dicts (list, str): Language or languages dictionaries (could
+            be defined as files) used to check errors.
+        personal_dicts (str, list): Personal dictionaries used to exclude valid
+            words from being notified as errors.
+        encoding (str): Input encoding passed to Hunspell.
+    """
+
+    def __init__(self, language_dicts, personal_dicts=None, encoding=None):
+        self.key = hunspell_worker_key(
+            language_dicts,
+            personal_dicts=personal_dicts,
+            encoding=encoding,
+        )
+        self.language_dicts = language_dicts
+        self.personal_dicts = personal_dicts
+        self.encoding = encoding
+
+        self.command = None
+        self.process = None
+        self.banner = None
+        self.users = 0
+
+        self._lock = threading.Lock()
+
+    @property
+    def closed(self):
+        """bool: Indicates if the hunspell process is not running."""
+        return self.process is None or self.process.poll() is not None
+
+    def open(self):
+        """Start the hunspell process and read its version banner."""
+        self.command = build_hunspell_command(
+            self.language_dicts,
+            personal_dicts=self.personal_dicts,
+            encoding=self.encoding,
+        )
+        self.process = subprocess.Popen(
+            self.command,
+            text=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self.banner = self._readline()
+
+    def close(self):
+        """Stop the hunspell process."""
+        with self._lock:
+            if self.process is not None:
+                if self.process.poll() is None:
+                    self.process.stdin.close()
+                    try:
+                        self.process.wait(timeout=5)
+                    except subprocess.TimeoutExpired:  # pragma: no cover
+                        self.process.kill()
+                        self.process.wait()
+                self.process.stdout.close()
+                self.process = None
+
+    def _readline(self):
+        line = self.process.stdout.readline()
+        if not line:
+            returncode = self.process.wait()
+            raise subprocess.CalledProcessError(returncode, self.command)
+        return line
+
+    def spellcheck(self, content):
+        """Check a content against the running hunspell process.
+
+        Each line of the content is written to hunspell, reading its response
+        until the empty line that indicates that the line has been checked.
+
+        Args:
+            content (str): Content to check, quoted for hunspell.
+
+        Returns:
+            :py:class:`subprocess.CompletedProcess`: Object whose ``stdout``
+            property is the same as a single ``hunspell -a`` call checking the
+            content would output.
+        """
+        lines = content.split("\n")
+        if not lines[-1]:
+            lines.pop()
+
+        with self._lock:
+            if self.closed:
+                self.open()
+
+            output = [self.banner]
+            for line in lines:
+                self.process.stdin.write(f"{line}\n")
+                self.process.stdin.flush()
+
+                hunspell_line = self._readline()
+                while hunspell_line != "\n":
+                    output.append(hunspell_line)
+                    hunspell_line = self._readline()
+                output.append(hunspell_line)
+
+        return subprocess.CompletedProcess(self.command, 0, stdout="".join(output))
+
+
+def acquire_hunspell_worker(language_dicts, personal_dicts=None, encoding=None):
+    """Get the running worker for the given arguments, starting it if needed.
+
+    Workers are shared between all the callers that use the same languages,
+    personal dictionaries and encoding. Each call to this function must be
+    paired with a call to :py:func:`release_hunspell_worker`.
+
+    Args:
+        language_dicts (list, str): Language or languages dictionaries.
+        personal_dicts (list, str): Personal dictionaries.
+        encoding (str): Input encoding passed to Hunspell.
+
+    Returns:
+        :py:class:`HunspellWorker`: Hunspell worker.
+    """
+    key = hunspell_worker_key(
+        language_dicts,
+        personal_dicts=personal_dicts,
+        encoding=encoding,
+    )
+    with _WORKERS_LOCK:
+        worker = _WORKERS.get(key)
+        if worker is None:
+            worker = HunspellWorker(
+                language_dicts,
+                personal_dicts=personal_dicts,
+                encoding=encoding,
+            )
+            _WORKERS[key] = worker
+        worker.users += 1
+    return worker
+
+
+def release_hunspell_worker(worker):
+    """Release a worker acquired with :py:func:`acquire_hunspell_worker`.
+
+    When a worker has no more users, its hunspell process is stopped.
+
+    Args:
+        worker (:py:class:`HunspellWorker`): Hunspell worker to release.
+    """
+    with _WORKERS_LOCK:
+        worker.users -= 1
+        if worker.users > 0:
+            return
+        if _WORKERS.get(worker.key) is worker:
+            del _WORKERS[worker.key]
+    worker.close()
@@ -3,24 +3,38 @@
 This module contains all the spellchecking logic.
 """
 
-from hunspellcheck.exceptions import Unreachable
-from hunspellcheck.hunspell.spellcheck import hunspell_spellcheck
-from hunspellcheck.word import looks_like_a_word_creator
+import collections
+import itertools
+import locale
+import mmap
+import os
 
+from hunspellcheck.backends import SubprocessBackend, create_backend
+from hunspellcheck.cache import spellcheck_fingerprint
+from hunspellcheck.error import (
+    HunspellErrorColumns,
+    HunspellFileContent,
+    HunspellMappedFileContent,
+    included_error_record_class,
+)
+from hunspellcheck.exceptions import Unreachable
+from hunspellcheck.hunspell.personal import load_personal_dictionary
+from hunspellcheck.hunspell.spellcheck import HunspellPipe
+from hunspellcheck.hunspell.worker import hunspell_worker_key
+from hunspellcheck.word import gen_word_candidates, looks_like_a_word_creator
 
-ERROR_FIELDS = [
-    "filename",
-    "line_number",
-    "word",
-    "word_line_index",
-    "line",
-    "text",
-    "error_number",
-    "near_misses",
-]
 
 DEFAULT_LOOKS_LIKE_A_WORD = looks_like_a_word_creator()
 
+# options of the spellchecker that need the whole contents, mapped to their
+# default values, which are the only ones accepted checking files as streams
+STREAMS_UNSUPPORTED_OPTIONS = {
+    "jobs": 1,
+    "deduplicate": False,
+    "words_cache": None,
+    "results_cache": None,
+}
+
 
 class HunspellChecker:
     """Main spellchecking interface of hunspellcheck.
@@ -31,7 +45,11 @@ class HunspellChecker:
         languages (list, str): Languages against will be checked the contents.
         personal_dicts (str, list): Globs of files which would be dictionaries
             with custom words to ignore from being triggered as positives. Can
-            be globs or files, as string or list of strings.
+            be globs or files, as string or list of strings. When the words
+            are checked individually (deduplicating them, caching them or
+            using a backend other than the subprocess one), the words of the
+            personal dictionaries are discarded before being checked. The
+            dictionaries are read again when they change.
         looks_like_a_word (types.FunctionType): Function to filter the positive
             words from being considered positives. Takes a possible word string
             and returns if the value could be considered a word to be checked
@@ -40,6 +58,69 @@ class HunspellChecker:
             used with all its arguments by default to build a basic validator.
         encoding (str): Input encoding. If not defined, it will be autodetected
             by hunspell.
+        jobs (int): Number of hunspell processes run concurrently checking
+            the contents. The files are distributed between them and the
+            errors are yielded in the same order that checking the files with
+            only one process. If ``None``, the number of CPUs of the system
+            will be used.
+        deduplicate (bool): Split the contents in words before checking them
+            and send each distinct word to hunspell only once, mapping the
+            mispellings found back to all their occurrences. The errors found
+            are the same, but hunspell has much less work to do when the
+            contents repeat a lot of words, like natural language texts do.
+            ``jobs`` is ignored if enabled.
+        words_cache (:py:class:`hunspellcheck.cache.WordsCache`): Cache in
+            which the mispellings found by hunspell in each word are stored,
+            so repeated words in successive checks are not sent to hunspell
+            again. The same cache can be shared between multiple
+            spellcheckers. If defined, the words are deduplicated as with
+            ``deduplicate=True``.
+        results_cache (:py:class:`hunspellcheck.cache.ResultsCache`): Cache in
+            which the errors found in each file are stored on disk, keyed by
+            the content of the file and the configuration of the spellchecker.
+            Files whose content has not changed since a previous check are
+            not sent to hunspell again.
+        backend (str, :py:class:`hunspellcheck.backends.HunspellBackend`):
+            Engine used to check the words. ``"library"`` calls the Hunspell
+            shared library through ctypes, so no processes are spawned and no
+            output needs to be parsed. ``"subprocess"`` calls the ``hunspell``
+            program, and is the one used if not defined. The library must be
+            requested explicitly because it doesn't support ``jobs`` nor
+            persistent workers. ``"python"`` looks up the
+            words in an index of the forms accepted by the first language
+            dictionary, built parsing its ``.aff`` and ``.dic`` files and
+            stored in the user cache directory, and only sends to the program
+            the words that the index can't decide. An instance
+            of a :py:class:`hunspellcheck.backends.HunspellBackend` subclass
+            can be passed to use a custom engine. Backends other than
+            ``"subprocess"`` check each distinct word once as with
+            ``deduplicate=True``. Spellcheckers built by
+            :py:meth:`hunspellcheck.HunspellChecker.from_files` or
+            :py:meth:`hunspellcheck.HunspellChecker.from_paths` only support
+            the subprocess backend.
+
+    The spellchecker can be used as a context manager. Inside the context, a
+    persistent hunspell process is kept running and reused by all the calls
+    to :py:meth:`hunspellcheck.HunspellChecker.check`, so the cost of
+    spawning hunspell and loading the dictionaries is only paid once. The
+    process is shared by all the spellcheckers that use the same languages,
+    personal dictionaries and encoding, and it is stopped when the last of
+    them exits its context:
+
+    .. code-block:: python
+
+       with HunspellChecker({}, "en_US") as spellchecker:
+           for snippet in snippets:
+               spellchecker.filenames_contents = {"snippet": snippet}
+               for error in spellchecker.check():
+                   print(error)
+
+    Hunspellcheck never modifies the global state of the process, like the
+    environment variables, to call hunspell, so different spellcheckers can
+    check contents concurrently from multiple threads, sharing persistent
+    processes and caches. A single spellchecker must not run multiple checks
+    at the same time, because it stores the number of errors found in its
+    ``errors`` attribute.
     """
 
     def __init__(
@@ -49,6 +130,11 @@ class HunspellChecker:
         personal_dicts=None,
         looks_like_a_word=DEFAULT_LOOKS_LIKE_A_WORD,
         encoding=None,
+        jobs=1,
+        deduplicate=False,
+        words_cache=None,
+        results_cache=None,
+        backend=None,
     ):
         self.filenames_contents = filenames_contents
         self.languages = languages
@@ -56,6 +142,152 @@ class HunspellChecker:
         self.looks_like_a_word = looks_like_a_word
         self.errors = None
         self.encoding = encoding
+        self.jobs = jobs
+        self.deduplicate = deduplicate
+        self.words_cache = words_cache
+        self.results_cache = results_cache
+        self.backend = create_backend(
+            backend,
+            languages,
+            personal_dicts=personal_dicts,
+            encoding=encoding,
+        )
+        self.files = None
+        self.paths = None
+        self.paths_encoding = None
+
+    @classmethod
+    def from_files(cls, files, languages, **kwargs):
+        """Build a spellchecker which reads the contents to check from files.
+
+        The lines of the files are written to hunspell while they are read,
+        so the contents are never fully loaded in memory, no matter how large
+        they are. As the files are consumed checking them,
+        :py:meth:`hunspellcheck.HunspellChecker.check` can only be called once
+        and doesn't support the ``include_text`` argument.
+
+        Each check spawns a hunspell process that reads the lines while they
+        are written, so the persistent process started using the spellchecker
+        as a context manager is not used, and the options that need the whole
+        contents are not supported: ``jobs``, ``deduplicate``,
+        ``words_cache``, ``results_cache`` and backends other than
+        ``"subprocess"``.
+
+        Args:
+            files (iterable): Pairs of filenames and readable text file
+                objects. Can be a generator, so files can be opened lazily.
+            languages (list, str): Languages against will be checked the
+                contents.
+            **kwargs: Other optional arguments accepted by
+                :py:class:`hunspellcheck.HunspellChecker`.
+
+        Raises:
+            ValueError: If an option not supported checking files as streams
+                is passed.
+
+        Returns:
+            :py:class:`hunspellcheck.HunspellChecker`: Spellchecker instance.
+
+        Examples:
+
+            >>> files = ((fn, open(fn)) for fn in glob.glob("docs/*.txt"))
+            >>> spellchecker = HunspellChecker.from_files(files, "en_US")
+            >>> for error in spellchecker.check():
+            ...     print(error)
+        """
+        spellchecker = cls._streams_spellchecker(languages, kwargs)
+        spellchecker.files = files
+        return spellchecker
+
+    @classmethod
+    def from_paths(cls, paths, languages, paths_encoding=None, **kwargs):
+        """Build a spellchecker which checks files by their paths.
+
+        The files are memory-mapped and their lines are decoded and written
+        to hunspell while they are read, so their contents are never fully
+        loaded in memory. Unlike
+        :py:meth:`hunspellcheck.HunspellChecker.from_files`, the files can be
+        checked multiple times and ``include_text`` is supported: the text of
+        a file is only read and decoded when it is accessed for the first
+        time in one of its errors.
+
+        Like :py:meth:`hunspellcheck.HunspellChecker.from_files`, doesn't use
+        the persistent process nor support the options ``jobs``,
+        ``deduplicate``, ``words_cache``, ``results_cache`` or backends other
+        than ``"subprocess"``.
+
+        Args:
+            paths (list): Paths to the files to check, used as their
+                filenames in the errors.
+            languages (list, str): Languages against will be checked the
+                contents.
+            paths_encoding (str): Encoding of the files, which must be
+                compatible with ASCII, as lines are splitted before decoding
+                them. If not defined, the preferred encoding of the locale is
+                used, as :py:func:`open` does.
+            **kwargs: Other optional arguments accepted by
+                :py:class:`hunspellcheck.HunspellChecker`.
+
+        Raises:
+            ValueError: If an option not supported checking files as streams
+                is passed.
+
+        Returns:
+            :py:class:`hunspellcheck.HunspellChecker`: Spellchecker instance.
+
+        Examples:
+
+            >>> spellchecker = HunspellChecker.from_paths(
+            ...     glob.glob("docs/*.txt"),
+            ...     "en_US",
+            ... )
+            >>> for error in spellchecker.check(include_line=True):
+            ...     print(error)
+        """
+        spellchecker = cls._streams_spellchecker(languages, kwargs)
+        spellchecker.paths = paths
+        spellchecker.paths_encoding = paths_encoding
+        return spellchecker
+
+    @classmethod
+    def _streams_spellchecker(cls, languages, kwargs):
+        unsupported_options = [
+            option
+            for option, default in STREAMS_UNSUPPORTED_OPTIONS.items()
+            if kwargs.get(option, default) != default
+        ]
+        if kwargs.get("backend") not in (None, SubprocessBackend.name):
+            unsupported_options.append("backend")
+        if unsupported_options:
+            raise ValueError(
+                f"The options {', '.join(unsupported_options)} can't be used"
+                " checking files as streams"
+            )
+        return cls(None, languages, **kwargs)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def open(self):
+        """Start a persistent hunspell process used by the next checks, or
+        acquire the resources that the backend keeps alive between checks.
+
+        Every call to this method must be paired with a call to
+        :py:meth:`hunspellcheck.HunspellChecker.close`. Using the spellchecker
+        as a context manager is the preferred way to do it.
+        """
+        if self.files is None and self.paths is None:
+            self.backend.open()
+
+    def close(self):
+        """Release the persistent hunspell process or the resources acquired
+        by :py:meth:`hunspellcheck.HunspellChecker.open`.
+        """
+        self.backend.close()
 
     def check(
         self,
@@ -67,6 +299,7 @@ class HunspellChecker:
         include_text=False,
         include_error_number=False,
         include_near_misses=False,
+        as_dicts=False,
     ):
         """Spellchecking function.
 
@@ -95,29 +328,325 @@ class HunspellChecker:
                 a counter.
             include_near_misses (bool): Includes a list with the near misses
                 for the mispelled word.
+            as_dicts (bool): Yield the errors as dictionaries, as previous
+                versions did, instead of as records. Records are read-only
+                mappings that can't be serialized as JSON directly, so code
+                that modifies or serializes the errors must either pass this
+                argument or call
+                :py:meth:`hunspellcheck.HunspellWordError.as_dict`.
 
         Yields:
-            dict: Dictionary with all the included data for each mispelled word.
+            :py:class:`hunspellcheck.HunspellWordError`: Record with all the
+            included data for each mispelled word, which can be used as a
+            read-only dictionary. A :py:class:`dict` if ``as_dicts`` is
+            ``True``.
         """
-        self.errors = yield from parse_hunspell_output(
-            self.filenames_contents,
-            hunspell_spellcheck(
-                quote_for_hunspell("\n".join(self.filenames_contents.values())),
+        parse_kwargs = {
+            "looks_like_a_word": self.looks_like_a_word,
+            "include_filename": include_filename,
+            "include_line_number": include_line_number,
+            "include_word": include_word,
+            "include_word_line_index": include_word_line_index,
+            "include_line": include_line,
+            "include_text": include_text,
+            "include_error_number": include_error_number,
+            "include_near_misses": include_near_misses,
+        }
+
+        errors = self._gen_errors(parse_kwargs)
+        if as_dicts:
+            for error in errors:
+                yield error.as_dict()
+        else:
+            yield from errors
+
+    def _gen_errors(self, parse_kwargs):
+        if self.files is not None or self.paths is not None:
+            checked_lines = collections.deque()
+            if self.paths is not None:
+                lines = gen_quoted_paths_lines(
+                    self.paths,
+                    checked_lines,
+                    encoding=self.paths_encoding,
+                )
+            elif parse_kwargs["include_text"]:
+                raise ValueError(
+                    "The full text of the files can't be included in the errors"
+                    " checking files as streams"
+                )
+            else:
+                lines = gen_quoted_files_lines(self.files, checked_lines)
+            hunspell_pipe = HunspellPipe(
+                lines,
                 self.languages,
                 personal_dicts=self.personal_dicts,
                 encoding=self.encoding,
-            ),
-            looks_like_a_word=self.looks_like_a_word,
-            include_filename=include_filename,
-            include_line_number=include_line_number,
-            include_word=include_word,
-            include_word_line_index=include_word_line_index,
-            include_line=include_line,
-            include_text=include_text,
-            include_error_number=include_error_number,
-            include_near_misses=include_near_misses,
+            )
+            try:
+                self.errors = yield from parse_hunspell_stream(
+                    checked_lines,
+                    hunspell_pipe.stdout,
+                    **parse_kwargs,
+                )
+            finally:
+                hunspell_pipe.close()
+            return
+
+        if self.results_cache is not None:
+            self.errors = yield from self._check_with_results_cache(parse_kwargs)
+        else:
+            self.errors = yield from self._check_contents(
+                self.filenames_contents,
+                parse_kwargs,
+            )
+
+    def check_columnar(self, include_near_misses=False):
+        """Spellchecking function storing the errors by columns.
+
+        Checks the contents as :py:meth:`hunspellcheck.HunspellChecker.check`
+        does, but instead of yielding a record for each error, stores all of
+        them in integer arrays and categorical string columns, which take
+        much less memory when a lot of errors are found and can be converted
+        to NumPy arrays for vectorized filtering.
+
+        Args:
+            include_near_misses (bool): Includes the near misses of the
+                mispelled words.
+
+        Returns:
+            :py:class:`hunspellcheck.HunspellErrorColumns`: Errors found.
+        """
+        columns = HunspellErrorColumns(include_near_misses=include_near_misses)
+        for error in self.check(include_near_misses=include_near_misses):
+            columns.append(
+                error.filename,
+                error.line_number,
+                error.word,
+                error.word_line_index,
+                error.near_misses if include_near_misses else None,
+            )
+        return columns
+
+    def _check_contents(self, filenames_contents, parse_kwargs):
+        if (
+            self.deduplicate
+            or self.words_cache is not None
+            or not isinstance(self.backend, SubprocessBackend)
+        ):
+            return (
+                yield from parse_words_mispellings(
+                    filenames_contents,
+                    self._spellcheck_words(
+                        gen_unique_words(filenames_contents.values())
+                    ),
+                    **parse_kwargs,
+                )
+            )
+
+        if self.backend.worker is not None:
+            return (
+                yield from parse_hunspell_output(
+                    filenames_contents,
+                    self.backend.spellcheck(
+                        quote_for_hunspell("\n".join(filenames_contents.values()))
+                    ),
+                    **parse_kwargs,
+                )
+            )
+
+        jobs = self.jobs if self.jobs is not None else os.cpu_count()
+        if jobs < 2 or len(filenames_contents) < 2:
+            hunspell_pipe = HunspellPipe(
+                gen_quoted_contents_lines(filenames_contents.values()),
+                self.languages,
+                personal_dicts=self.personal_dicts,
+                encoding=self.encoding,
+            )
+            try:
+                return (
+                    yield from parse_hunspell_output(
+                        filenames_contents,
+                        hunspell_pipe,
+                        **parse_kwargs,
+                    )
+                )
+            finally:
+                hunspell_pipe.close()
+
+        shards = shard_filenames_contents(filenames_contents, jobs)
+        contents = []
+        for i, shard in enumerate(shards):
+            content = "\n".join(shard.values())
+            if i < len(shards) - 1:
+                # the newline that would join this shard with the next one
+                content += "\n"
+            contents.append(quote_for_hunspell(content))
+
+        # imported here because it is only needed checking with multiple jobs
+        from concurrent.futures import ThreadPoolExecutor
+
+        error_number = 0
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            hunspell_outputs = executor.map(self.backend.spellcheck, contents)
+            for shard, hunspell_output in zip(shards, hunspell_outputs):
+                error_number = yield from parse_hunspell_output(
+                    shard,
+                    hunspell_output,
+                    error_number_offset=error_number,
+                    **parse_kwargs,
+                )
+        return error_number
+
+    def _check_with_results_cache(self, parse_kwargs):
+        fingerprint = spellcheck_fingerprint(
+            self.languages,
+            personal_dicts=self.personal_dicts,
+            encoding=self.encoding,
+            backend=self.backend,
+        )
+
+        files_errors, uncached_filenames_contents = {}, {}
+        for filename, text in self.filenames_contents.items():
+            key = self.results_cache.key(fingerprint, text)
+            cached_errors = self.results_cache.get(key)
+            if cached_errors is None:
+                uncached_filenames_contents[filename] = text
+            else:
+                files_errors[filename] = cached_errors
+
+        if uncached_filenames_contents:
+            new_files_errors = {
+                filename: [] for filename in uncached_filenames_contents
+            }
+            # the errors are stored unfiltered, so the results don't depend on
+            # the words filter, which can't be identified reliably
+            for error in self._check_contents(
+                uncached_filenames_contents,
+                {
+                    "looks_like_a_word": _all_look_like_words,
+                    "include_near_misses": True,
+                },
+            ):
+                new_files_errors[error.filename].append(
+                    [
+                        error.line_number,
+                        error.word,
+                        error.word_line_index,
+                        error.near_misses,
+                    ]
+                )
+            for filename, errors in new_files_errors.items():
+                self.results_cache.set(
+                    self.results_cache.key(
+                        fingerprint,
+                        uncached_filenames_contents[filename],
+                    ),
+                    errors,
+                )
+                files_errors[filename] = errors
+            self.results_cache.evict()
+
+        error_class = included_error_record_class(parse_kwargs)
+        error_number = 0
+        for filename, text in self.filenames_contents.items():
+            content = HunspellFileContent(text)
+            for line_number, word, word_line_index, near_misses in files_errors[
+                filename
+            ]:
+                if not self.looks_like_a_word(word):
+                    continue
+                error_number += 1
+                yield error_class(
+                    filename,
+                    line_number,
+                    word,
+                    word_line_index,
+                    None,
+                    content,
+                    error_number,
+                    near_misses,
+                )
+        return error_number
+
+    def invalidate_words_cache(self):
+        """Discard the words stored in the words cache checked using the
+        languages, personal dictionaries and encoding of this spellchecker.
+
+        The words are stored under a key that includes the size and the
+        modification time of the personal dictionaries, so the words checked
+        before editing one of them are not used again without calling this
+        method. It must be called after changing the content of the language
+        dictionaries. The words checked by other spellchecker configurations
+        that share the cache are kept.
+        """
+        if self.words_cache is not None:
+            self.words_cache.invalidate(self._words_cache_key())
+
+    def _words_cache_key(self):
+        # the same key that identifies the persistent workers, which includes
+        # the state of the personal dictionaries
+        return hunspell_worker_key(
+            self.languages,
+            personal_dicts=self.personal_dicts,
+            encoding=self.encoding,
         )
 
+    def _spellcheck_words(self, words):
+        # words accepted by the personal dictionaries are never sent to the
+        # backend and their mispellings are discarded without extra checks
+        personal_dictionary = load_personal_dictionary(self.personal_dicts)
+        words = personal_dictionary.filter_words(words)
+
+        if self.words_cache is None:
+            mispellings = self._spellcheck_unique_words(words)
+        else:
+            key = self._words_cache_key()
+            mispellings, words = self.words_cache.lookup(key, words)
+            new_mispellings = self._spellcheck_unique_words(words)
+            self.words_cache.store(key, words, new_mispellings)
+            mispellings.update(new_mispellings)
+        return personal_dictionary.filter_mispellings(mispellings)
+
+    def _spellcheck_unique_words(self, words):
+        words = list(words)
+        if not words:
+            return {}
+        return self.backend.spellcheck_words(words)
+
+
+def shard_filenames_contents(filenames_contents, n_shards):
+    """Split the files to check in consecutive groups of similar size.
+
+    Args:
+        filenames_contents (dict): Dictionary mapping filenames to content of
+            those files.
+        n_shards (int): Maximum number of groups to create.
+
+    Returns:
+        list: Dictionaries mapping filenames to contents, preserving the order
+        of the files.
+    """
+    remaining_size = sum(len(content) for content in filenames_contents.values())
+    remaining_files = len(filenames_contents)
+
+    shards, shard, shard_size = [], {}, 0
+    for filename, content in filenames_contents.items():
+        shard[filename] = content
+        shard_size += len(content)
+        remaining_files -= 1
+
+        remaining_shards = n_shards - len(shards)
+        if (
+            remaining_shards > 1
+            and remaining_files
+            and shard_size >= remaining_size / remaining_shards
+        ):
+            shards.append(shard)
+            remaining_size -= shard_size
+            shard, shard_size = {}, 0
+    shards.append(shard)
+    return shards
+
 
 def quote_for_hunspell(text):
     """Quote a paragraph so hunspell don't misinterpret it.
@@ -138,6 +667,35 @@ def quote_for_hunspell(text):
     return "\n".join(response)
 
 
+def gen_quoted_contents_lines(contents):
+    """Generates the lines of multiple contents quoted for hunspell.
+
+    The lines generated are the same that hunspell would read from
+    :py:func:`hunspellcheck.spellchecker.quote_for_hunspell` output passing
+    the contents joined by newlines, but without building the whole text.
+
+    Args:
+        contents (iterable): Contents to be quoted.
+
+    Yields:
+        str: Lines quoted as Hunspell recommends.
+    """
+    previous_content, previous_line = None, None
+    for content in itertools.chain(contents, (None,)):
+        if previous_content is not None:
+            if content is not None:
+                # the newline that joins this content with the next one
+                previous_content += "\n"
+            for line in previous_content.splitlines():
+                if previous_line is not None:
+                    yield f"^{previous_line}" if previous_line else ""
+                previous_line = line
+        previous_content = content
+    if previous_line:
+        # a trailing empty line of the quoted text is not read by hunspell
+        yield f"^{previous_line}"
+
+
 def parse_hunspell_output(
     filenames_contents,
     hunspell_output,
@@ -150,55 +708,54 @@ def parse_hunspell_output(
     include_text=False,
     include_error_number=False,
     include_near_misses=False,
+    error_number_offset=0,
 ):
-    """Parse `hunspell -a` output."""
-    locals_yielder = []
+    """Parse `hunspell -a` output.
+
+    The ``stdout`` of ``hunspell_output`` can be the complete output as a
+    string or a file object from which the output is read line by line while
+    hunspell is writing it, so errors are yielded as soon as they are found.
 
-    _locals = locals()
-    for possible_inclusion in ERROR_FIELDS:
-        if _locals.get(f"include_{possible_inclusion}"):
-            locals_yielder.append(possible_inclusion)
+    The number of the last error found is returned by the generator. Errors
+    are numbered starting after ``error_number_offset``.
+    """
+    error_class = included_error_record_class(locals())
 
-    error_number = 0
+    error_number = error_number_offset
     checked_files = iter(filenames_contents.items())
     filename, text = next(checked_files)
-    checked_lines = iter(text.split("\n"))
-    line = next(checked_lines)
+    content, n_lines = HunspellFileContent(text), text.count("\n") + 1
     line_number = 1
 
-    for hunspell_line in hunspell_output.stdout.split("\n")[1:]:
+    for hunspell_line in _gen_hunspell_output_lines(hunspell_output):
         if not hunspell_line:
-            try:
-                line = next(checked_lines)
+            if line_number < n_lines:
                 line_number += 1
-            except StopIteration:
+            else:
                 # next file
                 try:
                     filename, text = next(checked_files)
-                    checked_lines = iter(text.split("\n"))
-                    line = next(checked_lines)
-                    line_number = 1
                 except StopIteration:
                     return error_number
-            continue  # pragma: no cover
-
-        if hunspell_line[0] == "&":
-            _, word, *mispell_data = hunspell_line.split()
-            if include_word_line_index:
-                word_line_index = int(mispell_data[1].rstrip(":")) - 1
-            if include_near_misses:
-                near_misses = [miss.rstrip(",") for miss in mispell_data[2:]]
+                content, n_lines = HunspellFileContent(text), text.count("\n") + 1
+                line_number = 1
+            continue
+
+        mispelling = parse_hunspell_mispelling(hunspell_line)
+        if mispelling is not None:
+            word, word_line_index, near_misses = mispelling
             if looks_like_a_word(word):
                 error_number += 1
-                _locals = locals()
-                yielded_content = {}
-                for field in locals_yielder:
-                    value = _locals.get(field)
-                    if value:
-                        yielded_content[field] = value
-                    elif not isinstance(value, (str, list)):
-                        yielded_content[field] = value
-                yield yielded_content
+                yield error_class(
+                    filename,
+                    line_number,
+                    word,
+                    word_line_index,
+                    None,
+                    content,
+                    error_number,
+                    near_misses,
+                )
 
     raise Unreachable(
         "This line shouldn't be reachable. Please, open an issue at"
@@ -206,6 +763,276 @@ def parse_hunspell_output(
     )  # pragma: no cover
 
 
+def parse_hunspell_mispelling(hunspell_line):
+    """Parse a line of `hunspell -a` output that reports a mispelled word.
+
+    Hunspell reports the mispelled words for which it finds near misses in
+    lines starting with ``&`` and the rest in lines starting with ``#``. All
+    the parsers of hunspell output use this function, so the protocol is
+    only interpreted here.
+
+    Args:
+        hunspell_line (str): Line of the output, with or without its trailing
+            newline. The line written to hunspell must have been quoted with
+            ``^``, as :py:func:`hunspellcheck.spellchecker.quote_for_hunspell`
+            does, because the offset reported by hunspell is shifted by it.
+
+    Returns:
+        tuple: Mispelled word, index of the character in which it starts in
+        the checked line and list with its near misses. ``None`` if the line
+        doesn't report a mispelled word.
+    """
+    kind = hunspell_line[:1]
+    if kind == "&":
+        # & <word> <count> <offset>: <near miss>, <near miss>...
+        head, _, near_misses = hunspell_line.rstrip("\n").partition(": ")
+        _, word, _, offset = head.split()
+        return (word, int(offset) - 1, near_misses.split(", ") if near_misses else [])
+    if kind == "#":
+        # # <word> <offset>
+        _, word, offset = hunspell_line.split()
+        return (word, int(offset) - 1, [])
+    return None
+
+
+def gen_unique_words(contents):
+    """Generates the distinct word candidates found in multiple contents.
+
+    Args:
+        contents (iterable): Contents in which the words will be searched.
+
+    Yields:
+        str: Distinct word candidates, in order of first occurrence.
+    """
+    unique_words = set()
+    for content in contents:
+        for word, _ in gen_word_candidates(content):
+            if word not in unique_words:
+                unique_words.add(word)
+                yield word
+
+
+def parse_hunspell_words_output(words, hunspell_output):
+    """Parse `hunspell -a` output checking one word per line.
+
+    Args:
+        words (list): Words checked by hunspell, in the same order that have
+            been written to it.
+        hunspell_output (object): Hunspell output, as accepted by
+            :py:func:`hunspellcheck.spellchecker.parse_hunspell_output`.
+
+    Returns:
+        dict: Mapping of the words in which hunspell has found mispellings to
+        a list of tuples with the mispelled word, its index inside the checked
+        word and its near misses. Correct words are not included.
+    """
+    mispellings = {}
+    words = iter(words)
+    word, word_mispellings = None, []
+    for hunspell_line in _gen_hunspell_output_lines(hunspell_output):
+        if word is None:
+            word = next(words, None)
+            if word is None:
+                break
+        if not hunspell_line:
+            if word_mispellings:
+                mispellings[word] = word_mispellings
+                word_mispellings = []
+            word = None
+        else:
+            mispelling = parse_hunspell_mispelling(hunspell_line)
+            if mispelling is not None:
+                word_mispellings.append(mispelling)
+    return mispellings
+
+
+def parse_words_mispellings(
+    filenames_contents,
+    mispellings,
+    looks_like_a_word=DEFAULT_LOOKS_LIKE_A_WORD,
+    include_filename=True,
+    include_line_number=True,
+    include_word=True,
+    include_word_line_index=True,
+    include_line=False,
+    include_text=False,
+    include_error_number=False,
+    include_near_misses=False,
+    error_number_offset=0,
+):
+    """Map the mispellings found checking distinct words to their occurrences.
+
+    Args:
+        filenames_contents (dict): Dictionary mapping filenames to content of
+            those files.
+        mispellings (dict): Mispellings found in each word, as returned by
+            :py:func:`hunspellcheck.spellchecker.parse_hunspell_words_output`.
+
+    Yields the same errors as
+    :py:func:`hunspellcheck.spellchecker.parse_hunspell_output` and returns
+    the number of the last one.
+    """
+    error_class = included_error_record_class(locals())
+
+    error_number = error_number_offset
+    for filename, text in filenames_contents.items():
+        content, line_number = HunspellFileContent(text), 1
+        # candidates never contain newlines, so the whole text is searched
+        # and only the offsets of the mispelled ones are located in lines
+        for candidate, candidate_offset in gen_word_candidates(text):
+            candidate_mispellings = mispellings.get(candidate)
+            if not candidate_mispellings:
+                continue
+            # candidates are found in order, so the search starts in the line
+            # of the previous one
+            line_number, candidate_index = content.locate(
+                candidate_offset,
+                line_number,
+            )
+            for word, word_index, word_near_misses in candidate_mispellings:
+                if looks_like_a_word(word):
+                    word_line_index = candidate_index + word_index
+                    near_misses = list(word_near_misses)
+                    error_number += 1
+                    yield error_class(
+                        filename,
+                        line_number,
+                        word,
+                        word_line_index,
+                        None,
+                        content,
+                        error_number,
+                        near_misses,
+                    )
+    return error_number
+
+
+def gen_quoted_files_lines(files, checked_lines):
+    """Read files line by line, quoting each line for hunspell.
+
+    Args:
+        files (iterable): Pairs of filenames and readable text file objects.
+        checked_lines (collections.deque): Queue to which the filename, line
+            number and content of each line are appended before it is yielded,
+            followed by ``None``, as the content of the files is not known.
+
+    Yields:
+        str: Lines quoted as Hunspell recommends.
+    """
+    for filename, f in files:
+        for line_number, line in enumerate(f, start=1):
+            line = line.rstrip("\n")
+            checked_lines.append((filename, line_number, line, None))
+            yield f"^{line}" if line else ""
+
+
+def gen_quoted_paths_lines(paths, checked_lines, encoding=None):
+    """Read files memory-mapping them, quoting each line for hunspell.
+
+    Args:
+        paths (iterable): Paths to the files.
+        checked_lines (collections.deque): Queue to which the path, line
+            number and content of each line are appended before it is yielded,
+            followed by a :py:class:`hunspellcheck.error.HunspellMappedFileContent`
+            shared by all the lines of the same file.
+        encoding (str): Encoding of the files. If not defined, the preferred
+            encoding of the locale is used.
+
+    Yields:
+        str: Lines quoted as Hunspell recommends.
+    """
+    if encoding is None:
+        encoding = locale.getpreferredencoding(False)
+    for path in paths:
+        content = HunspellMappedFileContent(path, encoding)
+        with open(path, "rb") as f:
+            try:
+                mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files can't be mapped
+                continue
+            with mapped_file:
+                for line_number, line in enumerate(
+                    iter(mapped_file.readline, b""),
+                    start=1,
+                ):
+                    line = line.decode(encoding).rstrip("\r\n")
+                    checked_lines.append((path, line_number, line, content))
+                    yield f"^{line}" if line else ""
+
+
+def parse_hunspell_stream(
+    checked_lines,
+    hunspell_stdout,
+    looks_like_a_word=DEFAULT_LOOKS_LIKE_A_WORD,
+    include_filename=True,
+    include_line_number=True,
+    include_word=True,
+    include_word_line_index=True,
+    include_line=False,
+    include_text=False,
+    include_error_number=False,
+    include_near_misses=False,
+    error_number_offset=0,
+):
+    """Parse `hunspell -a` output while hunspell is writing it.
+
+    Each line written to hunspell is taken from the left of ``checked_lines``
+    when its response starts to be read, so the queue only contains the
+    lines that are being checked at a time. Each line is taken with its
+    filename, line number and the content of the file in which it resides, if
+    known. The number of the last error found is returned by the generator.
+    """
+    error_class = included_error_record_class(locals())
+
+    error_number = error_number_offset
+    checked_line = None
+
+    hunspell_stdout.readline()  # version banner
+    for hunspell_line in hunspell_stdout:
+        if checked_line is None:
+            checked_line = checked_lines.popleft()
+        if hunspell_line == "\n":
+            checked_line = None
+            continue
+
+        mispelling = parse_hunspell_mispelling(hunspell_line)
+        if mispelling is not None:
+            filename, line_number, line, content = checked_line
+            word, word_line_index, near_misses = mispelling
+            if looks_like_a_word(word):
+                error_number += 1
+                yield error_class(
+                    filename,
+                    line_number,
+                    word,
+                    word_line_index,
+                    line,
+                    content,
+                    error_number,
+                    near_misses,
+                )
+    return error_number
+
+
+def _gen_hunspell_output_lines(hunspell_output):
+    if isinstance(hunspell_output.stdout, str):
+        hunspell_lines = iter(hunspell_output.stdout.split("\n"))
+    else:
+        # output read while hunspell is writing it, the empty string emulates
+        # the end of the last line of a complete output splitted by newlines
+        hunspell_lines = itertools.chain(
+            (hunspell_line.rstrip("\n") for hunspell_line in hunspell_output.stdout),
+            ("",),
+        )
+    next(hunspell_lines)  # version banner
+    return hunspell_lines
+
+
+def _all_look_like_words(word):
+    return True
+
+
 def render_hunspell_word_error(
     data,
     fields=["filename", "word", "line_number", "word_line_index"],
@@ -218,7 +1045,8 @@ def render_hunspell_word_error(
     spell checkers command line interfaces.
 
     Args:
-        data (dict): Mispelled word data, as it is yielded by the method
+        data (dict, :py:class:`hunspellcheck.HunspellWordError`): Mispelled
+            word data, as it is yielded by the method
             :py:meth:`hunspellcheck.HunspellChecker.check`.
         fields (list): List of fields to include in the response.
         sep (str): Separator string between each field value.
@@ -1,7 +1,12 @@
+import re
 import string  # noqa: F401
 import unicodedata  # noqa: F401
 
 
+WORD_CANDIDATE_REGEX = re.compile(r"\S+")
+WORD_CANDIDATE_STRIP_CHARS = '"()[]{}<>,;:!?'
+
+
 def looks_like_a_word_creator(
     digits_are_words=False,
     words_can_contain_digits=True,
@@ -58,5 +63,31 @@ def looks_like_a_word_creator(
     {function_conditional}return True"""
 
     code = compile(function_definition, "test", "exec")
-    exec(code)
-    return locals()["looks_like_a_word"]
+    namespace = {}
+    exec(code, globals(), namespace)
+    return namespace["looks_like_a_word"]
+
+
+def gen_word_candidates(line):
+    """Generates the substrings of a line in which hunspell could found words.
+
+    Hunspell never finds words across whitespaces, so the line is splitted by
+    them, removing from the edges of each substring the punctuation characters
+    that are never part of words. As newlines are whitespaces too, a text with
+    multiple lines can be passed, generating the same candidates that its
+    lines would generate.
+
+    Args:
+        line (str): Line to split.
+
+    Yields:
+        tuple: Candidate substring and the index of the caracter in which it
+        starts in the line.
+    """
+    for match in WORD_CANDIDATE_REGEX.finditer(line):
+        candidate = match.group(0)
+        stripped_candidate = candidate.lstrip(WORD_CANDIDATE_STRIP_CHARS)
+        candidate_index = match.start() + len(candidate) - len(stripped_candidate)
+        stripped_candidate = stripped_candidate.rstrip(WORD_CANDIDATE_STRIP_CHARS)
+        if stripped_candidate:
+            yield (stripped_candidate, candidate_index)
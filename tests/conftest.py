@@ -0,0 +1,13 @@
+"""Shared fixtures of the hunspellcheck tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path_factory, monkeypatch):
+    """Store the caches of each test in its own temporary directory instead of
+    the user cache directory.
+    """
+    cache_directory = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("HUNSPELLCHECK_CACHE_DIR", str(cache_directory))
+    return cache_directory
@@ -0,0 +1,108 @@
+"""Asynchronous spellchecker tests."""
+
+import asyncio
+import threading
+
+import pytest
+
+from hunspellcheck import AsyncHunspellChecker, HunspellChecker
+from hunspellcheck.hunspell.spellcheck import build_hunspell_command
+
+
+FILENAMES_CONTENTS = {
+    "foo.txt": "hola hoal\n\nhoal hiul\n",
+    "bar.txt": "hola",
+    "baz.txt": "",
+    "qux.txt": "calor iuyh",
+}
+
+
+async def collect_errors(spellchecker, **kwargs):
+    return [error async for error in spellchecker.check(**kwargs)]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {},
+        {"include_line": True, "include_text": True},
+        {"include_error_number": True, "include_near_misses": True},
+        {"include_filename": False, "include_word_line_index": False},
+    ),
+)
+def test_async_hunspell_checker(kwargs):
+    expected_errors = list(HunspellChecker(FILENAMES_CONTENTS, "es_ES").check(**kwargs))
+
+    spellchecker = AsyncHunspellChecker(FILENAMES_CONTENTS, "es_ES")
+    assert asyncio.run(collect_errors(spellchecker, **kwargs)) == expected_errors
+    assert spellchecker.errors == len(expected_errors)
+
+    errors = asyncio.run(collect_errors(spellchecker, as_dicts=True, **kwargs))
+    assert all(type(error) is dict for error in errors)
+    assert errors == expected_errors
+
+
+def test_async_hunspell_checker_personal_dicts(tmp_path, monkeypatch):
+    personal_dicts = []
+    for i, words in enumerate(("hoal\n", "iuyh\nhoal\n")):
+        personal_dict = tmp_path / f"personal{i}.dic"
+        personal_dict.write_text(words)
+        personal_dicts.append(str(personal_dict))
+
+    commands_threads = []
+
+    def build_command(*args, **kwargs):
+        commands_threads.append(threading.current_thread())
+        return build_hunspell_command(*args, **kwargs)
+
+    monkeypatch.setattr("hunspellcheck.aio.build_hunspell_command", build_command)
+
+    expected_errors = list(
+        HunspellChecker(
+            FILENAMES_CONTENTS,
+            "es_ES",
+            personal_dicts=personal_dicts,
+        ).check()
+    )
+    assert [error["word"] for error in expected_errors] == ["hiul"]
+
+    spellchecker = AsyncHunspellChecker(
+        FILENAMES_CONTENTS,
+        "es_ES",
+        personal_dicts=personal_dicts,
+    )
+    assert asyncio.run(collect_errors(spellchecker)) == expected_errors
+    # the command is not built in the thread running the event loop
+    assert commands_threads
+    assert threading.main_thread() not in commands_threads
+
+
+def test_async_hunspell_checker_semaphore():
+    expected_errors = list(HunspellChecker(FILENAMES_CONTENTS, "es_ES").check())
+
+    async def main():
+        semaphore = asyncio.Semaphore(2)
+        spellcheckers = [
+            AsyncHunspellChecker(FILENAMES_CONTENTS, "es_ES", semaphore=semaphore)
+            for _ in range(8)
+        ]
+        return await asyncio.gather(
+            *(collect_errors(spellchecker) for spellchecker in spellcheckers)
+        )
+
+    for errors in asyncio.run(main()):
+        assert errors == expected_errors
+
+
+def test_async_hunspell_checker_stop_iteration():
+    async def main():
+        spellchecker = AsyncHunspellChecker(
+            {"foo.txt": "hoal hiul\n" * 10000},
+            "es_ES",
+        )
+        errors = spellchecker.check()
+        error = await errors.__anext__()
+        await errors.aclose()
+        return error
+
+    assert asyncio.run(main())["word"] == "hoal"
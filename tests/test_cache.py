@@ -0,0 +1,128 @@
+"""Hunspellcheck caches tests."""
+
+import os
+import time
+import types
+
+import pytest
+
+from hunspellcheck.backends import EmulatorBackend, LibraryBackend, SubprocessBackend
+from hunspellcheck.cache import (
+    CacheInfo,
+    ResultsCache,
+    WordsCache,
+    spellcheck_fingerprint,
+)
+
+
+def test_words_cache():
+    cache = WordsCache(maxsize=3)
+    key = (("es_ES",), (), None)
+
+    mispellings, missing_words = cache.lookup(key, ["hola", "hoal"])
+    assert mispellings == {}
+    assert missing_words == ["hola", "hoal"]
+    assert cache.cache_info() == CacheInfo(0, 2, 3, 0)
+
+    cache.store(key, ["hola", "hoal"], {"hoal": [("hoal", 0, ["hola"])]})
+    mispellings, missing_words = cache.lookup(key, ["hola", "hoal"])
+    assert mispellings == {"hoal": (("hoal", 0, ["hola"]),)}
+    assert missing_words == []
+    assert cache.cache_info() == CacheInfo(2, 2, 3, 2)
+
+    # same words checked with other dictionaries are not shared
+    _, missing_words = cache.lookup((("en_US",), (), None), ["hola"])
+    assert missing_words == ["hola"]
+
+
+def test_words_cache_lru():
+    cache = WordsCache(maxsize=2)
+    key = (("es_ES",), (), None)
+
+    cache.store(key, ["foo", "bar"], {})
+    cache.lookup(key, ["foo"])
+    cache.store(key, ["baz"], {})
+
+    _, missing_words = cache.lookup(key, ["foo", "bar", "baz"])
+    assert missing_words == ["bar"]
+    assert cache.cache_info().currsize == 2
+
+
+def test_words_cache_invalidate():
+    cache = WordsCache()
+    key, other_key = (("es_ES",), (), None), (("en_US",), (), None)
+    cache.store(key, ["foo"], {})
+    cache.store(other_key, ["foo"], {})
+
+    cache.invalidate(key)
+    assert cache.lookup(key, ["foo"])[1] == ["foo"]
+    assert cache.lookup(other_key, ["foo"])[1] == []
+
+    cache.invalidate()
+    assert cache.cache_info().currsize == 0
+
+
+def test_results_cache(tmp_path):
+    cache = ResultsCache(directory=str(tmp_path / "results"))
+    key = cache.key("fingerprint", "hola hoal")
+    assert key != cache.key("other fingerprint", "hola hoal")
+    assert key != cache.key("fingerprint", "hola hiul")
+
+    assert cache.get(key) is None
+    cache.set(key, [[1, "hoal", 5, ["hola"]]])
+    assert cache.get(key) == [[1, "hoal", 5, ["hola"]]]
+
+    cache.clear()
+    assert cache.get(key) is None
+
+
+@pytest.mark.parametrize("content", ("{", '{"foo": "bar"}', '[[1, "hoal"]]'))
+def test_results_cache_corrupted(tmp_path, content):
+    cache = ResultsCache(directory=str(tmp_path))
+    key = cache.key("fingerprint", "hola hoal")
+    (tmp_path / f"{key}.json").write_text(content)
+
+    assert cache.get(key) is None
+    assert not (tmp_path / f"{key}.json").exists()
+
+
+def test_results_cache_evict(tmp_path):
+    cache = ResultsCache(directory=str(tmp_path), max_size=25, max_age=100)
+    keys = [cache.key("fingerprint", content) for content in ("foo", "bar", "baz")]
+    for i, key in enumerate(keys):
+        cache.set(key, [[1, "hoal", 0, []]])
+        os.utime(tmp_path / f"{key}.json", (1000 + i, time.time() - 50 + i))
+
+    cache.evict()
+    assert [cache.get(key) is not None for key in keys] == [False, False, True]
+
+    os.utime(tmp_path / f"{keys[2]}.json", (0, time.time() - 200))
+    cache.evict()
+    assert cache.get(keys[2]) is None
+
+
+def test_spellcheck_fingerprint_backend(monkeypatch):
+    subprocess_fingerprint = spellcheck_fingerprint("es_ES")
+    assert (
+        spellcheck_fingerprint("es_ES", backend=SubprocessBackend("es_ES"))
+        == subprocess_fingerprint
+    )
+    assert (
+        spellcheck_fingerprint("es_ES", backend=EmulatorBackend("es_ES"))
+        != subprocess_fingerprint
+    )
+
+    # the library backend doesn't need the hunspell program
+    monkeypatch.setattr(
+        "hunspellcheck.hunspell.library.hunspell_library_available",
+        lambda: True,
+    )
+    monkeypatch.setattr(
+        "hunspellcheck.hunspell.library.load_hunspell_library",
+        lambda: types.SimpleNamespace(_name="libhunspell-1.7.so.0"),
+    )
+    monkeypatch.setenv("PATH", "")
+    assert (
+        spellcheck_fingerprint("es_ES", backend=LibraryBackend("es_ES"))
+        != subprocess_fingerprint
+    )
@@ -254,3 +254,36 @@ def test_hunspellchecker_argument_parser__version_default_template(
         with contextlib.redirect_stdout(stdout), pytest.raises(SystemExit):
             parser.parse_args(["--version"])
         assert re.match(regex_result, stdout.getvalue())
+
+
+def test_hunspellchecker_argument_parser__version_lazy(monkeypatch):
+    calls = []
+
+    def get_hunspell_version(**kwargs):
+        calls.append(kwargs)
+        return {"hunspell": "1.7.0", "ispell": "3.2.06"}
+
+    monkeypatch.setattr(
+        "hunspellcheck.cli.version.get_hunspell_version",
+        get_hunspell_version,
+    )
+
+    parser = argparse.ArgumentParser()
+    hunspellchecker_argument_parser(
+        parser,
+        version=True,
+        version_number="1.0.0",
+        version_prog="foo",
+        files=False,
+        languages=False,
+        personal_dicts=False,
+        encoding=False,
+    )
+    parser.parse_args([])
+    assert calls == []
+
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout), pytest.raises(SystemExit):
+        parser.parse_args(["--version"])
+    assert stdout.getvalue() == "foo 1.0.0 - Hunspell 1.7.0 - Ispell 3.2.06\n"
+    assert len(calls) == 1
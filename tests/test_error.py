@@ -0,0 +1,164 @@
+"""Tests for the records of mispelled words."""
+
+import pickle
+
+import pytest
+
+from hunspellcheck.error import (
+    HunspellErrorColumns,
+    HunspellFileContent,
+    HunspellWordError,
+    error_record_class,
+)
+
+
+def build_error(fields, near_misses=None, line="", content=None):
+    if content is None:
+        content = HunspellFileContent("hola\nhola hoal")
+    return error_record_class(fields)(
+        "foo.txt", 2, "hoal", 5, line, content, 1, near_misses
+    )
+
+
+def test_error_record_class():
+    error_class = error_record_class(("word", "filename"))
+    assert error_class is error_record_class(("word", "filename"))
+    assert issubclass(error_class, HunspellWordError)
+    assert error_class.fields == ("filename", "word")
+
+    error = build_error(("word", "filename"))
+    assert (error.filename, error.word) == ("foo.txt", "hoal")
+    with pytest.raises(AttributeError):
+        error.line_number
+    with pytest.raises(AttributeError):
+        error.foo = "bar"
+
+
+def test_error_mapping():
+    error = build_error(("filename", "word", "line", "near_misses"), near_misses=[])
+    assert error == {"filename": "foo.txt", "word": "hoal"}
+    assert error.as_dict() == {"filename": "foo.txt", "word": "hoal"}
+    assert type(error.as_dict()) is dict
+    assert list(error.keys()) == ["filename", "word"]
+    assert len(error) == 2
+    assert error["word"] == "hoal"
+    assert error.get("line") is None
+    assert error.get("near_misses", []) == []
+    assert error.near_misses == []
+    assert "line" not in error
+    with pytest.raises(KeyError):
+        error["line_number"]
+
+    error = build_error(("line", "near_misses"), near_misses=["hola"], line="l")
+    assert error == {"line": "l", "near_misses": ["hola"]}
+    assert error != {"line": "l"}
+
+
+def test_error_content():
+    content = HunspellFileContent("hola\nhola hoal")
+    errors = [
+        build_error(("line", "text"), line=None, content=content) for _ in range(3)
+    ]
+    assert content._line_offsets is None
+    assert errors[0].line == "hola hoal"
+    assert errors[0] == {"line": "hola hoal", "text": "hola\nhola hoal"}
+    assert all(error._content is content for error in errors)
+    assert content.line(1) == "hola"
+
+    error = build_error(("text",), content=HunspellFileContent(""))
+    assert error.text == ""
+    assert error == {}
+
+
+@pytest.mark.parametrize(
+    "text",
+    ("", "\n", "hola", "hola\nhoal\n", "\n\nhola\n\nhoal hiul\n\n", "a\r\nb"),
+)
+def test_file_content(text):
+    content = HunspellFileContent(text)
+    lines = text.split("\n")
+    assert list(content.line_offsets)[0] == 0
+    assert len(content.line_offsets) == len(lines)
+    for line_number, line in enumerate(lines, start=1):
+        assert content.line(line_number) == line
+
+    line_number, column = 1, 0
+    for offset, character in enumerate(text):
+        assert content.locate(offset) == (line_number, column)
+        assert content.locate(offset, line_number) == (line_number, column)
+        if character == "\n":
+            line_number, column = line_number + 1, 0
+        else:
+            column += 1
+    assert content.locate(len(text)) == (line_number, column)
+
+
+def test_error_pickle():
+    error = build_error(("filename", "line_number", "near_misses"), near_misses=["a"])
+    unpickled_error = pickle.loads(pickle.dumps(error))
+    assert type(unpickled_error) is type(error)
+    assert unpickled_error == error
+
+    error = build_error(("line", "text"), line=None)
+    assert pickle.loads(pickle.dumps(error)) == {
+        "line": "hola hoal",
+        "text": "hola\nhola hoal",
+    }
+    assert repr(unpickled_error) == (
+        "HunspellWordError({'filename': 'foo.txt', 'line_number': 2,"
+        " 'near_misses': ['a']})"
+    )
+
+
+def test_error_columns():
+    columns = HunspellErrorColumns(include_near_misses=True)
+    columns.append("foo.txt", 1, "hoal", 0, ["hola"])
+    columns.append("foo.txt", 3, "hiul", 4, [])
+    columns.append("bar.txt", 2, "hoal", 7, ["hola"])
+
+    assert len(columns) == 3
+    assert columns.filenames == ["foo.txt", "bar.txt"]
+    assert list(columns.filename_codes) == [0, 0, 1]
+    assert columns.words == ["hoal", "hiul"]
+    assert list(columns.word_codes) == [0, 1, 0]
+    assert list(columns.line_numbers) == [1, 3, 2]
+    assert list(columns.word_line_indexes) == [0, 4, 7]
+    assert list(columns) == [
+        {
+            "filename": "foo.txt",
+            "line_number": 1,
+            "word": "hoal",
+            "word_line_index": 0,
+            "error_number": 1,
+            "near_misses": ["hola"],
+        },
+        {
+            "filename": "foo.txt",
+            "line_number": 3,
+            "word": "hiul",
+            "word_line_index": 4,
+            "error_number": 2,
+        },
+        {
+            "filename": "bar.txt",
+            "line_number": 2,
+            "word": "hoal",
+            "word_line_index": 7,
+            "error_number": 3,
+            "near_misses": ["hola"],
+        },
+    ]
+
+
+def test_error_columns_to_numpy():
+    numpy = pytest.importorskip("numpy")
+
+    columns = HunspellErrorColumns()
+    columns.append("foo.txt", 1, "hoal", 0)
+    columns.append("bar.txt", 2, "hoal", 7)
+    arrays = columns.to_numpy()
+    assert "near_misses" not in arrays
+    assert arrays["line_numbers"].tolist() == [1, 2]
+    assert arrays["words"][arrays["word_codes"]].tolist() == ["hoal", "hoal"]
+    assert arrays["filenames"][arrays["filename_codes"] == 1].tolist() == ["bar.txt"]
+    assert arrays["word_line_indexes"].dtype == numpy.int64
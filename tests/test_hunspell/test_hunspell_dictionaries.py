@@ -7,10 +7,14 @@ import types
 
 import pytest
 
+import hunspellcheck.hunspell.dictionaries as dictionaries_module
 from hunspellcheck.exceptions import InvalidLanguageDictionaryError
 from hunspellcheck.hunspell.dictionaries import (
     assert_is_valid_dictionary_language_or_filename,
+    discover_dictionaries,
+    discover_dictionaries_calling_hunspell,
     gen_available_dictionaries,
+    invalidate_dictionaries_cache,
     is_valid_dictionary_language_or_filename,
     list_available_dictionaries,
     print_available_dictionaries,
@@ -101,3 +105,82 @@ def test_assert_is_valid_dictionary_language_or_filename(value, expected_error):
         with pytest.raises(expected_error) as exc:
             assert_is_valid_dictionary_language_or_filename(value)
         assert (value if isinstance(value, str) else value[0]) in str(exc.value)
+
+
+def test_dictionaries_snapshot(monkeypatch, tmp_path):
+    monkeypatch.setenv(
+        "DICPATH",
+        os.pathsep.join(filter(None, (str(tmp_path), os.environ.get("DICPATH")))),
+    )
+    invalidate_dictionaries_cache()
+
+    discoveries = []
+    original_discover_dictionaries = dictionaries_module.discover_dictionaries
+
+    def discover_dictionaries():
+        discoveries.append(None)
+        return original_discover_dictionaries()
+
+    monkeypatch.setattr(
+        dictionaries_module,
+        "discover_dictionaries",
+        discover_dictionaries,
+    )
+
+    dictionaries = list_available_dictionaries()
+    assert list_available_dictionaries() == dictionaries
+    assert_is_valid_dictionary_language_or_filename([VALID_DICTIONARY_LANGUAGE] * 3)
+    assert len(discoveries) == 1
+
+    # adding a dictionary to a search path invalidates the snapshot
+    (tmp_path / "xx_XX.aff").write_text("SET UTF-8\n")
+    (tmp_path / "xx_XX.dic").write_text("1\nfoo\n")
+    os.utime(tmp_path, ns=(0, os.stat(tmp_path).st_mtime_ns + 1000000000))
+    assert "xx_XX" in list_available_dictionaries()
+    assert len(discoveries) == 2
+
+    invalidate_dictionaries_cache()
+    list_available_dictionaries()
+    assert len(discoveries) == 3
+
+
+def test_persistent_dictionaries_snapshot(monkeypatch, tmp_path):
+    monkeypatch.setenv("HUNSPELLCHECK_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("HUNSPELLCHECK_PERSISTENT_DICTIONARIES_CACHE", "1")
+    invalidate_dictionaries_cache()
+
+    dictionaries = list_available_dictionaries()
+    assert os.path.isfile(tmp_path / "dictionaries.json")
+
+    invalidate_dictionaries_cache()
+    monkeypatch.setattr(
+        dictionaries_module,
+        "discover_dictionaries",
+        lambda: pytest.fail("dictionaries discovered again"),
+    )
+    assert list_available_dictionaries() == dictionaries
+    invalidate_dictionaries_cache()
+
+
+def test_discover_dictionaries():
+    search_paths, dictionaries = discover_dictionaries()
+    (
+        expected_search_paths,
+        expected_dictionaries,
+    ) = discover_dictionaries_calling_hunspell()
+    assert search_paths[0] == "."
+    assert sorted(set(dictionaries)) == sorted(set(expected_dictionaries))
+
+
+def test_discover_dictionaries_dicpath(monkeypatch, tmp_path):
+    monkeypatch.setenv("DICPATH", str(tmp_path))
+    (tmp_path / "xx_XX.aff").write_text("SET UTF-8\n")
+    (tmp_path / "xx_XX.dic").write_text("1\nfoo\n")
+    (tmp_path / "yy_YY.dic").write_text("1\nfoo\n")
+    (tmp_path / "hyph_xx_XX.dic").write_text("UTF-8\n")
+
+    search_paths, dictionaries = discover_dictionaries()
+    assert search_paths[:2] == [".", str(tmp_path)]
+    assert f"{tmp_path}/xx_XX" in dictionaries
+    assert f"{tmp_path}/yy_YY" not in dictionaries
+    assert f"{tmp_path}/hyph_xx_XX" not in dictionaries
@@ -0,0 +1,164 @@
+"""Tests for the emulator of the hunspell pipe protocol."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from hunspellcheck.backends import EmulatorBackend
+from hunspellcheck.hunspell.emulator import (
+    HUNSPELL_EMULATOR_VERSION_LINE,
+    HunspellEmulator,
+    write_hunspell_emulator_executable,
+)
+from hunspellcheck.spellchecker import HunspellChecker, parse_hunspell_output
+
+
+AFF = """SET UTF-8
+WORDCHARS '
+
+SFX S Y 1
+SFX S   0     s      .
+"""
+
+DIC = """4
+hola/S
+casa/S
+perro
+iPod
+"""
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    (tmp_path / "xx_XX.aff").write_text(AFF)
+    (tmp_path / "xx_XX.dic").write_text(DIC)
+    return str(tmp_path / "xx_XX")
+
+
+@pytest.fixture
+def emulator():
+    return HunspellEmulator(
+        ["hola", "casa", "perro", "gato"],
+        roots={"casas": "casa"},
+        compounds=True,
+    )
+
+
+@pytest.mark.parametrize(
+    ("line", "expected_output_lines"),
+    (
+        ("^hola", ["*", ""]),
+        ("^Hola HOLA", ["*", "*", ""]),
+        ("^casas", ["+ casa", ""]),
+        ("^perrogato", ["-", ""]),
+        ("^hoal 1234 holaa", ["& hoal 1 1: hola", "& holaa 1 11: hola", ""]),
+        ("^xyzzy", ["# xyzzy 1", ""]),
+        ("hola hoal", ["*", "& hoal 1 5: hola", ""]),
+        ("", [""]),
+        ("*hoal", []),
+        ("!", []),
+    ),
+)
+def test_process_line(emulator, line, expected_output_lines):
+    assert emulator.process_line(line) == expected_output_lines
+
+
+def test_commands(emulator):
+    assert emulator.process_line("!") == []
+    assert emulator.process_line("^hola hoal") == ["& hoal 1 6: hola", ""]
+    assert emulator.process_line("%") == []
+    assert emulator.process_line("@hoal") == []
+    assert emulator.process_line("^hola hoal") == ["*", "*", ""]
+
+
+def test_spellcheck(emulator):
+    filenames_contents = {"foo.txt": "hola hoal\n\ncasaz", "bar.txt": "gato"}
+    output = emulator.spellcheck("^hola hoal\n\n^casaz\n^gato")
+    assert output.stdout.startswith(f"{HUNSPELL_EMULATOR_VERSION_LINE}\n")
+    assert list(
+        parse_hunspell_output(
+            filenames_contents,
+            output,
+            include_near_misses=True,
+        )
+    ) == [
+        {
+            "filename": "foo.txt",
+            "line_number": 1,
+            "word": "hoal",
+            "word_line_index": 5,
+            "near_misses": ["hola"],
+        },
+        {
+            "filename": "foo.txt",
+            "line_number": 3,
+            "word": "casaz",
+            "word_line_index": 0,
+            "near_misses": ["casa", "casas"],
+        },
+    ]
+
+
+def test_spellcheck_words(emulator):
+    assert emulator.spellcheck_words(["hola", "hoal", "gato-xyzzy", "1234"]) == {
+        "hoal": [("hoal", 0, ["hola"])],
+        "gato-xyzzy": [("xyzzy", 5, [])],
+    }
+
+
+def test_from_dictionaries(dictionary, tmp_path):
+    personal_dict = tmp_path / "personal.dic"
+    # forbidden entries take precedence no matter their order or their flags
+    personal_dict.write_text("foo\n*perro\n*casa/S\ncasa\nbar/S\n")
+
+    emulator = HunspellEmulator.from_dictionaries(
+        dictionary,
+        personal_dicts=str(personal_dict),
+    )
+    for word in ("hola", "holas", "Casas", "iPod", "foo", "bar"):
+        assert emulator.knows(word), word
+    for word in ("perro", "ipod", "hoal", "casa", "Casa"):
+        assert not emulator.knows(word), word
+    assert "casa/S" not in emulator.forbidden_words
+    assert emulator.process_line("^l'hola") == ["# l'hola 1", ""]
+
+    with pytest.raises(FileNotFoundError):
+        HunspellEmulator.from_dictionaries("xx_YY")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX executables only")
+def test_hunspell_emulator_executable(dictionary, tmp_path, monkeypatch):
+    bin_directory = tmp_path / "bin"
+    bin_directory.mkdir()
+    write_hunspell_emulator_executable(str(bin_directory))
+    monkeypatch.setenv("PATH", f"{bin_directory}{os.pathsep}{os.environ['PATH']}")
+
+    version = subprocess.run(
+        ["hunspell", "--version"],
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    assert version.stdout == f"{HUNSPELL_EMULATOR_VERSION_LINE}\n"
+
+    filenames_contents = {"foo.txt": "hola hoal\nperros", "bar.txt": "casa\n\nxyzzy"}
+    kwargs = {"include_line": True, "include_near_misses": True}
+    expected_errors = list(
+        HunspellChecker(
+            filenames_contents,
+            dictionary,
+            backend=EmulatorBackend(dictionary),
+        ).check(**kwargs)
+    )
+    assert [error["word"] for error in expected_errors] == ["hoal", "perros", "xyzzy"]
+
+    for spellchecker_kwargs in ({}, {"jobs": 2}, {"deduplicate": True}):
+        spellchecker = HunspellChecker(
+            filenames_contents,
+            dictionary,
+            backend="subprocess",
+            **spellchecker_kwargs,
+        )
+        assert list(spellchecker.check(**kwargs)) == expected_errors
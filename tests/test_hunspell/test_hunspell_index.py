@@ -0,0 +1,114 @@
+"""Tests for the indexes of the words accepted by dictionaries."""
+
+import os
+
+import pytest
+
+from hunspellcheck.hunspell.index import (
+    DictionaryIndex,
+    expand_dictionary,
+    load_dictionary_index,
+)
+
+
+AFF = """SET UTF-8
+WORDCHARS '-
+NEEDAFFIX X
+FORBIDDENWORD F
+KEEPCASE K
+
+SFX S Y 2
+SFX S   0     s      [^sxy]
+SFX S   y     ies    [^aeiou]y
+
+PFX U Y 1
+PFX U   0     un     .
+
+SFX C Y 1
+SFX C   0     ed/X   .
+"""
+
+DIC = """8
+happy/SU
+cat/S
+fly/S
+box
+bar/X
+foo/F
+iPod/K
+walk/C
+"""
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    (tmp_path / "xx_XX.aff").write_text(AFF)
+    (tmp_path / "xx_XX.dic").write_text(DIC)
+    return str(tmp_path / "xx_XX")
+
+
+def test_expand_dictionary(dictionary):
+    words, keepcase_words, forbidden_words, wordchars = expand_dictionary(dictionary)
+    assert words == {
+        "happy",
+        "happies",
+        "unhappy",
+        "unhappies",
+        "cat",
+        "cats",
+        "fly",
+        "flies",
+        "box",
+        "walk",
+    }
+    assert keepcase_words == {"iPod"}
+    assert forbidden_words == {"foo"}
+    assert wordchars == "'-"
+
+
+@pytest.mark.parametrize(
+    ("word", "expected_result"),
+    (
+        ("cats", True),
+        ("Cats", True),
+        ("CATS", True),
+        ("cAts", False),
+        ("unhappies", True),
+        ("boxs", False),
+        ("bar", False),
+        ("foo", False),
+        ("walked", False),
+        ("iPod", True),
+        ("IPOD", False),
+        ("zzz", False),
+    ),
+)
+def test_dictionary_index_knows(dictionary, word, expected_result):
+    index = DictionaryIndex.from_sets(*expand_dictionary(dictionary))
+    assert index.knows(word) is expected_result
+
+
+def test_dictionary_index_gen_words(dictionary):
+    index = DictionaryIndex.from_sets(*expand_dictionary(dictionary))
+    assert list(index.gen_words("cat's")) == ["cat's"]
+    assert list(index.gen_words("cat/dog-box")) == ["cat", "dog-box"]
+
+
+def test_load_dictionary_index(dictionary, tmp_path):
+    cache_directory = str(tmp_path / "indexes")
+    index = load_dictionary_index(dictionary, cache_directory=cache_directory)
+    assert index.knows("flies")
+    assert len(os.listdir(cache_directory)) == 1
+
+    loaded_index = load_dictionary_index(dictionary, cache_directory=cache_directory)
+    assert loaded_index.words == index.words
+    assert loaded_index.wordchars == index.wordchars
+
+    # the index is rebuilt when the dictionary changes
+    with open(f"{dictionary}.dic", "a") as f:
+        f.write("dog/S\n")
+    assert load_dictionary_index(
+        dictionary,
+        cache_directory=cache_directory,
+    ).knows("dogs")
+    assert len(os.listdir(cache_directory)) == 2
@@ -0,0 +1,82 @@
+"""Tests for the Hunspell shared library backend."""
+
+import pytest
+
+from hunspellcheck.hunspell.library import (
+    acquire_hunspell_library,
+    clear_hunspell_libraries,
+    hunspell_library_available,
+    hunspell_word_regex,
+)
+from hunspellcheck.hunspell.spellcheck import hunspell_spellcheck
+from hunspellcheck.spellchecker import parse_hunspell_words_output
+
+
+requires_library = pytest.mark.skipif(
+    not hunspell_library_available(),
+    reason="Hunspell shared library not installed",
+)
+
+
+@pytest.mark.parametrize(
+    ("wordchars", "text", "expected_words"),
+    (
+        ("", "hola abc123 x1y 1234", ["hola", "abc", "x", "y"]),
+        ("0123456789", "hola abc123 x1y 1234", ["hola", "abc123", "x1y", "1234"]),
+        ("'-", "l'hola -hola- ne-ar_x", ["l'hola", "hola", "ne-ar", "x"]),
+        ("'0123456789", "l'abc123 '12", ["l'abc123", "12"]),
+    ),
+)
+def test_hunspell_word_regex(wordchars, text, expected_words):
+    assert hunspell_word_regex(wordchars).findall(text) == expected_words
+
+
+@requires_library
+@pytest.mark.parametrize(
+    "words",
+    (
+        [],
+        ["hola"],
+        ["hola", "hoal", "hiul"],
+        ["hola-hoal", "(hoal)", "1234"],
+        ["abc123", "hoal1", "1hola2", "12hoal"],
+    ),
+)
+def test_hunspell_library_spellcheck_words(words):
+    hunspell = acquire_hunspell_library("es_ES")
+    with hunspell.lock:
+        mispellings = hunspell.spellcheck_words(words)
+
+    expected_mispellings = parse_hunspell_words_output(
+        words,
+        hunspell_spellcheck("\n".join(f"^{word}" for word in words), "es_ES"),
+    )
+    assert mispellings == expected_mispellings
+
+
+@requires_library
+def test_acquire_hunspell_library():
+    hunspell = acquire_hunspell_library("es_ES")
+    assert acquire_hunspell_library(["es_ES"]) is hunspell
+
+    clear_hunspell_libraries()
+    assert hunspell.handle is None
+    assert acquire_hunspell_library("es_ES") is not hunspell
+
+
+@requires_library
+def test_acquire_hunspell_library_personal_dict_edited(tmp_path):
+    personal_dict = tmp_path / "personal.dic"
+    personal_dict.write_text("hoal\n")
+    hunspell = acquire_hunspell_library("es_ES", personal_dicts=[str(personal_dict)])
+    assert hunspell.spellcheck_words(["hoal"]) == {}
+
+    personal_dict.write_text("iuyh\n")
+    new_hunspell = acquire_hunspell_library(
+        "es_ES",
+        personal_dicts=[str(personal_dict)],
+    )
+    assert new_hunspell is not hunspell
+    assert hunspell.handle is None
+    assert "hoal" in new_hunspell.spellcheck_words(["hoal"])
+    clear_hunspell_libraries()
@@ -0,0 +1,214 @@
+"""Tests for the compound personal dictionaries."""
+
+import os
+import tempfile
+
+from hunspellcheck.hunspell.personal import (
+    PersonalDictionary,
+    build_compound_personal_dict,
+    compound_personal_dict_filepath,
+    evict_compound_personal_dicts,
+    gen_personal_dicts_filepaths,
+    load_personal_dictionary,
+    merge_personal_dicts,
+)
+from hunspellcheck.hunspell.spellcheck import build_hunspell_command
+
+
+def test_gen_personal_dicts_filepaths(tmp_path):
+    (tmp_path / "foo.dic").write_text("")
+    (tmp_path / "bar.dic").write_text("")
+    assert list(
+        gen_personal_dicts_filepaths(
+            [str(tmp_path / "foo.dic"), str(tmp_path / "*.dic")],
+        )
+    ) == [str(tmp_path / "foo.dic"), str(tmp_path / "bar.dic")]
+    assert list(gen_personal_dicts_filepaths(None)) == []
+
+
+def test_merge_personal_dicts(tmp_path):
+    (tmp_path / "foo.dic").write_text("zeta\n*beta\nalfa\n\n")
+    (tmp_path / "bar.dic").write_text("beta\r\nalfa/S\nzeta")
+    assert merge_personal_dicts([str(tmp_path / "*.dic")]) == (
+        b"alfa\nalfa/S\nbeta\nzeta\n*beta\n"
+    )
+    assert merge_personal_dicts([str(tmp_path / "baz.dic")]) == b""
+
+
+def test_build_compound_personal_dict(tmp_path):
+    cache_directory = str(tmp_path / "cache")
+    foo_dict, bar_dict = tmp_path / "foo.dic", tmp_path / "bar.dic"
+    foo_dict.write_text("hoal\n")
+    bar_dict.write_text("iuyh\nhoal\n")
+    personal_dicts = [str(foo_dict), str(bar_dict)]
+
+    filepath = build_compound_personal_dict(
+        personal_dicts,
+        cache_directory=cache_directory,
+    )
+    assert filepath == compound_personal_dict_filepath(
+        personal_dicts,
+        cache_directory=cache_directory,
+    )
+    with open(filepath) as f:
+        assert f.read() == "hoal\niuyh\n"
+
+    # reused while the files don't change
+    os.utime(filepath, (0, 0))
+    assert (
+        build_compound_personal_dict(personal_dicts, cache_directory=cache_directory)
+        == filepath
+    )
+    assert os.stat(filepath).st_mtime > 0
+
+    # rebuilt when a file changes, evicting the stale compound dictionary
+    os.utime(filepath, (0, 0))
+    bar_dict.write_text("iuyh\nhoal\ncalor\n")
+    new_filepath = build_compound_personal_dict(
+        personal_dicts,
+        cache_directory=cache_directory,
+    )
+    assert new_filepath != filepath
+    assert not os.path.exists(filepath)
+    with open(new_filepath) as f:
+        assert f.read() == "calor\nhoal\niuyh\n"
+
+
+def test_build_compound_personal_dict_same_stat(tmp_path):
+    cache_directory = str(tmp_path / "cache")
+    foo_dict, bar_dict = tmp_path / "foo.dic", tmp_path / "bar.dic"
+    foo_dict.write_text("hoal\n")
+    bar_dict.write_text("iuyh\n")
+    personal_dicts = [str(foo_dict), str(bar_dict)]
+    filepath = build_compound_personal_dict(
+        personal_dicts,
+        cache_directory=cache_directory,
+    )
+
+    # edited preserving the size and the modification time, like "cp -p" does
+    stat = os.stat(bar_dict)
+    bar_dict.write_text("hiul\n")
+    os.utime(bar_dict, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    new_filepath = build_compound_personal_dict(
+        personal_dicts,
+        cache_directory=cache_directory,
+    )
+    assert new_filepath != filepath
+    with open(new_filepath) as f:
+        assert f.read() == "hiul\nhoal\n"
+
+
+def test_build_compound_personal_dict_unwritable_cache(tmp_path, monkeypatch):
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    monkeypatch.setenv("HUNSPELLCHECK_CACHE_DIR", str(not_a_directory / "cache"))
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path / "tmp"))
+    foo_dict, bar_dict = tmp_path / "foo.dic", tmp_path / "bar.dic"
+    foo_dict.write_text("hoal\n")
+    bar_dict.write_text("iuyh\n")
+
+    filepath = build_compound_personal_dict([str(foo_dict), str(bar_dict)])
+    assert filepath.startswith(str(tmp_path / "tmp" / "hunspellcheck" / "personal"))
+    with open(filepath) as f:
+        assert f.read() == "hoal\niuyh\n"
+
+
+def test_evict_compound_personal_dicts(tmp_path):
+    old_dict, new_dict = tmp_path / "old.dic", tmp_path / "new.dic"
+    old_dict.write_text("")
+    new_dict.write_text("")
+    os.utime(old_dict, (0, 0))
+
+    evict_compound_personal_dicts(str(tmp_path), max_age=60)
+    assert not old_dict.exists()
+    assert new_dict.exists()
+
+    evict_compound_personal_dicts(str(tmp_path / "missing"))
+
+
+def test_build_hunspell_command(tmp_path, monkeypatch):
+    monkeypatch.setenv("HUNSPELLCHECK_CACHE_DIR", str(tmp_path / "cache"))
+    foo_dict, bar_dict = tmp_path / "foo.dic", tmp_path / "bar.dic"
+    foo_dict.write_text("hoal\n")
+    bar_dict.write_text("iuyh\n")
+
+    assert build_hunspell_command("es_ES", encoding="UTF-8") == [
+        "hunspell",
+        "-d",
+        "es_ES",
+        "-a",
+        "-i",
+        "UTF-8",
+    ]
+    assert build_hunspell_command(["es_ES"], personal_dicts=[str(foo_dict)]) == [
+        "hunspell",
+        "-d",
+        "es_ES",
+        "-a",
+        "-p",
+        str(foo_dict),
+    ]
+
+    command = build_hunspell_command(
+        ["es_ES", "en_US"],
+        personal_dicts=[str(foo_dict), str(bar_dict)],
+    )
+    assert command[:5] == ["hunspell", "-d", "es_ES,en_US", "-a", "-p"]
+    assert command[5].startswith(str(tmp_path / "cache" / "personal"))
+    assert os.path.isfile(command[5])
+    assert (
+        build_hunspell_command(
+            ["es_ES", "en_US"],
+            personal_dicts=[str(foo_dict), str(bar_dict)],
+        )
+        == command
+    )
+
+
+def test_personal_dictionary(tmp_path):
+    (tmp_path / "foo.dic").write_text("hoal\nIuyh/S\n*calor\n\n")
+    (tmp_path / "bar.dic").write_text("calor\n*hiul/S\nhiul\nNASA\n")
+
+    personal_dictionary = PersonalDictionary.from_files(str(tmp_path / "*.dic"))
+    assert personal_dictionary.words == {"hoal", "Iuyh", "NASA"}
+    assert personal_dictionary.forbidden_words == {"calor", "hiul"}
+
+    for word in ("hoal", "Hoal", "HOAL", "Iuyh", "IUYH", "NASA"):
+        assert personal_dictionary.knows(word), word
+    for word in ("iuyh", "Nasa", "calor", "hiul", "Hiul", "hola"):
+        assert not personal_dictionary.knows(word), word
+
+    assert personal_dictionary.filter_words(["hola", "hoal", "hoal-hoal"]) == [
+        "hola",
+        "hoal-hoal",
+    ]
+    assert personal_dictionary.filter_mispellings(
+        {"hoal-hola": [("hoal", 0, []), ("hola", 5, [])], "Hoal": [("Hoal", 0, [])]}
+    ) == {"hoal-hola": [("hola", 5, [])]}
+
+    assert personal_dictionary.models == {"Iuyh": "S"}
+
+    # forbidden entries take precedence no matter their order
+    (tmp_path / "baz.dic").write_text("*calor/S\ncalor\nhola/calor\n")
+    personal_dictionary = PersonalDictionary.from_files(str(tmp_path / "baz.dic"))
+    assert personal_dictionary.words == {"hola"}
+    assert personal_dictionary.forbidden_words == {"calor"}
+    assert personal_dictionary.models == {"hola": "calor"}
+
+    assert not PersonalDictionary()
+    assert PersonalDictionary().filter_words(["hoal"]) == ["hoal"]
+
+
+def test_load_personal_dictionary(tmp_path):
+    personal_dict = tmp_path / "personal.dic"
+    personal_dict.write_text("hoal\n")
+
+    personal_dictionary = load_personal_dictionary([str(personal_dict)])
+    assert personal_dictionary.words == {"hoal"}
+    assert load_personal_dictionary([str(personal_dict)]) is personal_dictionary
+
+    personal_dict.write_text("hoal\niuyh\n")
+    os.utime(personal_dict, ns=(0, 0))
+    assert load_personal_dictionary([str(personal_dict)]).words == {"hoal", "iuyh"}
+
+    assert not load_personal_dictionary(None)
@@ -36,3 +36,13 @@ def test_get_hunspell_version(kwargs, error):
                 assert re.match(r"^\d+\.\d+\.\d+", response[kwarg])
             else:
                 assert response.get(kwarg) is None
+
+
+def test_get_hunspell_version_memoized(monkeypatch):
+    expected_version = get_hunspell_version()
+
+    def run(*args, **kwargs):
+        raise AssertionError("hunspell executed again")
+
+    monkeypatch.setattr("hunspellcheck.hunspell.version.subprocess.run", run)
+    assert get_hunspell_version() == expected_version
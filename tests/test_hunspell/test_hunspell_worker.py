@@ -0,0 +1,82 @@
+"""Tests for persistent hunspell workers."""
+
+import pytest
+
+from hunspellcheck.hunspell.spellcheck import hunspell_spellcheck
+from hunspellcheck.hunspell.worker import (
+    HunspellWorker,
+    acquire_hunspell_worker,
+    hunspell_worker_key,
+    release_hunspell_worker,
+)
+
+
+@pytest.mark.parametrize(
+    "content",
+    (
+        "",
+        "^hola",
+        "^hola hoal hiul",
+        "^hola hoal\n\n^iuyh calor",
+    ),
+)
+def test_hunspell_worker_spellcheck(content):
+    worker = HunspellWorker("es_ES")
+    try:
+        for _ in range(2):
+            assert (
+                worker.spellcheck(content).stdout
+                == hunspell_spellcheck(content, "es_ES").stdout
+            )
+    finally:
+        worker.close()
+    assert worker.closed
+
+
+def test_hunspell_worker_process_reused():
+    worker = HunspellWorker("es_ES")
+    try:
+        worker.spellcheck("^hola")
+        pid = worker.process.pid
+        worker.spellcheck("^hoal")
+        assert worker.process.pid == pid
+    finally:
+        worker.close()
+
+
+def test_acquire_release_hunspell_worker():
+    worker = acquire_hunspell_worker("es_ES")
+    other_worker = acquire_hunspell_worker(["es_ES"])
+    assert worker is other_worker
+
+    worker.spellcheck("^hola")
+    release_hunspell_worker(worker)
+    assert not worker.closed
+
+    release_hunspell_worker(other_worker)
+    assert worker.closed
+
+    new_worker = acquire_hunspell_worker("es_ES")
+    assert new_worker is not worker
+    release_hunspell_worker(new_worker)
+
+
+def test_acquire_hunspell_worker_personal_dict_edited(tmp_path):
+    personal_dict = tmp_path / "personal.dic"
+    personal_dict.write_text("hoal\n")
+    worker = acquire_hunspell_worker("es_ES", personal_dicts=[str(personal_dict)])
+    try:
+        personal_dict.write_text("iuyh\n")
+        assert worker.key != hunspell_worker_key(
+            "es_ES",
+            personal_dicts=[str(personal_dict)],
+        )
+        new_worker = acquire_hunspell_worker(
+            "es_ES",
+            personal_dicts=[str(personal_dict)],
+        )
+        assert new_worker is not worker
+        release_hunspell_worker(new_worker)
+    finally:
+        release_hunspell_worker(worker)
+    assert worker.closed
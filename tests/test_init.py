@@ -0,0 +1,54 @@
+"""Tests for the package namespace."""
+
+import subprocess
+import sys
+
+import pytest
+
+import hunspellcheck
+
+
+HEAVY_MODULES = (
+    "argparse",
+    "babel",
+    "concurrent.futures",
+    "ctypes",
+    "jinja2",
+    "hunspellcheck.hunspell.emulator",
+    "hunspellcheck.hunspell.index",
+    "hunspellcheck.hunspell.library",
+)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    (
+        "import hunspellcheck",
+        "from hunspellcheck import HunspellChecker",
+        "from hunspellcheck import HunspellChecker, render_hunspell_word_error",
+        "from hunspellcheck import list_available_dictionaries",
+    ),
+)
+def test_lazy_imports(statement):
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}; import sys; print(' '.join(sorted(sys.modules)))",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    modules = output.stdout.split()
+    for module in HEAVY_MODULES:
+        assert module not in modules
+
+
+def test_public_api():
+    for name in hunspellcheck.__all__:
+        assert getattr(hunspellcheck, name) is not None
+        assert name in dir(hunspellcheck)
+
+    with pytest.raises(AttributeError, match="foo"):
+        hunspellcheck.foo
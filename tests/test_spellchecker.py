@@ -1,11 +1,32 @@
 """Hunspellcheck spellchecker tests."""
 
+import io
+import json
 import os
+import subprocess
 import tempfile
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from hunspellcheck.spellchecker import HunspellChecker
+from hunspellcheck.backends import HunspellBackend, LibraryBackend, SubprocessBackend
+from hunspellcheck.cache import ResultsCache, WordsCache
+from hunspellcheck.exceptions import HunspellLibraryNotFoundError
+from hunspellcheck.hunspell.dictionaries import list_available_dictionaries
+from hunspellcheck.hunspell.library import hunspell_library_available
+from hunspellcheck.hunspell.version import get_hunspell_version
+from hunspellcheck.spellchecker import (
+    HunspellChecker,
+    gen_quoted_contents_lines,
+    gen_unique_words,
+    parse_hunspell_mispelling,
+    parse_hunspell_output,
+    parse_hunspell_words_output,
+    quote_for_hunspell,
+    shard_filenames_contents,
+)
 
 
 class TestHunspellChecker:
@@ -362,3 +383,665 @@ class TestHunspellChecker:
         else:
             for personal_dict_filename in personal_dicts:
                 os.remove(personal_dict_filename)
+
+    @pytest.mark.parametrize(
+        "filenames_contents",
+        (
+            {"foo.txt": "hola hoal hiuli\niuyh"},
+            {"foo.txt": "ahui ejemplo", "bar.txt": " urtk\nentonces"},
+            {"foo.txt": "tr\n", "bar.txt": "\n\ntd"},
+        ),
+    )
+    def test_context_manager(self, filenames_contents):
+        kwargs = {"include_line": True, "include_error_number": True}
+        expected_errors = list(
+            HunspellChecker(filenames_contents, "es_ES").check(**kwargs)
+        )
+
+        with HunspellChecker(
+            filenames_contents,
+            "es_ES",
+            backend="subprocess",
+        ) as spellchecker:
+            worker = spellchecker.backend.worker
+
+            for _ in range(2):
+                assert list(spellchecker.check(**kwargs)) == expected_errors
+                assert spellchecker.errors == len(expected_errors)
+        assert spellchecker.backend.worker is None
+        assert worker.closed
+
+    @pytest.mark.parametrize("jobs", (2, 3, None))
+    @pytest.mark.parametrize(
+        "filenames_contents",
+        (
+            {"foo.txt": "hola hoal hiuli\niuyh"},
+            {"foo.txt": "ahui ejemplo", "bar.txt": " urtk\nentonces"},
+            {"foo.txt": "tr\n", "bar.txt": "\n\ntd", "baz.txt": "", "qux.txt": "ap"},
+        ),
+    )
+    def test_jobs(self, filenames_contents, jobs):
+        kwargs = {"include_line": True, "include_error_number": True}
+        expected_errors = list(
+            HunspellChecker(filenames_contents, "es_ES").check(**kwargs)
+        )
+
+        spellchecker = HunspellChecker(filenames_contents, "es_ES", jobs=jobs)
+        assert list(spellchecker.check(**kwargs)) == expected_errors
+        assert spellchecker.errors == len(expected_errors)
+
+    @pytest.mark.parametrize(
+        "filenames_contents",
+        (
+            {"foo.txt": "hola hoal hiuli\niuyh"},
+            {"foo.txt": "ahui ejemplo", "bar.txt": " urtk\nentonces"},
+            {"foo.txt": "tr\n", "bar.txt": "\n\ntd", "baz.txt": "", "qux.txt": "ap"},
+        ),
+    )
+    def test_from_files(self, filenames_contents):
+        kwargs = {"include_line": True, "include_error_number": True}
+        expected_errors = list(
+            HunspellChecker(filenames_contents, "es_ES").check(**kwargs)
+        )
+
+        files = (
+            (filename, io.StringIO(content))
+            for filename, content in filenames_contents.items()
+        )
+        spellchecker = HunspellChecker.from_files(files, "es_ES")
+        assert list(spellchecker.check(**kwargs)) == expected_errors
+        assert spellchecker.errors == len(expected_errors)
+
+    def test_from_files_include_text(self):
+        spellchecker = HunspellChecker.from_files(
+            [("foo.txt", io.StringIO("hoal"))], "es_ES"
+        )
+        with pytest.raises(ValueError, match="full text"):
+            list(spellchecker.check(include_text=True))
+
+    @pytest.mark.parametrize(
+        "filenames_contents",
+        (
+            {"foo.txt": "hola hoal hiuli\niuyh"},
+            {"foo.txt": "ahui ejemplo", "bar.txt": " urtk\nentonces"},
+            {"foo.txt": "tr\n", "bar.txt": "\n\ntd", "baz.txt": "", "qux.txt": "ap"},
+        ),
+    )
+    def test_from_paths(self, filenames_contents, tmp_path):
+        paths_contents = {}
+        for filename, content in filenames_contents.items():
+            path = str(tmp_path / filename)
+            with open(path, "w") as f:
+                f.write(content)
+            paths_contents[path] = content
+
+        kwargs = {
+            "include_line": True,
+            "include_text": True,
+            "include_error_number": True,
+        }
+        expected_errors = list(HunspellChecker(paths_contents, "es_ES").check(**kwargs))
+
+        spellchecker = HunspellChecker.from_paths(list(paths_contents), "es_ES")
+        for _ in range(2):
+            errors = list(spellchecker.check(**kwargs))
+            assert spellchecker.errors == len(expected_errors)
+            assert all(error._content._text is None for error in errors)
+            assert errors == expected_errors
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_options"),
+        (
+            ({"jobs": 2}, "jobs"),
+            ({"jobs": None}, "jobs"),
+            ({"deduplicate": True}, "deduplicate"),
+            ({"words_cache": WordsCache()}, "words_cache"),
+            ({"results_cache": ResultsCache()}, "results_cache"),
+            ({"backend": "emulator"}, "backend"),
+            ({"backend": SubprocessBackend("es_ES")}, "backend"),
+            ({"deduplicate": True, "backend": "python"}, "deduplicate, backend"),
+        ),
+    )
+    def test_streams_unsupported_options(self, kwargs, expected_options, tmp_path):
+        with pytest.raises(ValueError, match=f"options {expected_options} can't"):
+            HunspellChecker.from_files([], "es_ES", **kwargs)
+        with pytest.raises(ValueError, match=f"options {expected_options} can't"):
+            HunspellChecker.from_paths([], "es_ES", **kwargs)
+
+        # default values and the subprocess backend are accepted
+        path = tmp_path / "foo.txt"
+        path.write_text("hola hoal")
+        spellchecker = HunspellChecker.from_paths(
+            [str(path)],
+            "es_ES",
+            jobs=1,
+            deduplicate=False,
+            backend="subprocess",
+        )
+        with spellchecker:
+            assert spellchecker.backend.worker is None
+            assert [error["word"] for error in spellchecker.check()] == ["hoal"]
+
+    @pytest.mark.parametrize(
+        "filenames_contents",
+        (
+            {"foo.txt": "hola hoal hiuli\niuyh hoal"},
+            {"foo.txt": "ahui, ejemplo (ahui)", "bar.txt": " urtk\nentonces urtk."},
+            {"foo.txt": "tr\n", "bar.txt": "\n\ntd tr", "baz.txt": "", "qux.txt": "ap"},
+        ),
+    )
+    def test_deduplicate(self, filenames_contents):
+        kwargs = {
+            "include_line": True,
+            "include_text": True,
+            "include_error_number": True,
+            "include_near_misses": True,
+        }
+        expected_errors = list(
+            HunspellChecker(filenames_contents, "es_ES").check(**kwargs)
+        )
+
+        spellchecker = HunspellChecker(filenames_contents, "es_ES", deduplicate=True)
+        assert list(spellchecker.check(**kwargs)) == expected_errors
+        assert spellchecker.errors == len(expected_errors)
+
+    def test_words_cache(self):
+        filenames_contents = {"foo.txt": "hola hoal\nhoal hiul", "bar.txt": "hola"}
+        kwargs = {"include_near_misses": True}
+        expected_errors = list(
+            HunspellChecker(filenames_contents, "es_ES").check(**kwargs)
+        )
+
+        words_cache = WordsCache()
+        spellchecker = HunspellChecker(
+            filenames_contents,
+            "es_ES",
+            words_cache=words_cache,
+        )
+        assert list(spellchecker.check(**kwargs)) == expected_errors
+        assert words_cache.cache_info().hits == 0
+        assert words_cache.cache_info().misses == 3
+
+        spellchecker.filenames_contents = {"baz.txt": "hiul hola"}
+        assert [error["word"] for error in spellchecker.check()] == ["hiul"]
+        assert words_cache.cache_info().hits == 2
+        assert words_cache.cache_info().misses == 3
+
+        spellchecker.invalidate_words_cache()
+        assert words_cache.cache_info().currsize == 0
+
+    def test_invalidate_words_cache(self, tmp_path):
+        words_cache = WordsCache()
+        spellchecker = HunspellChecker(
+            {"foo.txt": "hola hoal"},
+            "es_ES",
+            words_cache=words_cache,
+        )
+        other_spellchecker = HunspellChecker(
+            {"foo.txt": "hello hiul"},
+            "en_US",
+            words_cache=words_cache,
+        )
+        list(spellchecker.check())
+        list(other_spellchecker.check())
+        assert words_cache.cache_info().currsize == 4
+
+        spellchecker.invalidate_words_cache()
+        assert words_cache.cache_info().currsize == 2
+        assert (
+            words_cache.lookup(
+                other_spellchecker._words_cache_key(),
+                ["hello", "hiul"],
+            )[1]
+            == []
+        )
+
+        # edited personal dictionaries change the key
+        personal_dict = tmp_path / "personal.dic"
+        personal_dict.write_text("hoal\n")
+        spellchecker.personal_dicts = str(personal_dict)
+        key = spellchecker._words_cache_key()
+        personal_dict.write_text("hoal\niuyh\n")
+        assert spellchecker._words_cache_key() != key
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        (
+            {},
+            {"include_line": True, "include_near_misses": True},
+            {"include_filename": False, "include_error_number": True},
+        ),
+    )
+    def test_results_cache(self, tmp_path, kwargs):
+        filenames_contents = {"foo.txt": "hola hoal\nhoal hiul", "bar.txt": "hola"}
+        expected_errors = list(
+            HunspellChecker(filenames_contents, "es_ES").check(**kwargs)
+        )
+
+        results_cache = ResultsCache(directory=str(tmp_path))
+        for _ in range(2):
+            spellchecker = HunspellChecker(
+                filenames_contents,
+                "es_ES",
+                results_cache=results_cache,
+            )
+            assert list(spellchecker.check(**kwargs)) == expected_errors
+            assert spellchecker.errors == len(expected_errors)
+            assert len(list(tmp_path.iterdir())) == 2
+
+    def test_results_cache_looks_like_a_word(self, tmp_path):
+        def words_longer_than(n):
+            def looks_like_a_word(word):
+                return len(word) > n
+
+            return looks_like_a_word
+
+        filenames_contents = {"foo.txt": "hola hoal\nhoal hiul", "bar.txt": "hola"}
+        results_cache = ResultsCache(directory=str(tmp_path))
+        for n, expected_errors in ((3, 3), (10, 0), (3, 3)):
+            spellchecker = HunspellChecker(
+                filenames_contents,
+                "es_ES",
+                looks_like_a_word=words_longer_than(n),
+                results_cache=results_cache,
+            )
+            errors = list(spellchecker.check(include_error_number=True))
+            assert len(errors) == expected_errors
+            assert [error["error_number"] for error in errors] == list(
+                range(1, expected_errors + 1)
+            )
+            assert len(list(tmp_path.iterdir())) == 2
+
+    def test_backend(self, monkeypatch):
+        with pytest.raises(ValueError, match="Invalid backend"):
+            HunspellChecker({}, "es_ES", backend="foo")
+
+        monkeypatch.setattr(
+            "hunspellcheck.hunspell.library.hunspell_library_available",
+            lambda: False,
+        )
+        with pytest.raises(HunspellLibraryNotFoundError):
+            HunspellChecker({}, "es_ES", backend="library")
+
+        monkeypatch.setattr(
+            "hunspellcheck.hunspell.library.hunspell_library_available",
+            lambda: True,
+        )
+        assert isinstance(HunspellChecker({}, "es_ES").backend, SubprocessBackend)
+
+        filenames_contents = {"foo.txt": "hola hoal\nhoal hiul", "bar.txt": "hola"}
+        spellchecker = HunspellChecker(filenames_contents, "es_ES")
+        assert isinstance(spellchecker.backend, SubprocessBackend)
+        assert [error["word"] for error in spellchecker.check()] == [
+            "hoal",
+            "hoal",
+            "hiul",
+        ]
+
+    def test_check_as_dicts(self):
+        filenames_contents = {"foo.txt": "hola hoal\nhoal hiul", "bar.txt": "hiul"}
+        kwargs = {"include_line": True, "include_near_misses": True}
+        spellchecker = HunspellChecker(filenames_contents, "es_ES")
+        expected_errors = list(spellchecker.check(**kwargs))
+
+        errors = list(spellchecker.check(as_dicts=True, **kwargs))
+        assert all(type(error) is dict for error in errors)
+        assert errors == [error.as_dict() for error in expected_errors]
+        assert json.loads(json.dumps(errors)) == errors
+        assert spellchecker.errors == len(errors)
+
+    @pytest.mark.parametrize("include_near_misses", (True, False))
+    def test_check_columnar(self, include_near_misses):
+        filenames_contents = {"foo.txt": "hola hoal\nhoal hiul", "bar.txt": "hiul"}
+        spellchecker = HunspellChecker(filenames_contents, "es_ES")
+        expected_errors = list(
+            spellchecker.check(
+                include_error_number=True,
+                include_near_misses=include_near_misses,
+            )
+        )
+
+        columns = spellchecker.check_columnar(include_near_misses=include_near_misses)
+        assert spellchecker.errors == len(columns) == 4
+        assert columns.filenames == ["foo.txt", "bar.txt"]
+        assert columns.words == ["hoal", "hiul"]
+        assert list(columns) == expected_errors
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        ({}, {"jobs": 2}, {"deduplicate": True}),
+    )
+    def test_invalid_dictionary(self, kwargs):
+        spellchecker = HunspellChecker(
+            {"foo.txt": "hola hoal", "bar.txt": "iuyh"},
+            "xx_XX",
+            backend="subprocess",
+            **kwargs,
+        )
+        with pytest.raises(subprocess.CalledProcessError):
+            list(spellchecker.check())
+
+        spellchecker = HunspellChecker.from_files(
+            [("foo.txt", io.StringIO("hola hoal"))],
+            "xx_XX",
+            backend="subprocess",
+        )
+        with pytest.raises(subprocess.CalledProcessError):
+            list(spellchecker.check())
+
+    def test_custom_backend(self):
+        class FakeBackend(HunspellBackend):
+            def spellcheck_words(self, words):
+                self.checked_words = words
+                return {
+                    word: [(word[1:], 1, [word])]
+                    for word in words
+                    if word.startswith("x")
+                }
+
+        backend = FakeBackend("es_ES")
+        spellchecker = HunspellChecker(
+            {"foo.txt": "hola xhola\nxhola (ax)", "bar.txt": "xx"},
+            "es_ES",
+            backend=backend,
+        )
+        assert spellchecker.backend is backend
+        assert list(spellchecker.check(include_near_misses=True)) == [
+            {
+                "filename": "foo.txt",
+                "line_number": 1,
+                "word": "hola",
+                "word_line_index": 6,
+                "near_misses": ["xhola"],
+            },
+            {
+                "filename": "foo.txt",
+                "line_number": 2,
+                "word": "hola",
+                "word_line_index": 1,
+                "near_misses": ["xhola"],
+            },
+            {
+                "filename": "bar.txt",
+                "line_number": 1,
+                "word": "x",
+                "word_line_index": 1,
+                "near_misses": ["xx"],
+            },
+        ]
+        assert backend.checked_words == ["hola", "xhola", "ax", "xx"]
+
+    def test_library_backend_destroyed_instance(self, monkeypatch):
+        class FakeHunspellLibrary:
+            def __init__(self, handle):
+                self.handle = handle
+                self.lock = threading.Lock()
+
+            def spellcheck_words(self, words):
+                return {word: [(word, 0, [])] for word in words}
+
+        # the first instance is destroyed before its lock is held
+        instances = iter((FakeHunspellLibrary(None), FakeHunspellLibrary(1)))
+        monkeypatch.setattr(
+            "hunspellcheck.hunspell.library.hunspell_library_available",
+            lambda: True,
+        )
+        monkeypatch.setattr(
+            "hunspellcheck.hunspell.library.acquire_hunspell_library",
+            lambda *args, **kwargs: next(instances),
+        )
+        backend = LibraryBackend("es_ES")
+        assert backend.spellcheck_words(["hoal"]) == {"hoal": [("hoal", 0, [])]}
+        assert next(instances, None) is None
+
+    @pytest.mark.skipif(
+        not hunspell_library_available(),
+        reason="Hunspell shared library not installed",
+    )
+    def test_library_backend(self):
+        filenames_contents = {
+            "foo.txt": "hola hoal\nhoal hiul abc123",
+            "bar.txt": "hola x1y 1234 hoal1",
+        }
+        kwargs = {"include_line": True, "include_near_misses": True}
+        expected_errors = list(
+            HunspellChecker(
+                filenames_contents,
+                "es_ES",
+                backend="subprocess",
+            ).check(**kwargs)
+        )
+        spellchecker = HunspellChecker(filenames_contents, "es_ES", backend="library")
+        assert list(spellchecker.check(**kwargs)) == expected_errors
+
+    def test_subprocess_backend_personal_dict_edited(self, tmp_path):
+        personal_dict = tmp_path / "personal.dic"
+        personal_dict.write_text("hoal\n")
+        backend = SubprocessBackend("es_ES", personal_dicts=[str(personal_dict)])
+        backend.open()
+        try:
+            assert backend.spellcheck_words(["hoal"]) == {}
+
+            personal_dict.write_text("iuyh\n")
+            assert list(backend.spellcheck_words(["hoal", "iuyh"])) == ["hoal"]
+        finally:
+            backend.close()
+
+    def test_personal_dicts_prefilter(self, tmp_path):
+        class FakeBackend(HunspellBackend):
+            def spellcheck_words(self, words):
+                self.checked_words = words
+                return {
+                    word: [(word, 0, [])]
+                    for word in words
+                    if word.startswith("x") or word == "ax-xa"
+                }
+
+        personal_dict = tmp_path / "personal.dic"
+        personal_dict.write_text("xhola\nxa/S\n*xb\n")
+        backend = FakeBackend("es_ES")
+        spellchecker = HunspellChecker(
+            {"foo.txt": "hola xhola Xhola\nxa xb ax-xa"},
+            "es_ES",
+            personal_dicts=str(personal_dict),
+            backend=backend,
+        )
+        assert [error["word"] for error in spellchecker.check()] == ["xb", "ax-xa"]
+        assert backend.checked_words == ["hola", "xb", "ax-xa"]
+
+        personal_dict.write_text("xhola\nxa\nxb\nax-xa\n")
+        os.utime(personal_dict, ns=(0, 0))
+        # not alphabetic words are checked, but their mispellings discarded
+        assert list(spellchecker.check()) == []
+        assert backend.checked_words == ["hola", "ax-xa"]
+
+    def test_python_backend(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("HUNSPELLCHECK_CACHE_DIR", str(tmp_path))
+        personal_dict = tmp_path / "personal.dic"
+        personal_dict.write_text("*calor\n")
+
+        filenames_contents = {
+            "foo.txt": "hola hoal\nHola calor hiul",
+            "bar.txt": "(hola) 1234 hola-hoal",
+        }
+        kwargs = {"include_line": True, "include_near_misses": True}
+        for personal_dicts in (None, str(personal_dict)):
+            expected_errors = list(
+                HunspellChecker(
+                    filenames_contents,
+                    "es_ES",
+                    personal_dicts=personal_dicts,
+                    backend="subprocess",
+                ).check(**kwargs)
+            )
+            spellchecker = HunspellChecker(
+                filenames_contents,
+                "es_ES",
+                personal_dicts=personal_dicts,
+                backend="python",
+            )
+            assert list(spellchecker.check(**kwargs)) == expected_errors
+        assert os.listdir(tmp_path / "indexes")
+
+
+@pytest.mark.parametrize(
+    ("filenames_contents", "n_shards", "expected_shards"),
+    (
+        ({"a": "foo"}, 4, [{"a": "foo"}]),
+        ({"a": "foo", "b": "bar"}, 1, [{"a": "foo", "b": "bar"}]),
+        ({"a": "foo", "b": "bar"}, 2, [{"a": "foo"}, {"b": "bar"}]),
+        (
+            {"a": "foo bar baz", "b": "b", "c": "c", "d": "d"},
+            2,
+            [{"a": "foo bar baz"}, {"b": "b", "c": "c", "d": "d"}],
+        ),
+        (
+            {"a": "a", "b": "b", "c": "c", "d": "d"},
+            3,
+            [{"a": "a", "b": "b"}, {"c": "c"}, {"d": "d"}],
+        ),
+    ),
+)
+def test_shard_filenames_contents(filenames_contents, n_shards, expected_shards):
+    assert shard_filenames_contents(filenames_contents, n_shards) == expected_shards
+
+
+@pytest.mark.parametrize(
+    "contents",
+    (
+        [],
+        [""],
+        ["foo"],
+        ["foo\n"],
+        ["foo\n\n", ""],
+        ["", "foo", "\n"],
+        ["foo\r", "\nbar\n\n", "baz", "\n\n"],
+    ),
+)
+def test_gen_quoted_contents_lines(contents):
+    expected_lines = quote_for_hunspell("\n".join(contents)).split("\n")
+    if not expected_lines[-1]:
+        expected_lines.pop()
+    assert list(gen_quoted_contents_lines(contents)) == expected_lines
+
+
+def test_parse_hunspell_output_from_file():
+    filenames_contents = {"foo.txt": "hola hoal\n", "bar.txt": "hiul iuyh"}
+    hunspell_stdout = (
+        "@(#) International Ispell Version 3.2.06 (but really Hunspell 1.7.0)\n"
+        "*\n"
+        "& hoal 2 6: hola, hora\n"
+        "\n"
+        "\n"
+        "& hiul 1 1: hui\n"
+        "# iuyh 6\n"
+        "\n"
+    )
+    expected_errors = list(
+        parse_hunspell_output(
+            filenames_contents,
+            types.SimpleNamespace(stdout=hunspell_stdout),
+            include_error_number=True,
+        )
+    )
+    assert expected_errors == [
+        {
+            "filename": "foo.txt",
+            "line_number": 1,
+            "word": "hoal",
+            "word_line_index": 5,
+            "error_number": 1,
+        },
+        {
+            "filename": "bar.txt",
+            "line_number": 1,
+            "word": "hiul",
+            "word_line_index": 0,
+            "error_number": 2,
+        },
+        {
+            "filename": "bar.txt",
+            "line_number": 1,
+            "word": "iuyh",
+            "word_line_index": 5,
+            "error_number": 3,
+        },
+    ]
+
+    assert (
+        list(
+            parse_hunspell_output(
+                filenames_contents,
+                types.SimpleNamespace(stdout=io.StringIO(hunspell_stdout)),
+                include_error_number=True,
+            )
+        )
+        == expected_errors
+    )
+
+
+def test_gen_unique_words():
+    contents = ["hola hoal\nhola, hoal.", "(hoal) hiul"]
+    assert list(gen_unique_words(contents)) == ["hola", "hoal", "hoal.", "hiul"]
+
+
+def test_parse_hunspell_words_output():
+    hunspell_stdout = (
+        "@(#) International Ispell Version 3.2.06 (but really Hunspell 1.7.0)\n"
+        "*\n"
+        "\n"
+        "& hoal 2 1: hola, hora\n"
+        "\n"
+        "*\n"
+        "& iuyh 1 6: huy\n"
+        "\n"
+        "# xqzv 1\n"
+        "\n"
+    )
+    assert parse_hunspell_words_output(
+        ["hola", "hoal", "hola-iuyh", "xqzv"],
+        types.SimpleNamespace(stdout=hunspell_stdout),
+    ) == {
+        "hoal": [("hoal", 0, ["hola", "hora"])],
+        "hola-iuyh": [("iuyh", 5, ["huy"])],
+        "xqzv": [("xqzv", 0, [])],
+    }
+
+
+@pytest.mark.parametrize(
+    ("hunspell_line", "expected_mispelling"),
+    (
+        ("*", None),
+        ("+ HOLA", None),
+        ("- ", None),
+        ("", None),
+        ("& hoal 2 6: hola, hora", ("hoal", 5, ["hola", "hora"])),
+        ("& hoal 2 6: hola, ho la\n", ("hoal", 5, ["hola", "ho la"])),
+        ("# xqzv 1", ("xqzv", 0, [])),
+        ("# xqzv 11\n", ("xqzv", 10, [])),
+    ),
+)
+def test_parse_hunspell_mispelling(hunspell_line, expected_mispelling):
+    assert parse_hunspell_mispelling(hunspell_line) == expected_mispelling
+
+
+def test_thread_safety(monkeypatch):
+    monkeypatch.setenv("LANG", "es_ES.UTF-8")
+    filenames_contents = {"foo.txt": "hola hoal\nhoal hiul", "bar.txt": "hola"}
+    expected_errors = list(HunspellChecker(filenames_contents, "es_ES").check())
+
+    def check(i):
+        assert get_hunspell_version()
+        assert list_available_dictionaries()
+        return list(
+            HunspellChecker(
+                filenames_contents,
+                "es_ES",
+                personal_dicts=[os.devnull, os.devnull] if i % 2 else None,
+            ).check()
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for errors in executor.map(check, range(32)):
+            assert errors == expected_errors
+    assert os.environ["LANG"] == "es_ES.UTF-8"
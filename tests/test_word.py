@@ -1,6 +1,6 @@
 import pytest
 
-from hunspellcheck.word import looks_like_a_word_creator
+from hunspellcheck.word import gen_word_candidates, looks_like_a_word_creator
 
 
 @pytest.mark.parametrize(
@@ -62,3 +62,19 @@ def test_looks_like_a_word_creator(
         words_can_contain_two_upper=words_can_contain_two_upper,
     )
     assert func(value) == expected_result
+
+
+@pytest.mark.parametrize(
+    ("line", "expected_candidates"),
+    (
+        ("", []),
+        ("   ", []),
+        ("hello", [("hello", 0)]),
+        ("  hello world ", [("hello", 2), ("world", 8)]),
+        ('(hello, "world")!', [("hello", 1), ("world", 9)]),
+        ("etc. e.g. don't x-y", [("etc.", 0), ("e.g.", 5), ("don't", 10), ("x-y", 16)]),
+        ("foo,bar ?! baz", [("foo,bar", 0), ("baz", 11)]),
+    ),
+)
+def test_gen_word_candidates(line, expected_candidates):
+    assert list(gen_word_candidates(line)) == expected_candidates